@@ -7,7 +7,7 @@ REST endpoints for notification history and management.
 from flask import Blueprint, jsonify, request
 import logging
 
-from lib.notification_service import get_notification_service
+from lib.notification_service import delivery_status_for, get_notification_service
 from lib.database import get_notification, list_notifications, get_notification_stats
 
 logger = logging.getLogger(__name__)
@@ -22,7 +22,7 @@ def list_all_notifications():
 
     Query params:
         simulation_id: Filter by simulation
-        status: Filter by delivery status (pending, sent, failed, skipped)
+        status: Filter by delivery status (pending, sent, failed, skipped, suppressed)
         type: Filter by notification type
         limit: Number of results (default: 100)
         offset: Pagination offset (default: 0)
@@ -145,7 +145,7 @@ def test_notification():
 
             notification = update_notification(
                 notification["id"],
-                delivery_status="sent" if result["success"] else "failed",
+                delivery_status=delivery_status_for(result),
                 telegram_message_id=result.get("message_id"),
                 error_message=result.get("error")
             )
@@ -9,7 +9,6 @@ Supports both live trading (Coinbase) and paper trading (ForwardTester).
 
 import os
 import csv
-import json
 import logging
 from pathlib import Path
 from datetime import datetime, timezone
@@ -25,6 +24,10 @@ from lib.performance_tracker import PerformanceTracker, PerformanceMetrics
 from lib.market_data import get_market_data, get_fear_greed_index, MarketData, MarketDataError
 
 
+# Quotes this recent are reused when several dashboard requests ask for the same symbol
+PRICE_MAX_AGE = 5.0  # seconds
+
+
 class DashboardDataService:
     """Service for aggregating dashboard data from various sources."""
 
@@ -335,7 +338,9 @@ class DashboardDataService:
                 if position:
                     # Get current price for unrealized P&L
                     try:
-                        current_price = self.coinbase.get_current_price(symbol_config.symbol)
+                        current_price = self.coinbase.get_current_price(
+                            symbol_config.symbol, max_age=PRICE_MAX_AGE
+                        )
                     except Exception:
                         current_price = 0
 
@@ -593,28 +598,28 @@ class DashboardDataService:
         if not ai_dir.exists():
             return []
 
-        interpretations = []
+        from lib.ai import load_responses
 
-        # Load all JSON files
-        for json_file in ai_dir.glob("*.json"):
-            try:
-                with open(json_file, 'r') as f:
-                    data = json.load(f)
+        interpretations = []
 
-                # Extract symbol from filename
-                symbol = json_file.stem.split("_")[-1] if "_" in json_file.stem else "UNKNOWN"
+        # Load every run's history (legacy .json and current .jsonl files)
+        run_names = {f.stem for f in ai_dir.glob("*.json")} | {f.stem for f in ai_dir.glob("*.jsonl")}
+        for run_name in sorted(run_names):
+            # Extract symbol from filename
+            symbol = run_name.split("_")[-1] if "_" in run_name else "UNKNOWN"
 
-                for timestamp, entry in data.items():
-                    if isinstance(entry, dict) and "interpretation" in entry:
+            try:
+                for entry in load_responses(run_name):
+                    if "interpretation" in entry:
                         interpretations.append({
                             "symbol": symbol,
-                            "timestamp": timestamp,
+                            "timestamp": entry.get("timestamp", ""),
                             "interpretation": entry.get("interpretation", "Unknown"),
                             "reasons": entry.get("reasons", ""),
                             "provider": entry.get("provider", "Unknown")
                         })
-            except (json.JSONDecodeError, IOError) as e:
-                logging.warning(f"Failed to read AI response file {json_file}: {e}")
+            except (ValueError, IOError) as e:
+                logging.warning(f"Failed to read AI responses for {run_name}: {e}")
 
         # Sort by timestamp descending and limit
         interpretations.sort(key=lambda x: x["timestamp"], reverse=True)
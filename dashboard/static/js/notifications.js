@@ -25,7 +25,8 @@ const STATUS_CLASSES = {
     'sent': 'status-sent',
     'failed': 'status-failed',
     'pending': 'status-pending',
-    'skipped': 'status-skipped'
+    'skipped': 'status-skipped',
+    'suppressed': 'status-suppressed'
 };
 
 // Initialize
@@ -193,6 +194,7 @@ function getStatusBgClass(status) {
         case 'failed': return 'bg-red-500';
         case 'pending': return 'bg-yellow-500';
         case 'skipped': return 'bg-gray-500';
+        case 'suppressed': return 'bg-gray-500';
         default: return 'bg-gray-500';
     }
 }
@@ -386,6 +388,8 @@ async function sendTestNotification() {
                 showSuccess('Test notification sent successfully');
             } else if (data.notification.delivery_status === 'skipped') {
                 showWarning('Telegram not configured - notification skipped');
+            } else if (data.notification.delivery_status === 'suppressed') {
+                showWarning('Identical message sent recently - notification suppressed');
             } else {
                 showError('Test notification failed: ' + (data.notification.error_message || 'Unknown error'));
             }
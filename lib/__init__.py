@@ -1,17 +1,55 @@
-from .bitunix import BitunixFutures, BitunixError
-from .coinbase_client import CoinbaseAdvanced, CoinbaseError
-from .forward_tester import ForwardTester
-from .discord_notifications import DiscordNotifier
-from .telegram_notifications import TelegramNotifier
-from .performance_tracker import PerformanceTracker, Trade, PerformanceMetrics, get_tracker
-from .market_data import (
-    MarketData, MarketDataError, get_market_data,
-    get_multiple_market_data, get_enhanced_market_context, format_market_context
-)
-from .config import (
-    TradingConfig, SymbolConfig, load_config, save_config,
-    get_default_config, get_enabled_symbols, validate_config, create_sample_config
-)
+"""
+Trading bot library.
+
+Exports are resolved lazily so that importing one helper (e.g. ``lib.config``)
+doesn't pull in every exchange client, pandas and the notification stack.
+"""
+
+import importlib
+
+# Public name -> submodule that defines it
+_EXPORTS = {
+    'ForwardTester': 'forward_tester',
+    'BitunixFutures': 'bitunix',
+    'BitunixError': 'bitunix',
+    'CoinbaseAdvanced': 'coinbase_client',
+    'CoinbaseError': 'coinbase_client',
+    'DiscordNotifier': 'discord_notifications',
+    'TelegramNotifier': 'telegram_notifications',
+    'PerformanceTracker': 'performance_tracker',
+    'Trade': 'performance_tracker',
+    'PerformanceMetrics': 'performance_tracker',
+    'get_tracker': 'performance_tracker',
+    'MarketData': 'market_data',
+    'MarketDataError': 'market_data',
+    'get_market_data': 'market_data',
+    'get_multiple_market_data': 'market_data',
+    'get_enhanced_market_context': 'market_data',
+    'format_market_context': 'market_data',
+    'TradingConfig': 'config',
+    'SymbolConfig': 'config',
+    'load_config': 'config',
+    'save_config': 'config',
+    'get_default_config': 'config',
+    'get_enabled_symbols': 'config',
+    'validate_config': 'config',
+    'create_sample_config': 'config',
+}
+
+
+def __getattr__(name):
+    if name in ('ai', 'custom_helpers'):
+        return importlib.import_module(f'.{name}', __name__)
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(f'.{_EXPORTS[name]}', __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     'ai',
@@ -6,13 +6,22 @@ from __future__ import annotations
 
 import json
 import logging
+import os
+import threading
 from abc import ABC, abstractmethod
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import Any, Literal
+from functools import lru_cache
+from typing import Any, Iterator, Literal
 import requests
+from requests.adapters import HTTPAdapter
 from pydantic import BaseModel, Field, ValidationError
 
+try:
+    import orjson  # Optional: much faster for reading long response histories
+except ImportError:
+    orjson = None
+
 
 # ===================== CONFIGURATION =====================
 
@@ -52,10 +61,12 @@ class AIOutlook(BaseModel):
 class AIProvider(ABC):
     """Abstract base class for AI providers."""
 
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, session: requests.Session | None = None):
         if not api_key:
             raise AIProviderError(f"{self.__class__.__name__} requires an API key")
         self.api_key = api_key
+        # Reusing a session keeps the connection to the provider alive between requests
+        self.http = session if session is not None else requests
 
     @abstractmethod
     def send_request(self, prompt: str, crypto_symbol: str) -> AIOutlook:
@@ -69,6 +80,63 @@ class AIProvider(ABC):
         pass
 
 
+# ===================== TOOL SCHEMAS =====================
+# Built once per symbol and shared between calls; request payloads never modify them.
+
+@lru_cache(maxsize=32)
+def _anthropic_tool(crypto_symbol: str) -> dict[str, Any]:
+    """Anthropic tool definition for a symbol's outlook."""
+    return {
+        "name": f"{crypto_symbol.lower()}_outlook",
+        "description": f"Return a structured {crypto_symbol} outlook for the next 24 hours.",
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "interpretation": {
+                    "type": "string",
+                    "enum": ["Bullish", "Bearish", "Neutral"],
+                    "description": "Market outlook direction"
+                },
+                "reasons": {
+                    "type": "string",
+                    "description": "Concise rationale citing the strongest factors."
+                }
+            },
+            "required": ["interpretation", "reasons"]
+        }
+    }
+
+
+@lru_cache(maxsize=32)
+def _function_tool(crypto_symbol: str, strict: bool = False) -> dict[str, Any]:
+    """OpenAI-compatible function tool definition for a symbol's outlook."""
+    tool = {
+        "type": "function",
+        "function": {
+            "name": f"{crypto_symbol.lower()}_outlook",
+            "description": f"Return a structured {crypto_symbol} outlook for the next 24 hours.",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "interpretation": {
+                        "type": "string",
+                        "enum": ["Bullish", "Bearish", "Neutral"]
+                    },
+                    "reasons": {
+                        "type": "string",
+                        "description": "Concise rationale citing the strongest factors."
+                    }
+                },
+                "required": ["interpretation", "reasons"],
+                "additionalProperties": False
+            }
+        }
+    }
+    if strict:
+        tool["strict"] = True
+    return tool
+
+
 # ===================== ANTHROPIC PROVIDER =====================
 
 class AnthropicProvider(AIProvider):
@@ -95,30 +163,12 @@ class AnthropicProvider(AIProvider):
             "model": self.MODEL,
             "max_tokens": MAX_TOKENS,
             "temperature": TEMPERATURE,
-            "tools": [{
-                "name": tool_name,
-                "description": f"Return a structured {crypto_symbol} outlook for the next 24 hours.",
-                "input_schema": {
-                    "type": "object",
-                    "properties": {
-                        "interpretation": {
-                            "type": "string",
-                            "enum": ["Bullish", "Bearish", "Neutral"],
-                            "description": "Market outlook direction"
-                        },
-                        "reasons": {
-                            "type": "string",
-                            "description": "Concise rationale citing the strongest factors."
-                        }
-                    },
-                    "required": ["interpretation", "reasons"]
-                }
-            }],
+            "tools": [_anthropic_tool(crypto_symbol)],
             "tool_choice": {"type": "tool", "name": tool_name},
             "messages": [{"role": "user", "content": prompt}]
         }
 
-        r = requests.post(self.URL, headers=headers, json=payload, timeout=TIMEOUT)
+        r = self.http.post(self.URL, headers=headers, json=payload, timeout=TIMEOUT)
 
         try:
             r.raise_for_status()
@@ -182,32 +232,11 @@ class XAIProvider(AIProvider):
             "temperature": TEMPERATURE,
             "max_tokens": MAX_TOKENS,
             "messages": [{"role": "user", "content": prompt}],
-            "tools": [{
-                "type": "function",
-                "function": {
-                    "name": tool_name,
-                    "description": f"Return a structured {crypto_symbol} outlook for the next 24 hours.",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "interpretation": {
-                                "type": "string",
-                                "enum": ["Bullish", "Bearish", "Neutral"]
-                            },
-                            "reasons": {
-                                "type": "string",
-                                "description": "Concise rationale citing the strongest factors."
-                            }
-                        },
-                        "required": ["interpretation", "reasons"],
-                        "additionalProperties": False
-                    }
-                }
-            }],
+            "tools": [_function_tool(crypto_symbol)],
             "tool_choice": {"type": "function", "function": {"name": tool_name}}
         }
 
-        r = requests.post(self.URL, headers=headers, json=payload, timeout=TIMEOUT)
+        r = self.http.post(self.URL, headers=headers, json=payload, timeout=TIMEOUT)
 
         try:
             r.raise_for_status()
@@ -266,33 +295,11 @@ class DeepSeekProvider(AIProvider):
             "temperature": TEMPERATURE,
             "max_tokens": MAX_TOKENS,
             "messages": [{"role": "user", "content": prompt}],
-            "tools": [{
-                "type": "function",
-                "strict": True,
-                "function": {
-                    "name": tool_name,
-                    "description": f"Return a structured {crypto_symbol} outlook for the next 24 hours.",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "interpretation": {
-                                "type": "string",
-                                "enum": ["Bullish", "Bearish", "Neutral"]
-                            },
-                            "reasons": {
-                                "type": "string",
-                                "description": "Concise rationale citing the strongest factors."
-                            }
-                        },
-                        "required": ["interpretation", "reasons"],
-                        "additionalProperties": False
-                    }
-                }
-            }],
+            "tools": [_function_tool(crypto_symbol, strict=True)],
             "tool_choice": "auto"
         }
 
-        r = requests.post(self.URL, headers=headers, json=payload, timeout=TIMEOUT)
+        r = self.http.post(self.URL, headers=headers, json=payload, timeout=TIMEOUT)
 
         try:
             r.raise_for_status()
@@ -335,14 +342,86 @@ PROVIDERS = {
     "deepseek": DeepSeekProvider,
 }
 
+# Environment variables holding each provider's API key, in lookup order
+API_KEY_ENV_VARS = {
+    "anthropic": ("ANTHROPIC_API_KEY",),
+    "xai": ("XAI_API_KEY",),
+    "grok": ("XAI_API_KEY",),  # Alias for xai
+    "deepseek": ("DEEPSEEK_API_KEY", "LLM_API_KEY"),  # LLM_API_KEY for backward compat
+}
 
-def get_provider(provider_name: str, api_key: str) -> AIProvider:
+
+def get_api_key(provider_name: str) -> str | None:
+    """Return the API key for a provider from the environment, or None if unset."""
+    for env_var in API_KEY_ENV_VARS.get(provider_name.lower(), ()):
+        api_key = os.environ.get(env_var)
+        if api_key:
+            return api_key
+    return None
+
+
+class ThreadLocalSession:
+    """
+    Per-thread requests.Session objects sharing one connection pool.
+
+    requests.Session isn't documented as thread-safe (cookies and other state
+    are shared between callers), but its adapter's connection pool is, so each
+    thread gets its own Session mounted on a common HTTPAdapter.
+    """
+
+    def __init__(self, adapter: HTTPAdapter):
+        self._adapter = adapter
+        self._local = threading.local()
+        self._sessions: list[requests.Session] = []
+        self._lock = threading.Lock()
+
+    def _session(self) -> requests.Session:
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.mount("https://", self._adapter)
+            self._local.session = session
+            with self._lock:
+                self._sessions.append(session)
+        return session
+
+    def get_adapter(self, url: str) -> requests.adapters.BaseAdapter:
+        return self._session().get_adapter(url)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self._session().get(url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self._session().post(url, **kwargs)
+
+    def close(self) -> None:
+        """Close every thread's session and the shared connection pool."""
+        with self._lock:
+            sessions, self._sessions = self._sessions, []
+        for session in sessions:
+            session.close()
+        self._adapter.close()
+
+
+def create_session(pool_size: int = 10) -> ThreadLocalSession:
+    """
+    Create a keep-alive session for provider calls, safe to share between threads.
+
+    pool_size should be at least the number of requests sent concurrently
+    (e.g. one per symbol analysed in parallel); beyond it, connections are
+    closed after use instead of being kept for the next call.
+    """
+    return ThreadLocalSession(HTTPAdapter(pool_maxsize=pool_size))
+
+
+def get_provider(provider_name: str, api_key: str, session: requests.Session | None = None) -> AIProvider:
     """
     Factory function to create AI provider instance.
 
     Args:
         provider_name: One of "anthropic", "xai", "grok", "deepseek"
         api_key: API key for the provider
+        session: Optional requests session to send API calls through
 
     Returns:
         AIProvider instance
@@ -356,7 +435,7 @@ def get_provider(provider_name: str, api_key: str) -> AIProvider:
         valid = ", ".join(PROVIDERS.keys())
         raise AIProviderError(f"Unknown provider '{provider_name}'. Valid: {valid}")
 
-    return PROVIDERS[provider_name](api_key)
+    return PROVIDERS[provider_name](api_key, session)
 
 
 # ===================== MAIN API (BACKWARD COMPATIBLE) =====================
@@ -365,19 +444,20 @@ def get_provider(provider_name: str, api_key: str) -> AIProvider:
 _provider: AIProvider | None = None
 
 
-def init_provider(provider_name: str, api_key: str) -> AIProvider:
+def init_provider(provider_name: str, api_key: str, session: requests.Session | None = None) -> AIProvider:
     """
     Initialize the AI provider for the session.
 
     Args:
         provider_name: One of "anthropic", "xai", "grok", "deepseek"
         api_key: API key for the provider
+        session: Optional requests.Session to reuse connections across requests
 
     Returns:
         Configured AIProvider instance
     """
     global _provider
-    _provider = get_provider(provider_name, api_key)
+    _provider = get_provider(provider_name, api_key, session)
     logging.info(f"AI provider initialized: {_provider.name}")
     return _provider
 
@@ -418,42 +498,62 @@ def send_request(prompt: str, crypto_symbol: str, api_key: str = None,
 
 # ===================== UTILITY FUNCTIONS =====================
 
+RESPONSES_DIR = Path("ai_responses")
+
+
 def save_response(outlook: AIOutlook, run_name: str) -> None:
     """
-    Save AI response to JSON file organized by run name.
+    Append AI response to a JSON Lines file organized by run name.
 
     Args:
         outlook: The AI outlook response to save
         run_name: Name of the run (used as filename)
     """
     try:
-        responses_dir = Path("ai_responses")
-        responses_dir.mkdir(exist_ok=True)
-
-        file_path = responses_dir / f"{run_name}.json"
-
-        if file_path.exists():
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-        else:
-            data = {}
+        RESPONSES_DIR.mkdir(exist_ok=True)
 
-        timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+        entry = {"timestamp": datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")}
+        entry.update(outlook.model_dump())
 
         # Include provider info if available
-        entry = outlook.model_dump()
         if _provider:
             entry["provider"] = _provider.name
 
-        data[timestamp] = entry
-
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        # One line per response, so saving doesn't rewrite the history
+        with open(RESPONSES_DIR / f"{run_name}.jsonl", "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
 
     except Exception as e:
         logging.error(f"Failed to save AI response: {e}")
 
 
+def load_responses(run_name: str) -> Iterator[dict[str, Any]]:
+    """
+    Yield saved AI responses for a run, oldest first.
+
+    Reads the legacy {run_name}.json history (a dict keyed by timestamp)
+    before the {run_name}.jsonl file written by save_response. Each entry
+    has a "timestamp" key alongside the outlook fields.
+    """
+    loads = orjson.loads if orjson else json.loads
+
+    legacy_path = RESPONSES_DIR / f"{run_name}.json"
+    if legacy_path.exists():
+        for timestamp, entry in loads(legacy_path.read_bytes()).items():
+            if isinstance(entry, dict):
+                yield {"timestamp": timestamp, **entry}
+
+    path = RESPONSES_DIR / f"{run_name}.jsonl"
+    if path.exists():
+        with open(path, "rb") as f:
+            for line in f:
+                try:
+                    yield loads(line)
+                except ValueError:
+                    # e.g. a line cut short by a crash mid-write
+                    logging.warning(f"Skipping unreadable line in {path}")
+
+
 def list_providers() -> list[str]:
     """Return list of available provider names."""
     return list(PROVIDERS.keys())
@@ -0,0 +1,59 @@
+"""
+On-disk cache of AI outlooks keyed by prompt.
+
+Scheduled runs often send byte-identical prompts (e.g. with market data
+disabled), so a recent answer can be reused instead of calling the provider
+again. Each entry is a small JSON file under .cache/ai/.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import time
+from pathlib import Path
+
+from .ai import AIOutlook
+
+CACHE_DIR = Path(".cache") / "ai"
+
+
+def make_key(*parts: str) -> str:
+    """
+    Build a cache key from the provider, model, symbol and prompt.
+
+    Runs of whitespace are collapsed first, so reflowing or re-indenting a
+    prompt template doesn't invalidate its cached answers.
+    """
+    normalized = (" ".join(part.split()) for part in parts)
+    return hashlib.sha256("\0".join(normalized).encode("utf-8")).hexdigest()
+
+
+def get(key: str) -> AIOutlook | None:
+    """Return the cached outlook for key, or None if missing or expired."""
+    path = CACHE_DIR / f"{key}.json"
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            entry = json.load(f)
+        if entry["expires_at"] <= time.time():
+            return None
+        return AIOutlook(**entry["outlook"])
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logging.warning(f"Ignoring unreadable AI cache entry {path}: {e}")
+        return None
+
+
+def set(key: str, outlook: AIOutlook, ttl: float) -> None:
+    """Cache outlook under key for ttl seconds."""
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        path = CACHE_DIR / f"{key}.json"
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"expires_at": time.time() + ttl, "outlook": outlook.model_dump()}, f)
+        os.replace(tmp_path, path)
+    except Exception as e:
+        logging.error(f"Failed to cache AI response: {e}")
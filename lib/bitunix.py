@@ -77,8 +77,9 @@ class BitunixAuth:
 
 
 class BitunixClient:
-    def __init__(self, auth: BitunixAuth):
+    def __init__(self, auth: BitunixAuth, session: requests.Session | None = None):
         self._auth = auth
+        self._http = session if session is not None else requests
 
     @staticmethod
     def _handle_response(response: requests.Response) -> Any:
@@ -108,7 +109,7 @@ class BitunixClient:
         headers = self._auth.get_headers(query_params=sorted_params)
 
         try:
-            response = requests.get(
+            response = self._http.get(
                 url=url,
                 headers=headers,
                 params=query_params,
@@ -124,7 +125,7 @@ class BitunixClient:
         headers = self._auth.get_headers(body=data_str)
 
         try:
-            response = requests.post(
+            response = self._http.post(
                 url=url,
                 headers=headers,
                 data=data_str,
@@ -136,9 +137,9 @@ class BitunixClient:
 
 
 class BitunixFutures:
-    def __init__(self, api_key: str, secret_key: str):
+    def __init__(self, api_key: str, secret_key: str, session: requests.Session | None = None):
         self._auth = BitunixAuth(api_key, secret_key)
-        self._client = BitunixClient(self._auth)
+        self._client = BitunixClient(self._auth, session)
         self._trading_pairs_info: pd.DataFrame | None = None
         self._current_symbol_info: dict[str, Any] | None = None
 
@@ -334,6 +335,18 @@ class BitunixFutures:
 
         return Position(**raw_data[0]) if raw_data else None
 
+    def get_all_pending_positions(self) -> dict[str, Position]:
+        """Fetch open positions for every symbol in one request, keyed by symbol."""
+        raw_data = self._client.get("/position/get_pending_positions")
+
+        positions = {}
+        for raw in raw_data or []:
+            position = Position(**raw)
+            if position.symbol in positions:
+                raise ValueError("Multiple positions found. Currently only one-way mode is supported")
+            positions[position.symbol] = position
+        return positions
+
     def flash_close_position(self, position_id: str) -> dict[str, str]:
         if not position_id:
             raise ValueError("Position ID is required")
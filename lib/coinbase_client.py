@@ -8,6 +8,7 @@ SDK: https://github.com/coinbase/coinbase-advanced-py
 from __future__ import annotations
 
 import logging
+import time
 import uuid
 from dataclasses import dataclass
 from typing import Any
@@ -98,6 +99,25 @@ class CoinbaseAdvanced:
 
         # Cache for account UUIDs
         self._account_cache: dict[str, str] = {}
+        # Last quote per product: (monotonic time fetched, price)
+        self._price_cache: dict[str, tuple[float, float]] = {}
+
+    # Clients created by shared(), keyed by credentials
+    _shared_clients: dict[tuple[str, str], CoinbaseAdvanced] = {}
+
+    @classmethod
+    def shared(cls, api_key: str, api_secret: str) -> CoinbaseAdvanced:
+        """
+        Return a client for these credentials, reusing one created earlier in the process.
+
+        Long-running loops (e.g. runner_multi --every) keep the SDK's
+        keep-alive session and the account UUID cache between runs.
+        """
+        key = (api_key, api_secret)
+        client = cls._shared_clients.get(key)
+        if client is None:
+            client = cls._shared_clients[key] = cls(api_key, api_secret)
+        return client
 
     def _get_account_uuid(self, currency: str) -> str | None:
         """Get account UUID for a currency."""
@@ -200,27 +220,35 @@ class CoinbaseAdvanced:
             logging.error(f"Failed to get position for {symbol}: {e}")
             raise CoinbaseError(f"Failed to get position: {e}")
 
-    def get_current_price(self, symbol: str) -> float:
+    def get_current_price(self, symbol: str, max_age: float = 0) -> float:
         """
         Get current market price for symbol.
 
         Args:
             symbol: Trading pair (e.g., "BTCUSDT" or "BTC-USD")
+            max_age: Reuse a quote fetched within this many seconds (0 always fetches)
 
         Returns:
             Current price as float
         """
         cb_symbol = to_coinbase_symbol(symbol)
 
+        if max_age > 0:
+            cached = self._price_cache.get(cb_symbol)
+            if cached and time.monotonic() - cached[0] < max_age:
+                return cached[1]
+
         try:
             product = self.client.get_product(product_id=cb_symbol)
             # SDK returns object with attributes, not dict
             if hasattr(product, 'price'):
-                return float(product.price)
+                price = float(product.price)
             elif isinstance(product, dict):
-                return float(product.get("price", 0))
+                price = float(product.get("price", 0))
             else:
                 raise CoinbaseError(f"Unexpected product response type: {type(product)}")
+            self._price_cache[cb_symbol] = (time.monotonic(), price)
+            return price
         except Exception as e:
             logging.error(f"Failed to get price for {symbol}: {e}")
             raise CoinbaseError(f"Failed to get price: {e}")
@@ -22,6 +22,10 @@ from pydantic import BaseModel, Field, field_validator
 CONFIG_DIR = "configs"
 DEFAULT_CONFIG_FILE = "config.json"
 
+VALID_AI_PROVIDERS = ['anthropic', 'xai', 'grok', 'deepseek']
+VALID_EXCHANGE_PROVIDERS = ['coinbase', 'bitunix']
+VALID_MARGIN_MODES = ('ISOLATION', 'CROSS')
+
 
 class SimulationConfig(BaseModel):
     """Configuration for a trading simulation."""
@@ -55,14 +59,20 @@ class SimulationConfig(BaseModel):
 
     # Execution settings
     check_interval_seconds: int = Field(default=300, ge=60, le=3600, description="Interval between market checks")
+    signal_ttl_seconds: int = Field(
+        default=0,
+        ge=0,
+        le=86400,
+        description="Reuse the last AI signal for this long while it agrees with the open position (0 = ask every cycle)"
+    )
 
     @field_validator('ai_provider')
     @classmethod
     def validate_ai_provider(cls, v):
-        valid = ['anthropic', 'xai', 'grok', 'deepseek']
-        if v.lower() not in valid:
-            raise ValueError(f'ai_provider must be one of: {valid}')
-        return v.lower()
+        v = v.lower()
+        if v not in VALID_AI_PROVIDERS:
+            raise ValueError(f'ai_provider must be one of: {VALID_AI_PROVIDERS}')
+        return v
 
 
 class SymbolConfig(BaseModel):
@@ -84,9 +94,10 @@ class SymbolConfig(BaseModel):
     @field_validator('margin_mode')
     @classmethod
     def validate_margin_mode(cls, v):
-        if v.upper() not in ('ISOLATION', 'CROSS'):
+        v = v.upper()
+        if v not in VALID_MARGIN_MODES:
             raise ValueError('margin_mode must be ISOLATION or CROSS')
-        return v.upper()
+        return v
 
 
 class TradingConfig(BaseModel):
@@ -103,6 +114,7 @@ class TradingConfig(BaseModel):
     # AI settings
     ai_provider: str = Field(default="anthropic", description="AI provider: anthropic, xai, grok, deepseek")
     include_market_data: bool = Field(default=True, description="Include real-time market data in AI prompts")
+    ai_cache_ttl: int = Field(default=600, ge=0, description="Seconds to reuse the AI response to an identical prompt (0 disables)")
 
     # Exchange settings
     exchange_provider: str = Field(default="coinbase", description="Exchange: coinbase or bitunix")
@@ -121,18 +133,18 @@ class TradingConfig(BaseModel):
     @field_validator('ai_provider')
     @classmethod
     def validate_ai_provider(cls, v):
-        valid = ['anthropic', 'xai', 'grok', 'deepseek']
-        if v.lower() not in valid:
-            raise ValueError(f'ai_provider must be one of: {valid}')
-        return v.lower()
+        v = v.lower()
+        if v not in VALID_AI_PROVIDERS:
+            raise ValueError(f'ai_provider must be one of: {VALID_AI_PROVIDERS}')
+        return v
 
     @field_validator('exchange_provider')
     @classmethod
     def validate_exchange_provider(cls, v):
-        valid = ['coinbase', 'bitunix']
-        if v.lower() not in valid:
-            raise ValueError(f'exchange_provider must be one of: {valid}')
-        return v.lower()
+        v = v.lower()
+        if v not in VALID_EXCHANGE_PROVIDERS:
+            raise ValueError(f'exchange_provider must be one of: {VALID_EXCHANGE_PROVIDERS}')
+        return v
 
 
 def get_default_symbols() -> List[SymbolConfig]:
@@ -164,9 +176,25 @@ def save_config(config: TradingConfig, filename: str = DEFAULT_CONFIG_FILE) -> s
     """Save configuration to a JSON file."""
     ensure_config_dir()
     filepath = Path(CONFIG_DIR) / filename
-
-    with open(filepath, 'w') as f:
-        json.dump(config.model_dump(), f, indent=2)
+    data = json.dumps(config.model_dump(), indent=2)
+
+    # Restart loops re-save the same config; leave an identical file untouched
+    try:
+        if filepath.read_text() == data:
+            logging.debug(f"Configuration unchanged, not rewriting {filepath}")
+            return str(filepath)
+    except OSError:
+        pass
+
+    # Write to a temp file and swap it in so a crash can't leave a partial config
+    tmp_path = filepath.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, 'w') as f:
+            f.write(data)
+        os.replace(tmp_path, filepath)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
     logging.info(f"Configuration saved to {filepath}")
     return str(filepath)
@@ -238,6 +266,7 @@ def create_sample_config() -> str:
         "ai_provider": "anthropic",
         "exchange_provider": "coinbase",
         "include_market_data": True,
+        "ai_cache_ttl": 600,
         "discord_enabled": False,
         "discord_include_reasoning": False,
         "max_positions": 5,
@@ -302,19 +331,30 @@ def validate_config(config: TradingConfig) -> List[str]:
     if not enabled:
         issues.append("No trading symbols are enabled")
 
-    # Check position sizes
+    # Check each enabled symbol's settings in one pass
+    is_spot = config.exchange_provider == "coinbase"
     for symbol in enabled:
+        # Position size
         if isinstance(symbol.position_size, str):
             if not symbol.position_size.endswith('%'):
                 issues.append(f"{symbol.symbol}: Invalid position_size format (use number or 'X%')")
+            else:
+                try:
+                    percent = float(symbol.position_size[:-1])
+                except ValueError:
+                    percent = None
+                if percent is None or not 0 < percent <= 100:
+                    issues.append(f"{symbol.symbol}: position_size percentage must be between 0 and 100")
         elif symbol.position_size <= 0:
             issues.append(f"{symbol.symbol}: position_size must be positive")
 
-    # Check leverage for spot exchanges
-    if config.exchange_provider == "coinbase":
-        for symbol in enabled:
-            if symbol.leverage > 1:
-                issues.append(f"{symbol.symbol}: Coinbase spot doesn't support leverage > 1")
+        # Stop loss
+        if symbol.stop_loss_percent is not None and not 0 < symbol.stop_loss_percent < 100:
+            issues.append(f"{symbol.symbol}: stop_loss_percent must be between 0 and 100")
+
+        # Leverage on spot exchanges
+        if is_spot and symbol.leverage > 1:
+            issues.append(f"{symbol.symbol}: Coinbase spot doesn't support leverage > 1")
 
     # Check max positions
     if config.max_positions < len(enabled):
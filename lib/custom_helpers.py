@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+from logging.handlers import RotatingFileHandler
 from pathlib import Path
 from datetime import datetime, timezone
 
@@ -11,7 +12,17 @@ def get_timestamp() -> str:
 
 
 def configure_logger(run_name: str) -> None:
-    """Configure logging to file in logs/ directory."""
+    """
+    Configure logging to a rotating file in logs/ directory.
+
+    The file is only opened once the first record is written.
+
+    Does nothing if logging is already configured, as logging.basicConfig()
+    would ignore the new handlers anyway (and leave the log file open).
+    """
+    if logging.getLogger().handlers:
+        return
+
     logs_dir = Path("logs")
     logs_dir.mkdir(exist_ok=True)
     log_file = logs_dir / f"{run_name}.log"
@@ -20,7 +31,8 @@ def configure_logger(run_name: str) -> None:
         level=logging.INFO,
         format='%(asctime)s - %(levelname)s - %(message)s',
         handlers=[
-            logging.FileHandler(log_file, encoding='utf-8'),
+            RotatingFileHandler(log_file, maxBytes=10 * 1024 * 1024, backupCount=5,
+                                encoding='utf-8', delay=True),
             logging.StreamHandler()
         ]
     )
@@ -6,11 +6,13 @@ Manages simulations and notification history storage.
 """
 
 import logging
+import os
 import sqlite3
+import threading
 from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Generator, List, Optional
+from typing import Any, Dict, Generator, List, Optional, Sequence, Tuple, Union
 import json
 import uuid
 
@@ -18,6 +20,24 @@ import uuid
 DATABASE_DIR = Path("data")
 DATABASE_FILE = DATABASE_DIR / "trading_bot.db"
 
+# Idle connections kept open per (process, database path), so their page and
+# statement caches survive between calls. SQLite connections must not be used
+# across fork(), so a forked child (e.g. a simulation worker) never picks up
+# the ones it inherited from its parent.
+POOL_SIZE = 4
+_pool: Dict[Tuple[int, str], List[sqlite3.Connection]] = {}
+_pool_lock = threading.Lock()
+
+
+def _reset_pool_lock_in_child() -> None:
+    """Give a forked child its own pool lock, in case the parent's was held."""
+    global _pool_lock
+    _pool_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_pool_lock_in_child)
+
 logger = logging.getLogger(__name__)
 
 
@@ -27,30 +47,97 @@ def get_database_path() -> Path:
     return DATABASE_FILE
 
 
-@contextmanager
-def get_connection() -> Generator[sqlite3.Connection, None, None]:
-    """
-    Context manager for database connections.
-
-    Uses WAL mode for better concurrent access and ACID compliance.
-    """
-    db_path = get_database_path()
-    conn = sqlite3.connect(str(db_path), timeout=30.0)
+def _open_connection(db_path: str) -> sqlite3.Connection:
+    """Open and configure a new connection to db_path."""
+    # "file:" URIs allow shared in-memory databases (used by the test suite).
+    # Pooled connections may be checked out by another thread later; each is
+    # only ever used by one caller at a time.
+    conn = sqlite3.connect(
+        db_path, timeout=30.0, uri=db_path.startswith("file:"), check_same_thread=False
+    )
     conn.row_factory = sqlite3.Row
 
     # Enable WAL mode for better concurrency
     conn.execute("PRAGMA journal_mode=WAL")
+    # In WAL mode NORMAL only syncs at checkpoints, not on every commit
+    conn.execute("PRAGMA synchronous=NORMAL")
     conn.execute("PRAGMA foreign_keys=ON")
     conn.execute("PRAGMA busy_timeout=30000")
+    return conn
+
+
+def _release_connection(db_path: str, conn: sqlite3.Connection) -> bool:
+    """Return conn to the pool; False if the pool for db_path is full."""
+    with _pool_lock:
+        idle = _pool.setdefault((os.getpid(), db_path), [])
+        if len(idle) >= POOL_SIZE:
+            return False
+        idle.append(conn)
+        return True
+
+
+def close_pool() -> None:
+    """Close this process's idle pooled connections, e.g. before removing the database."""
+    pid = os.getpid()
+    with _pool_lock:
+        keys = [key for key in _pool if key[0] == pid]
+        idle = [conn for key in keys for conn in _pool.pop(key)]
+    for conn in idle:
+        conn.close()
+
+
+@contextmanager
+def get_connection() -> Generator[sqlite3.Connection, None, None]:
+    """
+    Context manager for database connections.
 
+    Uses WAL mode for better concurrent access and ACID compliance.
+    Connections are reused from a small pool; one that saw an error is
+    closed instead of being returned.
+    """
+    db_path = str(get_database_path())
+    with _pool_lock:
+        idle = _pool.get((os.getpid(), db_path))
+        conn = idle.pop() if idle else None
+    if conn is None:
+        conn = _open_connection(db_path)
+
+    reusable = False
     try:
         yield conn
         conn.commit()
+        reusable = True
     except Exception:
         conn.rollback()
         raise
     finally:
-        conn.close()
+        if not (reusable and _release_connection(db_path, conn)):
+            conn.close()
+
+
+@contextmanager
+def batched_writes() -> Generator[sqlite3.Connection, None, None]:
+    """
+    Group several writes into a single transaction.
+
+    Pass the yielded connection as ``conn=`` to the CRUD helpers; everything
+    is committed together when the block exits, or rolled back on error.
+    """
+    with get_connection() as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        yield conn
+
+
+@contextmanager
+def _use_connection(
+    conn: Optional[sqlite3.Connection]
+) -> Generator[sqlite3.Connection, None, None]:
+    """Yield the caller's connection, or open (and commit) a new one."""
+    if conn is not None:
+        yield conn
+    else:
+        with get_connection() as new_conn:
+            yield new_conn
 
 
 def init_database() -> None:
@@ -127,9 +214,20 @@ def init_database() -> None:
             ON notifications(delivery_status)
         """)
         cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_simulation_trades_simulation
-            ON simulation_trades(simulation_id)
+            CREATE INDEX IF NOT EXISTS idx_notifications_type
+            ON notifications(type)
+        """)
+        # Newest-first listings walk these instead of sorting every row
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_notifications_created
+            ON notifications(created_at)
         """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_simulation_trades_simulation_created
+            ON simulation_trades(simulation_id, created_at)
+        """)
+        # Superseded by the (simulation_id, created_at) index above
+        cursor.execute("DROP INDEX IF EXISTS idx_simulation_trades_simulation")
 
         logger.info(f"Database initialized at {get_database_path()}")
 
@@ -169,12 +267,15 @@ def create_simulation(name: str, config: Dict[str, Any]) -> Dict[str, Any]:
             VALUES (?, ?, ?, 'pending', ?, ?)
         """, (sim_id, name, json.dumps(config), now, now))
 
-    return get_simulation(sim_id)
+        return get_simulation(sim_id, conn=conn)
 
 
-def get_simulation(sim_id: str) -> Optional[Dict[str, Any]]:
+def get_simulation(
+    sim_id: str,
+    conn: Optional[sqlite3.Connection] = None
+) -> Optional[Dict[str, Any]]:
     """Get a simulation by ID."""
-    with get_connection() as conn:
+    with _use_connection(conn) as conn:
         cursor = conn.cursor()
         cursor.execute("SELECT * FROM simulations WHERE id = ?", (sim_id,))
         row = cursor.fetchone()
@@ -184,37 +285,65 @@ def get_simulation(sim_id: str) -> Optional[Dict[str, Any]]:
         return None
 
 
-def list_simulations(status: Optional[str] = None) -> List[Dict[str, Any]]:
+def list_simulations(
+    status: Optional[Union[str, Sequence[str]]] = None
+) -> List[Dict[str, Any]]:
     """
     List all simulations, optionally filtered by status.
 
     Args:
-        status: Optional status filter (pending, running, paused, stopped, error)
+        status: Optional status filter (pending, running, paused, stopped, error),
+            or a sequence of statuses to match any of
     """
     with get_connection() as conn:
         cursor = conn.cursor()
 
-        if status:
+        if isinstance(status, str):
             cursor.execute(
                 "SELECT * FROM simulations WHERE status = ? ORDER BY created_at DESC",
                 (status,)
             )
+        elif status:
+            placeholders = ", ".join("?" * len(status))
+            cursor.execute(
+                f"SELECT * FROM simulations WHERE status IN ({placeholders}) ORDER BY created_at DESC",
+                tuple(status)
+            )
         else:
             cursor.execute("SELECT * FROM simulations ORDER BY created_at DESC")
 
         return [_row_to_simulation(row) for row in cursor.fetchall()]
 
 
-def update_simulation(
-    sim_id: str,
+def count_simulations(statuses: Sequence[str]) -> int:
+    """
+    Count simulations whose status is any of the given statuses.
+
+    Args:
+        statuses: Statuses to count (e.g. ("pending", "running", "paused"))
+    """
+    if not statuses:
+        return 0
+
+    placeholders = ", ".join("?" * len(statuses))
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(
+            f"SELECT COUNT(*) FROM simulations WHERE status IN ({placeholders})",
+            tuple(statuses)
+        )
+        return cursor.fetchone()[0]
+
+
+def _simulation_update_columns(
     status: Optional[str] = None,
     pid: Optional[int] = None,
     error_message: Optional[str] = None,
     config: Optional[Dict[str, Any]] = None
-) -> Optional[Dict[str, Any]]:
-    """Update a simulation record."""
+) -> Tuple[List[str], List[Any]]:
+    """Build the SET clauses and parameters for a simulation update."""
     updates = ["updated_at = ?"]
-    params = [now_utc()]
+    params: List[Any] = [now_utc()]
 
     if status is not None:
         updates.append("status = ?")
@@ -243,16 +372,50 @@ def update_simulation(
         updates.append("config_json = ?")
         params.append(json.dumps(config))
 
+    return updates, params
+
+
+def update_simulation(
+    sim_id: str,
+    status: Optional[str] = None,
+    pid: Optional[int] = None,
+    error_message: Optional[str] = None,
+    config: Optional[Dict[str, Any]] = None,
+    conn: Optional[sqlite3.Connection] = None
+) -> Optional[Dict[str, Any]]:
+    """Update a simulation record."""
+    updates, params = _simulation_update_columns(status, pid, error_message, config)
     params.append(sim_id)
 
-    with get_connection() as conn:
+    with _use_connection(conn) as conn:
         cursor = conn.cursor()
         cursor.execute(
             f"UPDATE simulations SET {', '.join(updates)} WHERE id = ?",
             params
         )
 
-    return get_simulation(sim_id)
+        return get_simulation(sim_id, conn=conn)
+
+
+def update_simulations_bulk(updates: Dict[str, Dict[str, Any]]) -> None:
+    """
+    Apply updates to several simulations in a single transaction.
+
+    Args:
+        updates: Mapping of simulation ID to update_simulation keyword arguments
+    """
+    if not updates:
+        return
+
+    with batched_writes() as conn:
+        cursor = conn.cursor()
+        for sim_id, fields in updates.items():
+            columns, params = _simulation_update_columns(**fields)
+            params.append(sim_id)
+            cursor.execute(
+                f"UPDATE simulations SET {', '.join(columns)} WHERE id = ?",
+                params
+            )
 
 
 def delete_simulation(sim_id: str) -> bool:
@@ -294,13 +457,14 @@ def create_trade(
     exit_price: Optional[float] = None,
     pnl: Optional[float] = None,
     fees: Optional[float] = None,
-    interpretation: Optional[str] = None
+    interpretation: Optional[str] = None,
+    conn: Optional[sqlite3.Connection] = None
 ) -> Dict[str, Any]:
     """Create a new trade record for a simulation."""
     trade_id = generate_id()
     now = now_utc()
 
-    with get_connection() as conn:
+    with _use_connection(conn) as conn:
         cursor = conn.cursor()
         cursor.execute("""
             INSERT INTO simulation_trades
@@ -310,12 +474,15 @@ def create_trade(
         """, (trade_id, simulation_id, symbol, side, action, quantity,
               entry_price, exit_price, pnl, fees, interpretation, now))
 
-    return get_trade(trade_id)
+        return get_trade(trade_id, conn=conn)
 
 
-def get_trade(trade_id: str) -> Optional[Dict[str, Any]]:
+def get_trade(
+    trade_id: str,
+    conn: Optional[sqlite3.Connection] = None
+) -> Optional[Dict[str, Any]]:
     """Get a trade by ID."""
-    with get_connection() as conn:
+    with _use_connection(conn) as conn:
         cursor = conn.cursor()
         cursor.execute("SELECT * FROM simulation_trades WHERE id = ?", (trade_id,))
         row = cursor.fetchone()
@@ -347,7 +514,8 @@ def update_trade(
     trade_id: str,
     exit_price: Optional[float] = None,
     pnl: Optional[float] = None,
-    closed_at: Optional[str] = None
+    closed_at: Optional[str] = None,
+    conn: Optional[sqlite3.Connection] = None
 ) -> Optional[Dict[str, Any]]:
     """Update a trade record (typically when closing)."""
     updates = []
@@ -366,18 +534,18 @@ def update_trade(
         params.append(closed_at)
 
     if not updates:
-        return get_trade(trade_id)
+        return get_trade(trade_id, conn=conn)
 
     params.append(trade_id)
 
-    with get_connection() as conn:
+    with _use_connection(conn) as conn:
         cursor = conn.cursor()
         cursor.execute(
             f"UPDATE simulation_trades SET {', '.join(updates)} WHERE id = ?",
             params
         )
 
-    return get_trade(trade_id)
+        return get_trade(trade_id, conn=conn)
 
 
 # ============================================================================
@@ -388,7 +556,8 @@ def create_notification(
     notification_type: str,
     content: str,
     simulation_id: Optional[str] = None,
-    symbol: Optional[str] = None
+    symbol: Optional[str] = None,
+    conn: Optional[sqlite3.Connection] = None
 ) -> Dict[str, Any]:
     """
     Create a new notification record.
@@ -398,11 +567,12 @@ def create_notification(
         content: The notification content/message
         simulation_id: Optional associated simulation
         symbol: Optional trading symbol
+        conn: Optional connection to run in (e.g. from batched_writes)
     """
     notif_id = generate_id()
     now = now_utc()
 
-    with get_connection() as conn:
+    with _use_connection(conn) as conn:
         cursor = conn.cursor()
         cursor.execute("""
             INSERT INTO notifications
@@ -410,12 +580,15 @@ def create_notification(
             VALUES (?, ?, ?, ?, ?, 'pending', ?)
         """, (notif_id, simulation_id, notification_type, symbol, content, now))
 
-    return get_notification(notif_id)
+        return get_notification(notif_id, conn=conn)
 
 
-def get_notification(notif_id: str) -> Optional[Dict[str, Any]]:
+def get_notification(
+    notif_id: str,
+    conn: Optional[sqlite3.Connection] = None
+) -> Optional[Dict[str, Any]]:
     """Get a notification by ID."""
-    with get_connection() as conn:
+    with _use_connection(conn) as conn:
         cursor = conn.cursor()
         cursor.execute("SELECT * FROM notifications WHERE id = ?", (notif_id,))
         row = cursor.fetchone()
@@ -477,7 +650,8 @@ def update_notification(
     delivery_status: Optional[str] = None,
     telegram_message_id: Optional[str] = None,
     error_message: Optional[str] = None,
-    increment_retry: bool = False
+    increment_retry: bool = False,
+    conn: Optional[sqlite3.Connection] = None
 ) -> Optional[Dict[str, Any]]:
     """Update a notification record."""
     updates = []
@@ -503,18 +677,18 @@ def update_notification(
         updates.append("retry_count = retry_count + 1")
 
     if not updates:
-        return get_notification(notif_id)
+        return get_notification(notif_id, conn=conn)
 
     params.append(notif_id)
 
-    with get_connection() as conn:
+    with _use_connection(conn) as conn:
         cursor = conn.cursor()
         cursor.execute(
             f"UPDATE notifications SET {', '.join(updates)} WHERE id = ?",
             params
         )
 
-    return get_notification(notif_id)
+        return get_notification(notif_id, conn=conn)
 
 
 def get_notification_stats() -> Dict[str, Any]:
@@ -522,13 +696,18 @@ def get_notification_stats() -> Dict[str, Any]:
     with get_connection() as conn:
         cursor = conn.cursor()
 
-        # Total counts by status
+        # Total counts by status, plus how many of each are from the last 24h
         cursor.execute("""
-            SELECT delivery_status, COUNT(*) as count
+            SELECT delivery_status, COUNT(*) as count,
+                   SUM(CASE WHEN created_at > datetime('now', '-24 hours') THEN 1 ELSE 0 END) as recent
             FROM notifications
             GROUP BY delivery_status
         """)
-        status_counts = {row["delivery_status"]: row["count"] for row in cursor.fetchall()}
+        rows = cursor.fetchall()
+        status_counts = {row["delivery_status"]: row["count"] for row in rows}
+        recent_failures = next(
+            (row["recent"] for row in rows if row["delivery_status"] == "failed"), 0
+        )
 
         # Counts by type
         cursor.execute("""
@@ -538,15 +717,6 @@ def get_notification_stats() -> Dict[str, Any]:
         """)
         type_counts = {row["type"]: row["count"] for row in cursor.fetchall()}
 
-        # Recent failures
-        cursor.execute("""
-            SELECT COUNT(*) as count
-            FROM notifications
-            WHERE delivery_status = 'failed'
-            AND created_at > datetime('now', '-24 hours')
-        """)
-        recent_failures = cursor.fetchone()["count"]
-
         return {
             "by_status": status_counts,
             "by_type": type_counts,
@@ -1,21 +1,36 @@
 """Discord webhook notifications for trading bot."""
 
+from __future__ import annotations
+
 import logging
 from datetime import datetime, timezone
 import requests
 
 
+def _embed_chars(embed: dict) -> int:
+    """Count the embed text Discord checks against its per-message limit."""
+    chars = len(embed.get("title", "")) + len(embed.get("description", ""))
+    chars += len(embed.get("footer", {}).get("text", ""))
+    chars += len(embed.get("author", {}).get("name", ""))
+    for field in embed.get("fields", []):
+        chars += len(field["name"]) + len(field["value"])
+    return chars
+
+
 class DiscordNotifier:
     """Send trading notifications to Discord via webhook."""
 
     TIMEOUT = 10  # seconds
+    MAX_EMBEDS = 10  # Discord's limit per webhook message
+    MAX_EMBED_CHARS = 6000  # Discord's limit on text across all embeds in a message
 
-    def __init__(self, webhook_url: str):
+    def __init__(self, webhook_url: str, session: requests.Session | None = None):
         """
         Initialize Discord notifier.
 
         Args:
             webhook_url: Discord webhook URL
+            session: Optional requests.Session to reuse connections across messages
 
         Raises:
             ValueError: If webhook URL is invalid
@@ -27,6 +42,7 @@ class DiscordNotifier:
             raise ValueError("Discord webhook URL must start with https://discord.com/api/webhooks/")
 
         self.webhook_url = webhook_url
+        self.http = session if session is not None else requests
 
     def send_notification(
         self,
@@ -47,6 +63,89 @@ class DiscordNotifier:
         Returns:
             True if notification sent successfully, False otherwise
         """
+        payload = {"embeds": [self._signal_embed(run_name, interpretation, reason, include_reason)]}
+
+        try:
+            r = self.http.post(
+                self.webhook_url,
+                json=payload,
+                timeout=self.TIMEOUT
+            )
+            r.raise_for_status()
+            logging.info(f"Discord notification sent: {interpretation}")
+            return True
+
+        except requests.RequestException as e:
+            logging.error(f"Discord notification failed: {e}")
+            return False
+
+    def send_signals(
+        self,
+        run_name: str,
+        signals: list[tuple[str, str, str]],
+        include_reason: bool = True
+    ) -> bool:
+        """
+        Send several symbols' trading signals in as few webhook posts as possible.
+
+        Discord accepts up to MAX_EMBEDS embeds and MAX_EMBED_CHARS characters
+        of embed text per message, so a multi-symbol run costs one request (and
+        one slot of the webhook rate limit) per batch that fits those limits
+        instead of one per symbol.
+
+        Args:
+            run_name: Name of the trading run
+            signals: (symbol, interpretation, reason) for each symbol
+            include_reason: Whether to include reasoning in messages
+
+        Returns:
+            True if every message was sent successfully, False otherwise
+        """
+        embeds = [
+            self._signal_embed(run_name, interpretation, reason, include_reason, symbol=symbol)
+            for symbol, interpretation, reason in signals
+        ]
+
+        success = True
+        for batch in self._batch_embeds(embeds):
+            try:
+                r = self.http.post(
+                    self.webhook_url,
+                    json={"embeds": batch},
+                    timeout=self.TIMEOUT
+                )
+                r.raise_for_status()
+                logging.info(f"Discord notification sent: {len(batch)} signal(s)")
+            except requests.RequestException as e:
+                logging.error(f"Discord notification failed: {e}")
+                success = False
+        return success
+
+    def _batch_embeds(self, embeds: list[dict]) -> list[list[dict]]:
+        """Split embeds into batches within Discord's per-message limits."""
+        batches: list[list[dict]] = []
+        batch: list[dict] = []
+        batch_chars = 0
+        for embed in embeds:
+            chars = _embed_chars(embed)
+            if batch and (len(batch) >= self.MAX_EMBEDS or batch_chars + chars > self.MAX_EMBED_CHARS):
+                batches.append(batch)
+                batch, batch_chars = [], 0
+            batch.append(embed)
+            batch_chars += chars
+        if batch:
+            batches.append(batch)
+        return batches
+
+    def _signal_embed(
+        self,
+        run_name: str,
+        interpretation: str,
+        reason: str,
+        include_reason: bool,
+        symbol: str | None = None
+    ) -> dict:
+        """Build the embed for one trading signal."""
         # Choose emoji based on interpretation
         emoji_map = {
             "Bullish": "\u2705",   # Green checkmark
@@ -57,9 +156,12 @@ class DiscordNotifier:
 
         # Build embed
         timestamp = datetime.now(timezone.utc).isoformat()
+        title = f"{emoji} Trading Signal: {interpretation}"
+        if symbol:
+            title = f"{emoji} {symbol}: {interpretation}"
 
         embed = {
-            "title": f"{emoji} Trading Signal: {interpretation}",
+            "title": title,
             "color": self._get_color(interpretation),
             "fields": [
                 {"name": "Run", "value": run_name, "inline": True},
@@ -78,21 +180,7 @@ class DiscordNotifier:
                 "inline": False
             })
 
-        payload = {"embeds": [embed]}
-
-        try:
-            r = requests.post(
-                self.webhook_url,
-                json=payload,
-                timeout=self.TIMEOUT
-            )
-            r.raise_for_status()
-            logging.info(f"Discord notification sent: {interpretation}")
-            return True
-
-        except requests.RequestException as e:
-            logging.error(f"Discord notification failed: {e}")
-            return False
+        return embed
 
     def _get_color(self, interpretation: str) -> int:
         """Get embed color based on interpretation."""
@@ -130,7 +218,7 @@ class DiscordNotifier:
         payload = {"embeds": [embed]}
 
         try:
-            r = requests.post(
+            r = self.http.post(
                 self.webhook_url,
                 json=payload,
                 timeout=self.TIMEOUT
@@ -0,0 +1,54 @@
+"""
+On-disk record of margin mode and leverage last applied on the exchange.
+
+Scheduled runs set the same margin mode and leverage every time, and the
+exchange keeps them between runs, so the setter calls can be skipped while
+a recent record matches. Entries expire after a day in case the settings
+were changed by hand.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import time
+from pathlib import Path
+
+CACHE_FILE = Path(".cache") / "exchange_state.json"
+TTL_SECONDS = 24 * 60 * 60
+
+
+def _load() -> dict:
+    try:
+        with open(CACHE_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        logging.warning(f"Ignoring unreadable exchange state cache {CACHE_FILE}: {e}")
+        return {}
+
+
+def is_applied(key: str, margin_mode: str, leverage: int) -> bool:
+    """Return True if margin_mode and leverage were applied for key within the TTL."""
+    entry = _load().get(key)
+    return (
+        entry is not None
+        and entry.get("margin_mode") == margin_mode
+        and entry.get("leverage") == leverage
+        and time.time() - entry.get("ts", 0) < TTL_SECONDS
+    )
+
+
+def record(key: str, margin_mode: str, leverage: int) -> None:
+    """Remember that margin_mode and leverage were applied for key."""
+    try:
+        state = _load()
+        state[key] = {"margin_mode": margin_mode, "leverage": leverage, "ts": time.time()}
+        CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = CACHE_FILE.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(tmp_path, CACHE_FILE)
+    except Exception as e:
+        logging.error(f"Failed to record exchange state: {e}")
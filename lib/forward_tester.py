@@ -9,6 +9,8 @@ from typing import Any
 
 class MockPosition:
     """Minimal position object for forward testing compatibility."""
+    __slots__ = ("side", "symbol", "qty", "avgOpenPrice", "positionId")
+
     def __init__(self, side: str, symbol: str, qty: float, entry_price: float):
         self.side = side
         self.symbol = symbol
@@ -23,7 +25,7 @@ class ForwardTester:
     Maintains the same public API as BitunixFutures for compatibility.
     """
 
-    def __init__(self, config: dict[str, Any]):
+    def __init__(self, config: dict[str, Any], output_dir: str | Path = "forward_testing_results"):
         self.initial_capital = config["initial_capital"]
         self.fees = config["fees"]
         self.run_name = config.get("run_name", "default_run")
@@ -31,7 +33,7 @@ class ForwardTester:
         self.locked_capital = 0.0
         self._current_position: dict[str, Any] | None = None
 
-        self._csv_dir = Path("forward_testing_results")
+        self._csv_dir = Path(output_dir)
         self._csv_dir.mkdir(exist_ok=True)
         self._csv_file = self._csv_dir / f"{self.run_name}.csv"
 
@@ -129,10 +131,15 @@ class ForwardTester:
             order_type: str,
             interpretation: str = "",
             stop_loss_percent: float | None = None,  # Accepted but ignored in forward testing
+            mark_price: float | None = None,
             **kwargs
     ) -> dict[str, str]:
-        """Simulate placing an order. Stop-loss not tracked in forward testing."""
-        price = _fetch_market_price(symbol)
+        """
+        Simulate placing an order. Stop-loss not tracked in forward testing.
+
+        If mark_price is given it is used as the fill price instead of fetching a fresh quote.
+        """
+        price = mark_price if mark_price is not None else _fetch_market_price(symbol)
         action = self._determine_action(side, trade_side)
         trade_fees = _calculate_trade_fees(qty, price, self.fees)
 
@@ -195,8 +202,13 @@ class ForwardTester:
             "capital": round(self.current_capital, 2)
         })
 
-    def flash_close_position(self, position_id: str, interpretation: str = "") -> dict[str, str]:
-        """Simulate flash closing a position."""
+    def flash_close_position(
+            self,
+            position_id: str,
+            interpretation: str = "",
+            mark_price: float | None = None
+    ) -> dict[str, str]:
+        """Simulate flash closing a position, at mark_price if given."""
         if not self._current_position:
             logging.warning("No position to close")
             return {"orderId": "NONE"}
@@ -206,7 +218,7 @@ class ForwardTester:
         entry_price = self._current_position["entry_price"]
         side = self._current_position["side"]
 
-        price = _fetch_market_price(symbol)
+        price = mark_price if mark_price is not None else _fetch_market_price(symbol)
         pnl = _calculate_pnl(side, entry_price, price, qty)
         trade_fees = _calculate_trade_fees(qty, price, self.fees)
         position_value = qty * price
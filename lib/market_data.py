@@ -10,13 +10,21 @@ Provides price data for enhanced AI prompts.
 """
 
 import logging
+import re
+import sys
+import threading
+import time
 import requests
 from datetime import datetime, timezone
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Tuple
 from dataclasses import dataclass
 
 
-@dataclass
+# dataclass(slots=True) requires Python 3.10+; plain dataclasses on 3.9
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class MarketData:
     """Market data for a cryptocurrency."""
     symbol: str
@@ -58,17 +66,16 @@ COINGECKO_IDS = {
     "XLM": "stellar",
 }
 
+# Quote currency suffix of a trading pair, with or without a dash (BTCUSDT, BTC-USD)
+_QUOTE_SUFFIX = re.compile(r"-?(?:USDT|USDC|BUSD|USD)$")
+
 
 def normalize_symbol(symbol: str) -> str:
     """Extract base symbol from trading pair (e.g., BTCUSDT -> BTC)."""
-    symbol = symbol.upper()
-    for suffix in ["USDT", "USD", "USDC", "BUSD", "-USD", "-USDT"]:
-        if symbol.endswith(suffix):
-            return symbol[:-len(suffix)]
-    return symbol
+    return _QUOTE_SUFFIX.sub("", symbol.upper(), count=1)
 
 
-def get_coingecko_data(symbol: str) -> Optional[MarketData]:
+def get_coingecko_data(symbol: str, session: Optional[requests.Session] = None) -> Optional[MarketData]:
     """Fetch market data from CoinGecko (free, no API key)."""
     base_symbol = normalize_symbol(symbol)
     coin_id = COINGECKO_IDS.get(base_symbol)
@@ -87,7 +94,7 @@ def get_coingecko_data(symbol: str) -> Optional[MarketData]:
     }
 
     try:
-        response = requests.get(url, params=params, timeout=10)
+        response = (session or requests).get(url, params=params, timeout=10)
         response.raise_for_status()
         data = response.json()
 
@@ -109,7 +116,7 @@ def get_coingecko_data(symbol: str) -> Optional[MarketData]:
         return None
 
 
-def get_coinbase_price(symbol: str) -> Optional[MarketData]:
+def get_coinbase_price(symbol: str, session: Optional[requests.Session] = None) -> Optional[MarketData]:
     """Fetch market data from Coinbase public API."""
     base_symbol = normalize_symbol(symbol)
     product_id = f"{base_symbol}-USD"
@@ -117,7 +124,7 @@ def get_coinbase_price(symbol: str) -> Optional[MarketData]:
     url = f"https://api.exchange.coinbase.com/products/{product_id}/stats"
 
     try:
-        response = requests.get(url, timeout=10)
+        response = (session or requests).get(url, timeout=10)
         response.raise_for_status()
         data = response.json()
 
@@ -141,7 +148,7 @@ def get_coinbase_price(symbol: str) -> Optional[MarketData]:
         return None
 
 
-def get_binance_price(symbol: str) -> Optional[MarketData]:
+def get_binance_price(symbol: str, session: Optional[requests.Session] = None) -> Optional[MarketData]:
     """Fetch market data from Binance public API (fallback)."""
     base_symbol = normalize_symbol(symbol)
     binance_symbol = f"{base_symbol}USDT"
@@ -150,7 +157,7 @@ def get_binance_price(symbol: str) -> Optional[MarketData]:
     params = {"symbol": binance_symbol}
 
     try:
-        response = requests.get(url, params=params, timeout=10)
+        response = (session or requests).get(url, params=params, timeout=10)
         response.raise_for_status()
         data = response.json()
 
@@ -169,13 +176,41 @@ def get_binance_price(symbol: str) -> Optional[MarketData]:
         return None
 
 
-def get_market_data(symbol: str, source: str = "auto") -> MarketData:
+# Successful fetches are reused for this long so simulations and dashboard
+# requests polling the same symbol share one round-trip to the upstream API
+MARKET_DATA_TTL_SECONDS = 30.0
+
+_market_data_cache: Dict[Tuple[str, str], Tuple[float, MarketData]] = {}
+_market_data_cache_lock = threading.Lock()
+
+# The Fear & Greed Index is market-wide, so one fetch serves every symbol
+_fear_greed_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+_fear_greed_lock = threading.Lock()
+
+
+def clear_market_data_cache() -> None:
+    """Drop all cached market data."""
+    global _fear_greed_cache
+    with _market_data_cache_lock:
+        _market_data_cache.clear()
+    with _fear_greed_lock:
+        _fear_greed_cache = None
+
+
+def get_market_data(
+    symbol: str,
+    source: str = "auto",
+    session: Optional[requests.Session] = None
+) -> MarketData:
     """
     Fetch market data with automatic fallback.
 
+    Results are cached per symbol and source for MARKET_DATA_TTL_SECONDS.
+
     Args:
         symbol: Trading symbol (e.g., "BTC", "BTCUSDT", "BTC-USD")
         source: Data source - "coingecko", "coinbase", "binance", or "auto"
+        session: Optional requests session to fetch through
 
     Returns:
         MarketData object with current market data
@@ -183,22 +218,41 @@ def get_market_data(symbol: str, source: str = "auto") -> MarketData:
     Raises:
         MarketDataError: If all sources fail
     """
-    base_symbol = normalize_symbol(symbol)
+    key = (normalize_symbol(symbol), source)
+    now = time.monotonic()
+
+    with _market_data_cache_lock:
+        cached = _market_data_cache.get(key)
+    if cached and now - cached[0] < MARKET_DATA_TTL_SECONDS:
+        return cached[1]
+
+    data = _fetch_market_data(*key, session)
+
+    with _market_data_cache_lock:
+        _market_data_cache[key] = (now, data)
+    return data
 
+
+def _fetch_market_data(
+    base_symbol: str,
+    source: str,
+    session: Optional[requests.Session] = None
+) -> MarketData:
+    """Fetch market data from the requested source, bypassing the cache."""
     if source == "coingecko":
-        data = get_coingecko_data(base_symbol)
+        data = get_coingecko_data(base_symbol, session)
         if data:
             return data
         raise MarketDataError(f"Failed to fetch data from CoinGecko for {base_symbol}")
 
     if source == "coinbase":
-        data = get_coinbase_price(base_symbol)
+        data = get_coinbase_price(base_symbol, session)
         if data:
             return data
         raise MarketDataError(f"Failed to fetch data from Coinbase for {base_symbol}")
 
     if source == "binance":
-        data = get_binance_price(base_symbol)
+        data = get_binance_price(base_symbol, session)
         if data:
             return data
         raise MarketDataError(f"Failed to fetch data from Binance for {base_symbol}")
@@ -209,7 +263,7 @@ def get_market_data(symbol: str, source: str = "auto") -> MarketData:
         (get_coingecko_data, "CoinGecko"),
         (get_binance_price, "Binance")
     ]:
-        data = fetcher(base_symbol)
+        data = fetcher(base_symbol, session)
         if data:
             logging.debug(f"Market data fetched from {name} for {base_symbol}")
             return data
@@ -243,7 +297,19 @@ def format_market_context(market_data: MarketData) -> str:
 
 
 def get_fear_greed_index() -> Optional[Dict[str, Any]]:
-    """Fetch the Crypto Fear & Greed Index."""
+    """Fetch the Crypto Fear & Greed Index, cached for MARKET_DATA_TTL_SECONDS."""
+    global _fear_greed_cache
+    with _fear_greed_lock:
+        if _fear_greed_cache and time.time() - _fear_greed_cache[0] < MARKET_DATA_TTL_SECONDS:
+            return _fear_greed_cache[1]
+
+        fng = _fetch_fear_greed_index()
+        if fng:
+            _fear_greed_cache = (time.time(), fng)
+        return fng
+
+
+def _fetch_fear_greed_index() -> Optional[Dict[str, Any]]:
     url = "https://api.alternative.me/fng/"
 
     try:
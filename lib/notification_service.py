@@ -7,6 +7,7 @@ All notifications are recorded in SQLite for history and retry functionality.
 
 import logging
 import os
+import threading
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
@@ -17,11 +18,23 @@ from .database import (
     update_notification,
     get_notification_stats,
 )
-from .telegram_notifications import TelegramNotifier
+from .telegram_notifications import TelegramNotifier, create_session
 
 logger = logging.getLogger(__name__)
 
 
+def delivery_status_for(result: Dict[str, Any]) -> str:
+    """
+    Map a TelegramNotifier send result to a notification delivery status.
+
+    Duplicates suppressed by the notifier were never sent as a new message,
+    so they get their own status rather than claiming the earlier message.
+    """
+    if not result["success"]:
+        return "failed"
+    return "suppressed" if result.get("duplicate") else "sent"
+
+
 class NotificationService:
     """
     Service for sending notifications with history tracking.
@@ -53,7 +66,7 @@ class NotificationService:
 
         if token and chat and enabled:
             try:
-                self._notifier = TelegramNotifier(token, chat)
+                self._notifier = TelegramNotifier(token, chat, session=create_session())
                 logger.info("NotificationService initialized with Telegram")
             except ValueError as e:
                 logger.warning(f"Failed to initialize Telegram: {e}")
@@ -102,7 +115,7 @@ class NotificationService:
             )
             notification = update_notification(
                 notification["id"],
-                delivery_status="sent" if result["success"] else "failed",
+                delivery_status=delivery_status_for(result),
                 telegram_message_id=result.get("message_id"),
                 error_message=result.get("error")
             )
@@ -154,7 +167,7 @@ class NotificationService:
             )
             notification = update_notification(
                 notification["id"],
-                delivery_status="sent" if result["success"] else "failed",
+                delivery_status=delivery_status_for(result),
                 telegram_message_id=result.get("message_id"),
                 error_message=result.get("error")
             )
@@ -211,7 +224,7 @@ class NotificationService:
             )
             notification = update_notification(
                 notification["id"],
-                delivery_status="sent" if result["success"] else "failed",
+                delivery_status=delivery_status_for(result),
                 telegram_message_id=result.get("message_id"),
                 error_message=result.get("error")
             )
@@ -253,7 +266,7 @@ class NotificationService:
             result = self._send_telegram_error(run_name, error_message)
             notification = update_notification(
                 notification["id"],
-                delivery_status="sent" if result["success"] else "failed",
+                delivery_status=delivery_status_for(result),
                 telegram_message_id=result.get("message_id"),
                 error_message=result.get("error")
             )
@@ -305,7 +318,7 @@ class NotificationService:
             )
             notification = update_notification(
                 notification["id"],
-                delivery_status="sent" if result["success"] else "failed",
+                delivery_status=delivery_status_for(result),
                 telegram_message_id=result.get("message_id"),
                 error_message=result.get("error")
             )
@@ -365,7 +378,7 @@ class NotificationService:
             result = self._notifier.send_message_raw(text)
             notification = update_notification(
                 notification["id"],
-                delivery_status="sent" if result["success"] else "failed",
+                delivery_status=delivery_status_for(result),
                 telegram_message_id=result.get("message_id"),
                 error_message=result.get("error")
             )
@@ -407,7 +420,7 @@ class NotificationService:
 
         return update_notification(
             notification_id,
-            delivery_status="sent" if result["success"] else "failed",
+            delivery_status=delivery_status_for(result),
             telegram_message_id=result.get("message_id"),
             error_message=result.get("error"),
             increment_retry=True
@@ -551,13 +564,17 @@ class NotificationService:
 
 # Global instance for convenience
 _notification_service: Optional[NotificationService] = None
+_notification_service_lock = threading.Lock()
 
 
 def get_notification_service() -> NotificationService:
     """Get or create the global notification service instance."""
     global _notification_service
+    # Double-checked locking: concurrent requests share one service and its session
     if _notification_service is None:
-        _notification_service = NotificationService()
+        with _notification_service_lock:
+            if _notification_service is None:
+                _notification_service = NotificationService()
     return _notification_service
 
 
@@ -568,5 +585,6 @@ def init_notification_service(
 ) -> NotificationService:
     """Initialize the global notification service with config."""
     global _notification_service
-    _notification_service = NotificationService(bot_token, chat_id, enabled)
+    with _notification_service_lock:
+        _notification_service = NotificationService(bot_token, chat_id, enabled)
     return _notification_service
@@ -12,15 +12,21 @@ Tracks trading performance metrics including:
 import os
 import json
 import logging
+import operator
+import sys
+from collections import defaultdict
 from datetime import datetime, timezone
 from typing import Optional, Dict, List, Any
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, fields
 from pathlib import Path
 
 PERFORMANCE_DIR = "performance_data"
 
+# dataclass(slots=True) requires Python 3.10+; plain dataclasses on 3.9
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class Trade:
     """Represents a completed trade."""
     trade_id: str
@@ -37,7 +43,35 @@ class Trade:
     notes: str = ""
 
 
-@dataclass
+# Column order for CSV export, matching the Trade field order
+TRADE_FIELDS = tuple(f.name for f in fields(Trade))
+_trade_row = operator.attrgetter(*TRADE_FIELDS)
+
+_SUMMARY_TMPL = """
+========================================
+  Performance Summary: {strategy_name}
+========================================
+Total Trades:      {total_trades}
+Win Rate:          {win_rate:.1f}% ({winning_trades}W / {losing_trades}L)
+----------------------------------------
+Total P&L:         ${total_pnl:.2f} ({total_pnl_percent:.2f}%)
+Average Win:       ${average_win:.2f}
+Average Loss:      ${average_loss:.2f}
+Largest Win:       ${largest_win:.2f}
+Largest Loss:      ${largest_loss:.2f}
+----------------------------------------
+Profit Factor:     {profit_factor:.2f}
+Max Drawdown:      ${max_drawdown:.2f}
+----------------------------------------
+Current Streak:    {current_streak} ({streak_label})
+Best Win Streak:   {best_streak}
+Worst Loss Streak: {worst_streak_abs}
+Avg Duration:      {avg_trade_duration_hours:.1f} hours
+========================================
+"""
+
+
+@dataclass(**_SLOTS)
 class PerformanceMetrics:
     """Aggregated performance metrics."""
     total_trades: int
@@ -58,6 +92,16 @@ class PerformanceMetrics:
     avg_trade_duration_hours: float
 
 
+def _trade_duration_hours(trade: Trade) -> Optional[float]:
+    """Return the trade duration in hours, or None if its timestamps can't be parsed."""
+    try:
+        entry = datetime.fromisoformat(trade.entry_time.replace('Z', '+00:00'))
+        exit = datetime.fromisoformat(trade.exit_time.replace('Z', '+00:00'))
+    except (ValueError, AttributeError):
+        return None
+    return (exit - entry).total_seconds() / 3600
+
+
 class PerformanceTracker:
     """
     Tracks and persists trading performance data.
@@ -72,6 +116,15 @@ class PerformanceTracker:
     def __init__(self, strategy_name: str = "default"):
         self.strategy_name = strategy_name
         self.trades: List[Trade] = []
+        # Per-trade durations, parsed once and kept aligned with self.trades
+        self._durations: List[Optional[float]] = []
+        # Trades indexed by symbol for get_trades_by_symbol
+        self._by_symbol: Dict[str, List[Trade]] = defaultdict(list)
+        # Bumped whenever the trade history changes; keys the summary cache
+        self._version = 0
+        self._summary_version = -1
+        self._summary_cache = ""
+        self._summary_log = ""
         self.data_file = Path(PERFORMANCE_DIR) / f"{strategy_name}_trades.json"
         self._ensure_dir()
         self._load_trades()
@@ -87,10 +140,21 @@ class PerformanceTracker:
                 with open(self.data_file, 'r') as f:
                     data = json.load(f)
                     self.trades = [Trade(**t) for t in data.get("trades", [])]
+                    self._durations = [_trade_duration_hours(t) for t in self.trades]
+                self._rebuild_symbol_index()
+                self._version += 1
                 logging.info(f"Loaded {len(self.trades)} historical trades for {self.strategy_name}")
             except (json.JSONDecodeError, KeyError, TypeError) as e:
                 logging.warning(f"Failed to load trades file: {e}")
                 self.trades = []
+                self._durations = []
+                self._rebuild_symbol_index()
+
+    def _rebuild_symbol_index(self) -> None:
+        """Rebuild the per-symbol trade index from the trade list."""
+        self._by_symbol = defaultdict(list)
+        for trade in self.trades:
+            self._by_symbol[trade.symbol].append(trade)
 
     def _save_trades(self) -> None:
         """Persist trades to file."""
@@ -105,6 +169,9 @@ class PerformanceTracker:
     def record_trade(self, trade: Trade) -> None:
         """Record a completed trade."""
         self.trades.append(trade)
+        self._durations.append(_trade_duration_hours(trade))
+        self._by_symbol[trade.symbol].append(trade)
+        self._version += 1
         self._save_trades()
         logging.info(f"Recorded trade: {trade.symbol} {trade.side} PnL: {trade.pnl:.2f} ({trade.pnl_percent:.2f}%)")
 
@@ -150,7 +217,7 @@ class PerformanceTracker:
         return trade
 
     def get_metrics(self) -> PerformanceMetrics:
-        """Calculate and return performance metrics."""
+        """Calculate and return performance metrics in a single pass over the trades."""
         if not self.trades:
             return PerformanceMetrics(
                 total_trades=0,
@@ -171,42 +238,71 @@ class PerformanceTracker:
                 avg_trade_duration_hours=0.0
             )
 
-        # Basic counts
-        winning_trades = [t for t in self.trades if t.pnl > 0]
-        losing_trades = [t for t in self.trades if t.pnl < 0]
+        if len(self._durations) != len(self.trades):
+            self._durations = [_trade_duration_hours(t) for t in self.trades]
 
-        total_trades = len(self.trades)
-        win_count = len(winning_trades)
-        loss_count = len(losing_trades)
-
-        # Win rate
-        win_rate = (win_count / total_trades) * 100 if total_trades > 0 else 0.0
+        total_pnl = 0.0
+        total_pnl_percent = 0.0
+        win_count = 0
+        loss_count = 0
+        gross_profit = 0.0
+        gross_loss = 0.0
+        largest_win = float('-inf')
+        largest_loss = float('inf')
 
-        # P&L calculations
-        total_pnl = sum(t.pnl for t in self.trades)
-        total_pnl_percent = sum(t.pnl_percent for t in self.trades)
+        # Equity curve starts at 0.0, so the initial peak is 0.0
+        peak = 0.0
+        max_drawdown = 0.0
 
-        # Average win/loss
-        avg_win = sum(t.pnl for t in winning_trades) / win_count if win_count > 0 else 0.0
-        avg_loss = sum(t.pnl for t in losing_trades) / loss_count if loss_count > 0 else 0.0
+        # Positive streak for wins, negative for losses; break-even trades don't affect it
+        streak = 0
+        best_streak = 0
+        worst_streak = 0
+
+        duration_sum = 0.0
+        duration_count = 0
+
+        for trade, duration in zip(self.trades, self._durations):
+            pnl = trade.pnl
+            total_pnl += pnl
+            total_pnl_percent += trade.pnl_percent
+
+            if pnl > largest_win:
+                largest_win = pnl
+            if pnl < largest_loss:
+                largest_loss = pnl
+
+            if pnl > 0:
+                win_count += 1
+                gross_profit += pnl
+                streak = streak + 1 if streak > 0 else 1
+                if streak > best_streak:
+                    best_streak = streak
+            elif pnl < 0:
+                loss_count += 1
+                gross_loss += pnl
+                streak = streak - 1 if streak < 0 else -1
+                if streak < worst_streak:
+                    worst_streak = streak
+
+            # Running equity is the cumulative P&L
+            if total_pnl > peak:
+                peak = total_pnl
+            elif peak - total_pnl > max_drawdown:
+                max_drawdown = peak - total_pnl
+
+            if duration is not None:
+                duration_sum += duration
+                duration_count += 1
 
-        # Largest win/loss
-        largest_win = max((t.pnl for t in self.trades), default=0.0)
-        largest_loss = min((t.pnl for t in self.trades), default=0.0)
+        total_trades = len(self.trades)
+        gross_loss = abs(gross_loss)
 
-        # Profit factor (gross profit / gross loss)
-        gross_profit = sum(t.pnl for t in winning_trades)
-        gross_loss = abs(sum(t.pnl for t in losing_trades))
+        win_rate = (win_count / total_trades) * 100
+        avg_win = gross_profit / win_count if win_count > 0 else 0.0
+        avg_loss = -gross_loss / loss_count if loss_count > 0 else 0.0
         profit_factor = gross_profit / gross_loss if gross_loss > 0 else float('inf') if gross_profit > 0 else 0.0
-
-        # Maximum drawdown calculation
-        max_drawdown = self._calculate_max_drawdown()
-
-        # Streak calculations
-        current_streak, best_streak, worst_streak = self._calculate_streaks()
-
-        # Average trade duration
-        avg_duration = self._calculate_avg_duration()
+        avg_duration = duration_sum / duration_count if duration_count else 0.0
 
         return PerformanceMetrics(
             total_trades=total_trades,
@@ -221,80 +317,15 @@ class PerformanceTracker:
             largest_loss=largest_loss,
             profit_factor=profit_factor,
             max_drawdown=max_drawdown,
-            current_streak=current_streak,
+            current_streak=streak,
             best_streak=best_streak,
             worst_streak=worst_streak,
             avg_trade_duration_hours=avg_duration
         )
 
-    def _calculate_max_drawdown(self) -> float:
-        """Calculate maximum drawdown from peak equity."""
-        if not self.trades:
-            return 0.0
-
-        equity_curve = [0.0]
-        for trade in self.trades:
-            equity_curve.append(equity_curve[-1] + trade.pnl)
-
-        peak = equity_curve[0]
-        max_dd = 0.0
-
-        for equity in equity_curve:
-            if equity > peak:
-                peak = equity
-            drawdown = peak - equity
-            if drawdown > max_dd:
-                max_dd = drawdown
-
-        return max_dd
-
-    def _calculate_streaks(self) -> tuple:
-        """Calculate current, best, and worst winning/losing streaks."""
-        if not self.trades:
-            return 0, 0, 0
-
-        current = 0
-        best_win = 0
-        worst_loss = 0
-        streak = 0
-
-        for trade in self.trades:
-            if trade.pnl > 0:
-                if streak > 0:
-                    streak += 1
-                else:
-                    streak = 1
-                if streak > best_win:
-                    best_win = streak
-            elif trade.pnl < 0:
-                if streak < 0:
-                    streak -= 1
-                else:
-                    streak = -1
-                if streak < worst_loss:
-                    worst_loss = streak
-            # Break-even trades don't affect streak
-
-        current = streak
-        return current, best_win, worst_loss
-
-    def _calculate_avg_duration(self) -> float:
-        """Calculate average trade duration in hours."""
-        durations = []
-        for trade in self.trades:
-            try:
-                entry = datetime.fromisoformat(trade.entry_time.replace('Z', '+00:00'))
-                exit = datetime.fromisoformat(trade.exit_time.replace('Z', '+00:00'))
-                duration = (exit - entry).total_seconds() / 3600
-                durations.append(duration)
-            except (ValueError, AttributeError):
-                continue
-
-        return sum(durations) / len(durations) if durations else 0.0
-
     def get_trades_by_symbol(self, symbol: str) -> List[Trade]:
         """Get all trades for a specific symbol."""
-        return [t for t in self.trades if t.symbol == symbol]
+        return list(self._by_symbol.get(symbol, ()))
 
     def get_recent_trades(self, count: int = 10) -> List[Trade]:
         """Get the most recent trades."""
@@ -302,33 +333,24 @@ class PerformanceTracker:
 
     def print_summary(self) -> str:
         """Print a formatted performance summary."""
-        metrics = self.get_metrics()
+        if self._summary_version != self._version:
+            metrics = self.get_metrics()
+            streak = metrics.current_streak
+            self._summary_cache = _SUMMARY_TMPL.format(
+                strategy_name=self.strategy_name,
+                streak_label='wins' if streak > 0 else 'losses' if streak < 0 else 'N/A',
+                worst_streak_abs=abs(metrics.worst_streak),
+                **asdict(metrics)
+            )
+            self._summary_log = (
+                f"Performance: {metrics.total_trades} trades, "
+                f"{metrics.win_rate:.1f}% win rate, ${metrics.total_pnl:.2f} P&L"
+            )
+            self._summary_version = self._version
 
-        summary = f"""
-========================================
-  Performance Summary: {self.strategy_name}
-========================================
-Total Trades:      {metrics.total_trades}
-Win Rate:          {metrics.win_rate:.1f}% ({metrics.winning_trades}W / {metrics.losing_trades}L)
-----------------------------------------
-Total P&L:         ${metrics.total_pnl:.2f} ({metrics.total_pnl_percent:.2f}%)
-Average Win:       ${metrics.average_win:.2f}
-Average Loss:      ${metrics.average_loss:.2f}
-Largest Win:       ${metrics.largest_win:.2f}
-Largest Loss:      ${metrics.largest_loss:.2f}
-----------------------------------------
-Profit Factor:     {metrics.profit_factor:.2f}
-Max Drawdown:      ${metrics.max_drawdown:.2f}
-----------------------------------------
-Current Streak:    {metrics.current_streak} ({'wins' if metrics.current_streak > 0 else 'losses' if metrics.current_streak < 0 else 'N/A'})
-Best Win Streak:   {metrics.best_streak}
-Worst Loss Streak: {abs(metrics.worst_streak)}
-Avg Duration:      {metrics.avg_trade_duration_hours:.1f} hours
-========================================
-"""
-        print(summary)
-        logging.info(f"Performance: {metrics.total_trades} trades, {metrics.win_rate:.1f}% win rate, ${metrics.total_pnl:.2f} P&L")
-        return summary
+        print(self._summary_cache)
+        logging.info(self._summary_log)
+        return self._summary_cache
 
     def export_to_csv(self, filepath: Optional[str] = None) -> str:
         """Export trades to CSV format."""
@@ -336,12 +358,11 @@ Avg Duration:      {metrics.avg_trade_duration_hours:.1f} hours
 
         filepath = filepath or str(Path(PERFORMANCE_DIR) / f"{self.strategy_name}_trades.csv")
 
-        with open(filepath, 'w', newline='') as f:
+        with open(filepath, 'w', newline='', buffering=1 << 20) as f:
             if self.trades:
-                writer = csv.DictWriter(f, fieldnames=asdict(self.trades[0]).keys())
-                writer.writeheader()
-                for trade in self.trades:
-                    writer.writerow(asdict(trade))
+                writer = csv.writer(f)
+                writer.writerow(TRADE_FIELDS)
+                writer.writerows(map(_trade_row, self.trades))
 
         logging.info(f"Exported {len(self.trades)} trades to {filepath}")
         return filepath
@@ -349,6 +370,9 @@ Avg Duration:      {metrics.avg_trade_duration_hours:.1f} hours
     def clear_history(self) -> None:
         """Clear all trade history (use with caution)."""
         self.trades = []
+        self._durations = []
+        self._rebuild_symbol_index()
+        self._version += 1
         self._save_trades()
         logging.warning(f"Cleared all trade history for {self.strategy_name}")
 
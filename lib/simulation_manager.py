@@ -8,17 +8,21 @@ Provides start/stop/pause/resume controls and status tracking.
 import atexit
 import logging
 import signal
+import time
 from datetime import datetime, timezone
-from multiprocessing import Process, Queue
+from multiprocessing import Process, Queue, SimpleQueue
+from multiprocessing.connection import wait
 from threading import Thread, Lock
 from typing import Any, Dict, List, Optional
 
 from .config import SimulationConfig
 from .database import (
     create_simulation,
+    count_simulations,
     get_simulation,
     list_simulations,
     update_simulation,
+    update_simulations_bulk,
     delete_simulation,
     get_simulation_stats,
     init_database,
@@ -30,6 +34,15 @@ logger = logging.getLogger(__name__)
 # Maximum number of concurrent simulations
 MAX_SIMULATIONS = 5
 
+# Statuses that count towards the simulation limit
+ACTIVE_STATUSES = ("pending", "running", "paused")
+
+# Upper bound on how long the status monitor blocks before re-checking shutdown
+STATUS_WAIT_TIMEOUT = 5.0
+
+# How long status-driven database writes are buffered before being flushed together
+STATUS_FLUSH_INTERVAL = 0.25
+
 
 class SimulationManager:
     """
@@ -40,30 +53,38 @@ class SimulationManager:
     - SQLite-backed state persistence
     - Process lifecycle management
     - Status monitoring
+
+    Use SimulationManager.instance() or get_simulation_manager() for the
+    shared process-wide instance.
     """
 
     _instance: Optional["SimulationManager"] = None
-    _lock = Lock()
-
-    def __new__(cls):
-        """Singleton pattern for global access."""
-        with cls._lock:
-            if cls._instance is None:
-                cls._instance = super().__new__(cls)
-                cls._instance._initialized = False
-            return cls._instance
+    _instance_lock = Lock()
+
+    @classmethod
+    def instance(cls) -> "SimulationManager":
+        """Return the shared manager, creating it on first use."""
+        # Double-checked locking: only the first-time creation takes the lock
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
 
     def __init__(self):
         """Initialize the simulation manager."""
-        if self._initialized:
-            return
-
-        self._initialized = True
         self._processes: Dict[str, Process] = {}
         self._control_queues: Dict[str, Queue] = {}
-        self._status_queue = Queue()
+        # SimpleQueue writes straight to the pipe, so workers don't each
+        # spawn a feeder thread just to report status
+        self._status_queue = SimpleQueue()
         self._running = False
 
+        # Write-behind buffer for status-driven updates, flushed in one transaction
+        self._pending_updates: Dict[str, Dict[str, Any]] = {}
+        self._pending_lock = Lock()
+        self._flush_deadline = 0.0
+
         # Initialize database
         init_database()
 
@@ -119,18 +140,23 @@ class SimulationManager:
         self._processes.clear()
         self._control_queues.clear()
 
+        self._flush_pending_updates()
+
         logger.info("SimulationManager shutdown complete")
 
     def _recover_simulations(self):
         """Recover simulations that were running before restart."""
         # Get simulations that should be running
-        running_sims = list_simulations(status="running")
-        paused_sims = list_simulations(status="paused")
+        stale_sims = list_simulations(status=("running", "paused"))
 
-        for sim in running_sims + paused_sims:
+        for sim in stale_sims:
             logger.info(f"Recovering simulation: {sim['name']} ({sim['status']})")
-            # Mark as stopped - user can restart manually
-            update_simulation(sim["id"], status="stopped", error_message="Recovered after restart")
+
+        # Mark as stopped - user can restart manually
+        update_simulations_bulk({
+            sim["id"]: {"status": "stopped", "error_message": "Recovered after restart"}
+            for sim in stale_sims
+        })
 
     def create_simulation(self, name: str, config: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -147,10 +173,7 @@ class SimulationManager:
             ValueError: If max simulations reached or invalid config
         """
         # Check limit
-        all_sims = list_simulations()
-        active_count = len([s for s in all_sims if s["status"] in ("pending", "running", "paused")])
-
-        if active_count >= MAX_SIMULATIONS:
+        if count_simulations(ACTIVE_STATUSES) >= MAX_SIMULATIONS:
             raise ValueError(f"Maximum of {MAX_SIMULATIONS} simulations allowed")
 
         # Validate config
@@ -178,6 +201,7 @@ class SimulationManager:
         Raises:
             ValueError: If simulation not found or already running
         """
+        self._flush_pending_updates()
         simulation = get_simulation(simulation_id)
         if not simulation:
             raise ValueError(f"Simulation {simulation_id} not found")
@@ -228,6 +252,7 @@ class SimulationManager:
         Returns:
             Updated simulation record
         """
+        self._flush_pending_updates()
         simulation = get_simulation(simulation_id)
         if not simulation:
             raise ValueError(f"Simulation {simulation_id} not found")
@@ -251,6 +276,7 @@ class SimulationManager:
         Returns:
             Updated simulation record
         """
+        self._flush_pending_updates()
         simulation = get_simulation(simulation_id)
         if not simulation:
             raise ValueError(f"Simulation {simulation_id} not found")
@@ -276,6 +302,7 @@ class SimulationManager:
         Returns:
             Updated simulation record
         """
+        self._flush_pending_updates()
         simulation = get_simulation(simulation_id)
         if not simulation:
             raise ValueError(f"Simulation {simulation_id} not found")
@@ -304,6 +331,7 @@ class SimulationManager:
         Returns:
             True if deleted successfully
         """
+        self._flush_pending_updates()
         simulation = get_simulation(simulation_id)
         if not simulation:
             raise ValueError(f"Simulation {simulation_id} not found")
@@ -342,10 +370,11 @@ class SimulationManager:
             process = self._processes[sim_id]
             simulation["process_alive"] = process.is_alive()
 
-            # Update status if process died unexpectedly
+            # Update status if process died unexpectedly; persisted by the write-behind flush
             if not process.is_alive() and simulation["status"] in ("running", "paused"):
-                update_simulation(sim_id, status="stopped", error_message="Process terminated unexpectedly")
+                self._queue_update(sim_id, status="stopped", error_message="Process terminated unexpectedly")
                 simulation["status"] = "stopped"
+                simulation["error_message"] = "Process terminated unexpectedly"
                 self._cleanup_process(sim_id)
         else:
             simulation["process_alive"] = False
@@ -383,57 +412,120 @@ class SimulationManager:
         self._control_queues.pop(simulation_id, None)
 
     def _monitor_status(self):
-        """Background thread to monitor worker status updates."""
+        """
+        Background thread to monitor worker status updates.
+
+        Blocks until a status message arrives or a worker process exits
+        (its sentinel becomes ready) instead of polling on a fixed interval.
+        """
+        status_reader = self._status_queue._reader
+
         while self._running:
+            timeout = STATUS_WAIT_TIMEOUT
+            if self._pending_updates:
+                timeout = max(0.0, min(timeout, self._flush_deadline - time.monotonic()))
+
+            # Rebuilt each pass so processes started since the last wakeup are watched
+            sentinels = {
+                process.sentinel: sim_id
+                for sim_id, process in list(self._processes.items())
+            }
+
+            try:
+                ready = wait([status_reader, *sentinels], timeout=timeout)
+            except OSError:
+                # A sentinel was closed while waiting; rebuild and retry
+                continue
+
             try:
-                # Non-blocking get with timeout
-                status = self._status_queue.get(timeout=1)
+                if status_reader in ready:
+                    self._drain_status_queue()
 
-                sim_id = status.get("simulation_id")
-                status_value = status.get("status")
-                message = status.get("message")
+                for sentinel in ready:
+                    sim_id = sentinels.get(sentinel)
+                    if sim_id is not None:
+                        self._handle_process_exit(sim_id)
+            except Exception as e:
+                logger.error(f"Error handling simulation status: {e}")
 
-                logger.debug(f"Status update: {sim_id} -> {status_value}")
+            if self._pending_updates and time.monotonic() >= self._flush_deadline:
+                self._flush_pending_updates()
 
-                # Handle status updates
-                if status_value == "error":
-                    update_simulation(sim_id, status="error", error_message=message)
-                    self._cleanup_process(sim_id)
-                elif status_value == "stopped":
-                    self._cleanup_process(sim_id)
+    def _queue_update(self, sim_id: str, **fields):
+        """Buffer a simulation update; later fields for the same simulation win."""
+        with self._pending_lock:
+            self._queue_update_locked(sim_id, **fields)
 
-            except Exception:
-                # Queue.get timeout or other error
-                pass
+        # Without the monitor thread nothing would flush the buffer later
+        if not self._running:
+            self._flush_pending_updates()
+
+    def _queue_update_locked(self, sim_id: str, **fields):
+        """Buffer a simulation update; the caller must hold _pending_lock."""
+        if not self._pending_updates:
+            self._flush_deadline = time.monotonic() + STATUS_FLUSH_INTERVAL
+        self._pending_updates.setdefault(sim_id, {}).update(fields)
+
+    def _flush_pending_updates(self):
+        """Write all buffered simulation updates in a single transaction."""
+        # The lock is held through the write, so a reader holding it sees each
+        # update either still buffered or already committed, never in between
+        with self._pending_lock:
+            if not self._pending_updates:
+                return
+            pending, self._pending_updates = self._pending_updates, {}
 
-            # Check for dead processes
-            self._check_processes()
+            try:
+                update_simulations_bulk(pending)
+            except Exception as e:
+                logger.error(f"Failed to flush {len(pending)} simulation updates: {e}")
 
-    def _check_processes(self):
-        """Check for dead processes and cleanup."""
-        for sim_id in list(self._processes.keys()):
-            process = self._processes[sim_id]
-            if not process.is_alive():
-                simulation = get_simulation(sim_id)
-                if simulation and simulation["status"] in ("running", "paused"):
-                    update_simulation(
-                        sim_id,
-                        status="stopped",
-                        error_message="Process terminated unexpectedly"
-                    )
+    def _drain_status_queue(self):
+        """Handle all status updates currently waiting in the status queue."""
+        while not self._status_queue.empty():
+            try:
+                sim_id, status_value, message, _timestamp = self._status_queue.get()
+            except Exception as e:
+                logger.error(f"Failed to read status update: {e}")
+                return
+
+            logger.debug(f"Status update: {sim_id} -> {status_value}")
+
+            # Handle status updates
+            if status_value == "error":
+                self._queue_update(sim_id, status="error", error_message=message)
+                self._cleanup_process(sim_id)
+            elif status_value == "stopped":
                 self._cleanup_process(sim_id)
 
+    def _handle_process_exit(self, sim_id: str):
+        """Mark a simulation whose process exited as stopped and cleanup."""
+        if sim_id not in self._processes:
+            return
 
-# Global manager instance
-_manager: Optional[SimulationManager] = None
+        # Decide and queue under the lock so a concurrent flush can't hide
+        # the latest status; a buffered update is newer than the database
+        with self._pending_lock:
+            status = self._pending_updates.get(sim_id, {}).get("status")
+            if status is None:
+                simulation = get_simulation(sim_id)
+                status = simulation["status"] if simulation else None
+
+            if status in ("running", "paused"):
+                self._queue_update_locked(
+                    sim_id,
+                    status="stopped",
+                    error_message="Process terminated unexpectedly"
+                )
+
+        if not self._running:
+            self._flush_pending_updates()
+        self._cleanup_process(sim_id)
 
 
 def get_simulation_manager() -> SimulationManager:
     """Get or create the global simulation manager instance."""
-    global _manager
-    if _manager is None:
-        _manager = SimulationManager()
-    return _manager
+    return SimulationManager.instance()
 
 
 def init_simulation_manager() -> SimulationManager:
@@ -9,9 +9,13 @@ import logging
 import os
 import signal
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone
-from multiprocessing import Queue
-from typing import Any, Dict, Optional
+from multiprocessing import Queue, SimpleQueue
+from queue import Empty
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import requests
 
 from .ai import get_provider, AIOutlook, AIResponseError, AIProviderError
 from .config import SimulationConfig
@@ -33,6 +37,49 @@ CMD_STOP = "stop"
 CMD_PAUSE = "pause"
 CMD_RESUME = "resume"
 
+# Position side each directional signal holds
+SIGNAL_SIDES = {"Bullish": "BUY", "Bearish": "SELL"}
+
+# Environment variable holding the API key for each AI provider
+API_KEY_ENV_VARS = {
+    "anthropic": "ANTHROPIC_API_KEY",
+    "xai": "XAI_API_KEY",
+    "grok": "XAI_API_KEY",
+    "deepseek": "DEEPSEEK_API_KEY",
+}
+
+PROMPT_TEMPLATE = """You are a professional cryptocurrency analyst. Analyze {crypto_name} and provide your outlook for the next 24 hours.
+
+Consider:
+- Technical analysis and chart patterns
+- Market sentiment and momentum
+- Recent price action and trends
+- Support and resistance levels
+
+{market_context}
+
+Provide your analysis as either:
+- Bullish: You expect the price to increase
+- Bearish: You expect the price to decrease
+- Neutral: No clear directional bias
+
+Be decisive and provide clear reasoning for your outlook."""
+
+
+def make_status(
+    simulation_id: str,
+    status: str,
+    message: Optional[str] = None
+) -> Tuple[str, str, Optional[str], float]:
+    """
+    Build a status update for the manager's status queue.
+
+    Updates are plain (simulation_id, status, message, timestamp) tuples,
+    which pickle smaller than the equivalent dict. The timestamp is epoch
+    seconds; format it only where it is displayed.
+    """
+    return (simulation_id, status, message, time.time())
+
 
 class SimulationWorker:
     """
@@ -50,7 +97,7 @@ class SimulationWorker:
         simulation_id: str,
         config: SimulationConfig,
         control_queue: Queue,
-        status_queue: Queue
+        status_queue: SimpleQueue
     ):
         """
         Initialize the simulation worker.
@@ -69,6 +116,14 @@ class SimulationWorker:
         self.running = False
         self.paused = False
         self.current_trade_id: Optional[str] = None
+        # Last AI interpretation and when it was received (monotonic)
+        self._last_signal: Optional[Tuple[str, float]] = None
+
+        self._command_handlers = {
+            CMD_STOP: self._on_stop,
+            CMD_PAUSE: self._on_pause,
+            CMD_RESUME: self._on_resume,
+        }
 
         # Initialize components
         self._init_components()
@@ -82,27 +137,44 @@ class SimulationWorker:
             "run_name": f"sim_{self.simulation_id[:8]}"
         })
 
+        # One keep-alive session for the AI and market data calls made every cycle
+        self._http = requests.Session()
+
         # AI provider
         api_key = self._get_api_key()
-        self.ai_provider = get_provider(self.config.ai_provider, api_key)
+        self.ai_provider = get_provider(self.config.ai_provider, api_key, session=self._http)
 
         # Notification service
         self.notifier = NotificationService(
             enabled=self.config.telegram_enabled
         )
 
+        # Position size is either a fraction of capital or a fixed USD amount
+        pos_size = self.config.position_size
+        if isinstance(pos_size, str) and pos_size.endswith('%'):
+            self._position_fraction: Optional[float] = float(pos_size[:-1]) / 100
+            self._position_usd = 0.0
+        else:
+            self._position_fraction = None
+            self._position_usd = float(pos_size)
+
+        # Only the market context changes between cycles
+        crypto_name = self.config.crypto_name.replace("{", "{{").replace("}", "}}")
+        self._prompt_template = PROMPT_TEMPLATE.format(
+            crypto_name=crypto_name,
+            market_context="{market_context}"
+        )
+
+        # Sends notifications off the trading path; one thread keeps them in order
+        self._notify_pool = ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix=f"sim-{self.simulation_id[:8]}-notify"
+        )
+
     def _get_api_key(self) -> str:
         """Get the appropriate API key based on provider."""
         provider = self.config.ai_provider.lower()
-
-        key_map = {
-            "anthropic": "ANTHROPIC_API_KEY",
-            "xai": "XAI_API_KEY",
-            "grok": "XAI_API_KEY",
-            "deepseek": "DEEPSEEK_API_KEY",
-        }
-
-        env_var = key_map.get(provider, "DEEPSEEK_API_KEY")
+        env_var = API_KEY_ENV_VARS.get(provider, "DEEPSEEK_API_KEY")
         api_key = os.environ.get(env_var)
 
         if not api_key:
@@ -117,7 +189,8 @@ class SimulationWorker:
 
         # Send started status
         self._send_status("started")
-        self.notifier.send_simulation_status(
+        self._notify(
+            self.notifier.send_simulation_status,
             self.config.name,
             "started",
             simulation_id=self.simulation_id
@@ -131,7 +204,8 @@ class SimulationWorker:
                 self._process_commands()
 
                 if self.paused:
-                    time.sleep(1)
+                    # Block until the next command (resume/stop) arrives
+                    self._handle_command(self.control_queue.get())
                     continue
 
                 # Run one trading cycle
@@ -152,7 +226,8 @@ class SimulationWorker:
                 status="error",
                 error_message=str(e)
             )
-            self.notifier.send_simulation_status(
+            self._notify(
+                self.notifier.send_simulation_status,
                 self.config.name,
                 "error",
                 message=str(e),
@@ -164,79 +239,97 @@ class SimulationWorker:
 
     def _process_commands(self):
         """Process any pending control commands."""
-        while not self.control_queue.empty():
+        while True:
             try:
                 cmd = self.control_queue.get_nowait()
-                self._handle_command(cmd)
-            except Exception:
+            except Empty:
                 break
+            self._handle_command(cmd)
 
     def _handle_command(self, cmd: str):
         """Handle a control command."""
-        if cmd == CMD_STOP:
-            logger.info(f"Received stop command for {self.config.name}")
-            self.running = False
-            self._send_status("stopped")
-            update_simulation(self.simulation_id, status="stopped")
-            self.notifier.send_simulation_status(
-                self.config.name,
-                "stopped",
-                simulation_id=self.simulation_id
-            )
+        handler = self._command_handlers.get(cmd)
+        if handler is not None:
+            handler()
 
-        elif cmd == CMD_PAUSE:
-            logger.info(f"Received pause command for {self.config.name}")
-            self.paused = True
-            self._send_status("paused")
-            update_simulation(self.simulation_id, status="paused")
-            self.notifier.send_simulation_status(
-                self.config.name,
-                "paused",
-                simulation_id=self.simulation_id
-            )
+    def _on_stop(self):
+        """Stop the worker loop."""
+        logger.info(f"Received stop command for {self.config.name}")
+        self.running = False
+        # The "stopped" status itself is sent once, from _cleanup
+        update_simulation(self.simulation_id, status="stopped")
+        self._notify(
+            self.notifier.send_simulation_status,
+            self.config.name,
+            "stopped",
+            simulation_id=self.simulation_id
+        )
 
-        elif cmd == CMD_RESUME:
-            logger.info(f"Received resume command for {self.config.name}")
-            self.paused = False
-            self._send_status("running")
-            update_simulation(self.simulation_id, status="running")
-            self.notifier.send_simulation_status(
-                self.config.name,
-                "resumed",
-                simulation_id=self.simulation_id
-            )
+    def _on_pause(self):
+        """Pause trading until resumed or stopped."""
+        logger.info(f"Received pause command for {self.config.name}")
+        self.paused = True
+        self._send_status("paused")
+        update_simulation(self.simulation_id, status="paused")
+        self._notify(
+            self.notifier.send_simulation_status,
+            self.config.name,
+            "paused",
+            simulation_id=self.simulation_id
+        )
+
+    def _on_resume(self):
+        """Resume trading after a pause."""
+        logger.info(f"Received resume command for {self.config.name}")
+        self.paused = False
+        self._send_status("running")
+        update_simulation(self.simulation_id, status="running")
+        self._notify(
+            self.notifier.send_simulation_status,
+            self.config.name,
+            "resumed",
+            simulation_id=self.simulation_id
+        )
 
     def _trading_cycle(self):
         """Execute one trading cycle."""
         symbol = self.config.symbol
         crypto_name = self.config.crypto_name
 
+        if self._signal_still_holds(symbol):
+            logger.info(f"{self.config.name}: Last signal still fresh, holding position")
+            return
+
         # Get market data
         try:
-            market_data = get_market_data(symbol)
+            market_data = get_market_data(symbol, session=self._http)
             market_context = format_market_context(market_data)
         except MarketDataError as e:
             logger.warning(f"Market data unavailable: {e}")
+            market_data = None
             market_context = ""
 
         # Build prompt
-        prompt = self._build_prompt(crypto_name, market_context)
+        prompt = self._build_prompt(market_context)
 
         # Get AI signal
         try:
             outlook = self.ai_provider.send_request(prompt, crypto_name)
             logger.info(f"{self.config.name}: AI signal = {outlook.interpretation}")
+            self._last_signal = (outlook.interpretation, time.monotonic())
         except (AIResponseError, Exception) as e:
             logger.error(f"AI request failed: {e}")
-            self.notifier.send_error(
+            self._notify(
+                self.notifier.send_error,
                 self.config.name,
                 f"AI request failed: {e}",
                 simulation_id=self.simulation_id
             )
             return
 
-        # Send signal notification
-        self.notifier.send_signal(
+        # Send signal notification while the trade executes
+        self._notify(
+            self.notifier.send_signal,
             symbol=symbol,
             interpretation=outlook.interpretation,
             reasoning=outlook.reasons,
@@ -247,26 +340,35 @@ class SimulationWorker:
         # Execute trading logic
         self._execute_trading_logic(outlook, symbol, market_data.price if market_data else None)
 
-    def _build_prompt(self, crypto_name: str, market_context: str) -> str:
-        """Build the AI prompt."""
-        prompt = f"""You are a professional cryptocurrency analyst. Analyze {crypto_name} and provide your outlook for the next 24 hours.
+    def _signal_still_holds(self, symbol: str) -> bool:
+        """Check whether the last signal is within its TTL and agrees with the open position."""
+        ttl = self.config.signal_ttl_seconds
+        if not ttl or self._last_signal is None:
+            return False
 
-Consider:
-- Technical analysis and chart patterns
-- Market sentiment and momentum
-- Recent price action and trends
-- Support and resistance levels
+        interpretation, received_at = self._last_signal
+        if time.monotonic() - received_at >= ttl:
+            return False
 
-{market_context if market_context else ""}
+        position = self.tester.get_pending_positions(symbol)
+        return position is not None and position.side == SIGNAL_SIDES.get(interpretation)
 
-Provide your analysis as either:
-- Bullish: You expect the price to increase
-- Bearish: You expect the price to decrease
-- Neutral: No clear directional bias
+    def _notify(self, send: Callable[..., Any], *args, **kwargs):
+        """Queue a notifier call to run in the background, in submission order."""
+        self._notify_pool.submit(send, *args, **kwargs).add_done_callback(
+            self._log_notify_failure
+        )
 
-Be decisive and provide clear reasoning for your outlook."""
+    @staticmethod
+    def _log_notify_failure(future: Future):
+        """Log a background notification that raised instead of losing it."""
+        error = future.exception()
+        if error is not None:
+            logger.error(f"Notification failed: {error}")
 
-        return prompt
+    def _build_prompt(self, market_context: str) -> str:
+        """Build the AI prompt."""
+        return self._prompt_template.format(market_context=market_context or "")
 
     def _execute_trading_logic(
         self,
@@ -275,47 +377,30 @@ Be decisive and provide clear reasoning for your outlook."""
         current_price: Optional[float]
     ):
         """Execute trading logic based on AI signal."""
-        interpretation = outlook.interpretation
+        # Neutral maps to no side; a signal matching the open position holds it
+        signal_side = SIGNAL_SIDES.get(outlook.interpretation)
         position = self.tester.get_pending_positions(symbol)
+        if signal_side is None or (position is not None and position.side == signal_side):
+            return
 
-        # Get current price if not provided
+        # Resolve the price once; sizing, fills and records all use it
         if current_price is None:
             current_price = self.tester.get_current_price(symbol)
 
-        # Calculate position size
-        position_size = self._calculate_position_size(current_price)
-
-        # Trading logic
         if position is None:
-            # No position - check for entry
-            if interpretation == "Bullish":
-                self._open_position(symbol, "BUY", position_size, current_price, outlook)
-            elif interpretation == "Bearish":
-                self._open_position(symbol, "SELL", position_size, current_price, outlook)
-            # Neutral = no action
-
+            # No position - enter on the signal's side
+            position_size = self._calculate_position_size(current_price)
+            self._open_position(symbol, signal_side, position_size, current_price, outlook)
         else:
-            # Have position - check for exit
-            position_side = position.side
-            entry_price = position.avgOpenPrice
-
-            if position_side == "BUY" and interpretation == "Bearish":
-                self._close_position(symbol, position, current_price, outlook)
-            elif position_side == "SELL" and interpretation == "Bullish":
-                self._close_position(symbol, position, current_price, outlook)
-            # Same direction or neutral = hold
+            # Signal turned against the position - exit
+            self._close_position(symbol, position, current_price, outlook)
 
     def _calculate_position_size(self, price: float) -> float:
         """Calculate the position size in base currency."""
-        pos_size = self.config.position_size
-
-        if isinstance(pos_size, str) and pos_size.endswith('%'):
-            # Percentage of capital
-            percent = float(pos_size[:-1])
-            usd_amount = self.tester.current_capital * (percent / 100)
+        if self._position_fraction is not None:
+            usd_amount = self.tester.current_capital * self._position_fraction
         else:
-            # Fixed USD amount
-            usd_amount = float(pos_size)
+            usd_amount = self._position_usd
 
         # Calculate quantity
         if price > 0:
@@ -338,7 +423,8 @@ Be decisive and provide clear reasoning for your outlook."""
                 side=side,
                 trade_side="OPEN",
                 order_type="MARKET",
-                interpretation=outlook.interpretation
+                interpretation=outlook.interpretation,
+                mark_price=price
             )
 
             # Record trade in database
@@ -357,7 +443,8 @@ Be decisive and provide clear reasoning for your outlook."""
             logger.info(f"{self.config.name}: Opened {side} position for {symbol}")
 
             # Send notification
-            self.notifier.send_trade_opened(
+            self._notify(
+                self.notifier.send_trade_opened,
                 symbol=symbol,
                 side=side,
                 quantity=quantity,
@@ -368,7 +455,8 @@ Be decisive and provide clear reasoning for your outlook."""
 
         except Exception as e:
             logger.error(f"Failed to open position: {e}")
-            self.notifier.send_error(
+            self._notify(
+                self.notifier.send_error,
                 self.config.name,
                 f"Failed to open position: {e}",
                 simulation_id=self.simulation_id
@@ -389,7 +477,8 @@ Be decisive and provide clear reasoning for your outlook."""
 
             result = self.tester.flash_close_position(
                 position_id=position.positionId,
-                interpretation=outlook.interpretation
+                interpretation=outlook.interpretation,
+                mark_price=exit_price
             )
 
             # Calculate PnL
@@ -415,7 +504,8 @@ Be decisive and provide clear reasoning for your outlook."""
             logger.info(f"{self.config.name}: Closed {side} position for {symbol}, PnL: {pnl:.2f}")
 
             # Send notification
-            self.notifier.send_trade_closed(
+            self._notify(
+                self.notifier.send_trade_closed,
                 symbol=symbol,
                 side=side,
                 quantity=quantity,
@@ -428,34 +518,38 @@ Be decisive and provide clear reasoning for your outlook."""
 
         except Exception as e:
             logger.error(f"Failed to close position: {e}")
-            self.notifier.send_error(
+            self._notify(
+                self.notifier.send_error,
                 self.config.name,
                 f"Failed to close position: {e}",
                 simulation_id=self.simulation_id
             )
 
     def _wait_with_interrupt(self, seconds: int):
-        """Wait for specified seconds but check for commands periodically."""
-        interval = 5  # Check every 5 seconds
-        elapsed = 0
+        """Wait for specified seconds, waking immediately to handle control commands."""
+        deadline = time.monotonic() + seconds
 
-        while elapsed < seconds and self.running and not self.paused:
-            time.sleep(min(interval, seconds - elapsed))
-            elapsed += interval
-            self._process_commands()
+        while self.running and not self.paused:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+
+            try:
+                cmd = self.control_queue.get(timeout=remaining)
+            except Empty:
+                break
+
+            self._handle_command(cmd)
 
     def _send_status(self, status: str, message: str = None):
         """Send status update to manager."""
-        self.status_queue.put({
-            "simulation_id": self.simulation_id,
-            "status": status,
-            "message": message,
-            "timestamp": datetime.now(timezone.utc).isoformat()
-        })
+        self.status_queue.put(make_status(self.simulation_id, status, message))
 
     def _cleanup(self):
         """Cleanup when worker exits."""
         logger.info(f"Simulation {self.config.name} cleanup")
+        self._notify_pool.shutdown(wait=True)
+        self._http.close()
         self._send_status("stopped")
 
 
@@ -463,17 +557,19 @@ def run_worker(
     simulation_id: str,
     config_dict: Dict[str, Any],
     control_queue: Queue,
-    status_queue: Queue
+    status_queue: SimpleQueue
 ):
     """
     Entry point for worker process.
 
     This function is called by multiprocessing.Process.
     """
-    # Set up logging for this process
+    # Set up logging for this process, replacing any handlers inherited from
+    # the parent (e.g. a queue whose listener thread doesn't exist here)
     logging.basicConfig(
         level=logging.INFO,
-        format=f"%(asctime)s - SIM[{simulation_id[:8]}] - %(levelname)s - %(message)s"
+        format=f"%(asctime)s - SIM[{simulation_id[:8]}] - %(levelname)s - %(message)s",
+        force=True
     )
 
     # Handle SIGTERM gracefully
@@ -500,9 +596,4 @@ def run_worker(
         logger.info("Worker exiting due to signal")
     except Exception as e:
         logger.error(f"Worker crashed: {e}")
-        status_queue.put({
-            "simulation_id": simulation_id,
-            "status": "error",
-            "message": str(e),
-            "timestamp": datetime.now(timezone.utc).isoformat()
-        })
+        status_queue.put(make_status(simulation_id, "error", str(e)))
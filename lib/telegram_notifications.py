@@ -1,8 +1,95 @@
 """Telegram bot notifications for trading bot."""
 
 import logging
+import threading
+import time
 from datetime import datetime, timezone
+from typing import Dict, Optional, Tuple
+
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+class TokenBucket:
+    """Thread-safe token bucket rate limiter."""
+
+    def __init__(self, rate: float, capacity: float):
+        """
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum tokens held, i.e. the allowed burst
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until it is available."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            # Reserve the token up front so waiters are served in order
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        if wait > 0:
+            time.sleep(wait)
+
+
+# Bot API limits: about 30 messages/s overall and 1 message/s to a single chat
+_global_bucket = TokenBucket(rate=30, capacity=30)
+_chat_buckets: Dict[str, TokenBucket] = {}
+_chat_buckets_lock = threading.Lock()
+
+
+def _get_chat_bucket(chat_id: str) -> TokenBucket:
+    """Get the rate limiter shared by all notifiers sending to a chat."""
+    with _chat_buckets_lock:
+        bucket = _chat_buckets.get(chat_id)
+        if bucket is None:
+            bucket = _chat_buckets[chat_id] = TokenBucket(rate=1, capacity=3)
+        return bucket
+
+
+# Minute (since the epoch) and its rendering for the last message timestamp
+_last_timestamp: Tuple[int, str] = (-1, "")
+
+
+def _utc_timestamp() -> str:
+    """Current UTC time as shown in messages, formatted at most once a minute."""
+    global _last_timestamp
+    minute = int(time.time()) // 60
+    cached_minute, formatted = _last_timestamp
+    if minute != cached_minute:
+        formatted = datetime.fromtimestamp(minute * 60, timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
+        _last_timestamp = (minute, formatted)
+    return formatted
+
+
+def create_session() -> requests.Session:
+    """
+    Create a keep-alive session for talking to the Bot API.
+
+    Retries connection failures and 429 rate-limit replies (honouring
+    Retry-After), which are safe to resend. Read timeouts are not retried,
+    since the message may already have been delivered.
+    """
+    retry = Retry(
+        total=3,
+        connect=3,
+        read=0,
+        backoff_factor=0.5,
+        status_forcelist=(429,),
+        allowed_methods=frozenset({"GET", "POST"}),
+        raise_on_status=False,
+    )
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(max_retries=retry))
+    return session
 
 
 class TelegramNotifier:
@@ -11,14 +98,24 @@ class TelegramNotifier:
     TIMEOUT = 10  # seconds
     API_BASE = "https://api.telegram.org/bot"
     APP_NAME = "AITrading Bot"
+    DEDUP_WINDOW = 60  # seconds a repeated dedup_key is suppressed for
+    DEDUP_MAX_ENTRIES = 512
+    HEADER = f"\U0001F916 *{APP_NAME}*\n\n"
 
-    def __init__(self, bot_token: str, chat_id: str):
+    SIGNAL_EMOJI = {
+        "Bullish": "\u2705",   # Green checkmark
+        "Bearish": "\u274c",   # Red X
+        "Neutral": "\u26a0\ufe0f",   # Warning sign
+    }
+
+    def __init__(self, bot_token: str, chat_id: str, session: Optional[requests.Session] = None):
         """
         Initialize Telegram notifier.
 
         Args:
             bot_token: Telegram bot token from @BotFather
             chat_id: Telegram chat ID to send messages to
+            session: Optional session to reuse connections (see create_session)
 
         Raises:
             ValueError: If bot token or chat ID is invalid
@@ -32,6 +129,13 @@ class TelegramNotifier:
         self.bot_token = bot_token
         self.chat_id = chat_id
         self.api_url = f"{self.API_BASE}{bot_token}"
+        self._send_url = f"{self.api_url}/sendMessage"
+        self.http = session if session is not None else requests
+        self._chat_bucket = _get_chat_bucket(chat_id)
+
+        # (text, parse_mode) -> (monotonic send time, message_id) of recent sends
+        self._recent: Dict[str, Tuple[float, str]] = {}
+        self._recent_lock = threading.Lock()
 
     def send_notification(
         self,
@@ -53,26 +157,26 @@ class TelegramNotifier:
             True if notification sent successfully, False otherwise
         """
         # Choose emoji based on interpretation
-        emoji_map = {
-            "Bullish": "\u2705",   # Green checkmark
-            "Bearish": "\u274c",   # Red X
-            "Neutral": "\u26a0\ufe0f",   # Warning sign
-        }
-        emoji = emoji_map.get(interpretation, "\u2753")
+        emoji = self.SIGNAL_EMOJI.get(interpretation, "\u2753")
 
         # Build message
-        timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
-
-        message = f"\U0001F916 *{self.APP_NAME}*\n\n"
-        message += f"{emoji} *Trading Signal: {interpretation}*\n\n"
-        message += f"*Symbol:* `{symbol}`\n"
-        message += f"*Signal:* {interpretation}\n"
-        message += f"*Time:* {timestamp}\n"
+        timestamp = _utc_timestamp()
 
         if include_reasoning and reasoning:
-            # Truncate if too long
-            truncated = reasoning[:800] + "..." if len(reasoning) > 800 else reasoning
-            message += f"\n*Reasoning:*\n{truncated}"
+            # Truncate if too long; the slice is a no-op for short reasoning
+            ellipsis = "..." if len(reasoning) > 800 else ""
+            reasoning_block = f"\n*Reasoning:*\n{reasoning[:800]}{ellipsis}"
+        else:
+            reasoning_block = ""
+
+        message = (
+            f"{self.HEADER}"
+            f"{emoji} *Trading Signal: {interpretation}*\n\n"
+            f"*Symbol:* `{symbol}`\n"
+            f"*Signal:* {interpretation}\n"
+            f"*Time:* {timestamp}\n"
+            f"{reasoning_block}"
+        )
 
         result = self._send_message(message)
         return result["success"]
@@ -101,7 +205,7 @@ class TelegramNotifier:
         emoji = "\U0001F7E2" if side.lower() == "buy" else "\U0001F534"  # Green/Red circle
         paper_tag = " [PAPER]" if is_paper else ""
 
-        message = f"\U0001F916 *{self.APP_NAME}*\n\n"
+        message = self.HEADER
         message += f"{emoji} *Position Opened{paper_tag}*\n\n"
         message += f"*Symbol:* `{symbol}`\n"
         message += f"*Side:* {side.upper()}\n"
@@ -141,7 +245,7 @@ class TelegramNotifier:
         paper_tag = " [PAPER]" if is_paper else ""
         pnl_emoji = "\u2705" if pnl >= 0 else "\u274c"
 
-        message = f"\U0001F916 *{self.APP_NAME}*\n\n"
+        message = self.HEADER
         message += f"{emoji} *Position Closed{paper_tag}*\n\n"
         message += f"*Symbol:* `{symbol}`\n"
         message += f"*Side:* {side.upper()}\n"
@@ -163,7 +267,7 @@ class TelegramNotifier:
         Returns:
             True if notification sent successfully
         """
-        message = f"\U0001F916 *{self.APP_NAME}*\n\n"
+        message = self.HEADER
         message += "\u26a0\ufe0f *Error Alert*\n\n"
         message += f"*Run:* {run_name}\n"
         message += f"*Error:* {error_message[:500]}"
@@ -195,7 +299,7 @@ class TelegramNotifier:
         win_rate = (winning_trades / total_trades * 100) if total_trades > 0 else 0
         pnl_emoji = "\U0001F4C8" if total_pnl >= 0 else "\U0001F4C9"  # Chart up/down
 
-        message = f"\U0001F916 *{self.APP_NAME}*\n\n"
+        message = self.HEADER
         message += f"\U0001F4CA *Daily Summary*\n\n"
         message += f"*Run:* {run_name}\n"
         message += f"*Trades:* {total_trades}\n"
@@ -206,33 +310,56 @@ class TelegramNotifier:
         result = self._send_message(message)
         return result["success"]
 
-    def _send_message(self, text: str, parse_mode: str = "Markdown") -> dict:
+    def _send_message(
+        self,
+        text: str,
+        parse_mode: str = "Markdown",
+        dedup_key: Optional[str] = None
+    ) -> dict:
         """
         Send a message via Telegram Bot API.
 
         Args:
             text: Message text
             parse_mode: Parse mode (Markdown or HTML)
+            dedup_key: Optional key identifying the event; repeats are suppressed
 
         Returns:
             Dictionary with success status and message_id if successful:
             {"success": True, "message_id": "123"} or {"success": False, "error": "..."}
+
+            Messages are only deduplicated when the caller passes dedup_key.
+            A message whose key was delivered within DEDUP_WINDOW seconds is
+            not resent; {"success": True, "message_id": None, "duplicate": True}
+            is returned instead, so callers don't record the earlier message twice.
         """
-        url = f"{self.api_url}/sendMessage"
+        if dedup_key is not None:
+            with self._recent_lock:
+                recent = self._recent.get(dedup_key)
+            if recent and time.monotonic() - recent[0] < self.DEDUP_WINDOW:
+                logging.info(f"Telegram notification suppressed as duplicate of {recent[1]}")
+                return {"success": True, "message_id": None, "duplicate": True}
+
         payload = {
             "chat_id": self.chat_id,
             "text": text,
             "parse_mode": parse_mode
         }
 
+        # Stay under Telegram's flood limits instead of collecting 429s
+        self._chat_bucket.acquire()
+        _global_bucket.acquire()
+
         try:
-            r = requests.post(url, json=payload, timeout=self.TIMEOUT)
+            r = self.http.post(self._send_url, json=payload, timeout=self.TIMEOUT)
             r.raise_for_status()
 
             result = r.json()
             if result.get("ok"):
                 message_id = str(result.get("result", {}).get("message_id", ""))
                 logging.info(f"Telegram notification sent (message_id: {message_id})")
+                if dedup_key is not None:
+                    self._remember_sent(dedup_key, message_id)
                 return {"success": True, "message_id": message_id}
             else:
                 error = result.get("description", "Unknown error")
@@ -243,19 +370,35 @@ class TelegramNotifier:
             logging.error(f"Telegram notification failed: {e}")
             return {"success": False, "error": str(e)}
 
-    def send_message_raw(self, text: str, parse_mode: str = "Markdown") -> dict:
+    def _remember_sent(self, key: str, message_id: str):
+        """Record a delivered message for duplicate suppression."""
+        with self._recent_lock:
+            self._recent.pop(key, None)
+            self._recent[key] = (time.monotonic(), message_id)
+            # Dicts keep insertion order, so the first entry is the oldest
+            if len(self._recent) > self.DEDUP_MAX_ENTRIES:
+                del self._recent[next(iter(self._recent))]
+
+    def send_message_raw(
+        self,
+        text: str,
+        parse_mode: str = "Markdown",
+        dedup_key: Optional[str] = None
+    ) -> dict:
         """
         Send a raw message and return full result details.
 
         Args:
             text: Message text
             parse_mode: Parse mode (Markdown or HTML)
+            dedup_key: Optional key identifying the event; repeats are suppressed
 
         Returns:
             Dictionary with success status and message_id if successful:
             {"success": True, "message_id": "123"} or {"success": False, "error": "..."}
+            Suppressed duplicates also carry "duplicate": True (see _send_message).
         """
-        return self._send_message(text, parse_mode)
+        return self._send_message(text, parse_mode, dedup_key)
 
     def test_connection(self) -> bool:
         """
@@ -267,7 +410,7 @@ class TelegramNotifier:
         url = f"{self.api_url}/getMe"
 
         try:
-            r = requests.get(url, timeout=self.TIMEOUT)
+            r = self.http.get(url, timeout=self.TIMEOUT)
             r.raise_for_status()
 
             result = r.json()
@@ -14,7 +14,9 @@ import argparse
 import atexit
 import logging
 import os
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 
 # Ensure lib modules are importable
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -28,6 +30,31 @@ from dashboard import create_app
 logger = logging.getLogger(__name__)
 
 
+def setup_logging(debug: bool = False):
+    """
+    Configure logging so request threads never block on console writes.
+
+    Records are queued and written out by a background listener thread.
+    Calling it again is a no-op.
+    """
+    root = logging.getLogger()
+    if any(isinstance(h, QueueHandler) for h in root.handlers):
+        return
+
+    logging.basicConfig(
+        level=logging.DEBUG if debug else logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    )
+
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *root.handlers, respect_handler_level=True)
+    root.handlers = [QueueHandler(log_queue)]
+
+    listener.start()
+    # Registered first so it runs last, after other shutdown handlers have logged
+    atexit.register(listener.stop)
+
+
 def main():
     """Main entry point for the dashboard."""
     parser = argparse.ArgumentParser(
@@ -65,10 +92,14 @@ Examples:
     args = parser.parse_args()
 
     # Configure logging
-    logging.basicConfig(
-        level=logging.DEBUG if args.debug else logging.INFO,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    )
+    setup_logging(args.debug)
+
+    # With --debug, Werkzeug's reloader re-runs this script in a child process that
+    # serves requests; the parent only watches for file changes and needs no setup
+    if args.debug and os.environ.get("WERKZEUG_RUN_MAIN") != "true":
+        from flask import Flask
+        Flask(__name__).run(host=args.host, port=args.port, debug=True)
+        return
 
     # Initialize simulation manager (unless disabled)
     sim_manager = None
@@ -85,12 +116,13 @@ Examples:
             logger.warning("Simulations will not be available")
 
     # Initialize notification service
+    # Decided before the import so the banner below can always report it
+    telegram_enabled = bool(
+        os.environ.get("TELEGRAM_BOT_TOKEN") and
+        os.environ.get("TELEGRAM_CHAT_ID")
+    )
     try:
         from lib.notification_service import init_notification_service
-        telegram_enabled = bool(
-            os.environ.get("TELEGRAM_BOT_TOKEN") and
-            os.environ.get("TELEGRAM_CHAT_ID")
-        )
         init_notification_service(enabled=telegram_enabled)
         if telegram_enabled:
             logger.info("Notification service initialized with Telegram")
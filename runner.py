@@ -2,13 +2,7 @@ import os
 import logging
 from dotenv import load_dotenv
 
-from lib import (
-    ai, custom_helpers, ForwardTester,
-    BitunixFutures, BitunixError,
-    CoinbaseAdvanced, CoinbaseError
-)
-
-load_dotenv()
+from lib import ai, custom_helpers
 
 # ===================== CONFIGURATION =====================
 RUN_NAME = "run_btc_template_prompt"
@@ -51,133 +45,139 @@ Provide your reasoning in ~100-150 words, focusing on the most relevant general
 Return the result by calling the provided function/tool with your outlook and reasoning.
 """.strip()
 
-# ===================== PREP =====================
-# AI Provider Configuration
-AI_PROVIDER = os.environ.get("AI_PROVIDER", "anthropic").lower()
-AI_API_KEYS = {
-    "anthropic": os.environ.get("ANTHROPIC_API_KEY"),
-    "xai": os.environ.get("XAI_API_KEY"),
-    "grok": os.environ.get("XAI_API_KEY"),  # Alias for xai
-    "deepseek": os.environ.get("DEEPSEEK_API_KEY") or os.environ.get("LLM_API_KEY"),  # Backward compat
-}
-AI_API_KEY = AI_API_KEYS.get(AI_PROVIDER)
-
-# Exchange Provider Configuration
-EXCHANGE_PROVIDER = os.environ.get("EXCHANGE_PROVIDER", "coinbase").lower()
-
-# Coinbase credentials
-COINBASE_API_KEY = os.environ.get("COINBASE_API_KEY")
-COINBASE_API_SECRET = os.environ.get("COINBASE_API_SECRET")
-
-# Bitunix credentials (legacy)
-BITUNIX_API_KEY = os.environ.get("BITUNIX_API_KEY") or os.environ.get("EXCHANGE_API_KEY")
-BITUNIX_API_SECRET = os.environ.get("BITUNIX_API_SECRET") or os.environ.get("EXCHANGE_API_SECRET")
-
-# ===================== MAIN EXECUTION =====================
-custom_helpers.configure_logger(RUN_NAME)
-logging.info("=== Run Started ===")
-
-# Initialize exchange client
-if FORWARD_TESTING_CONFIG is not None:
-    exchange = ForwardTester(FORWARD_TESTING_CONFIG)
-    logging.info("Forward testing mode enabled")
-    is_spot_exchange = False  # Forward tester supports shorting
-elif EXCHANGE_PROVIDER == "coinbase":
-    exchange = CoinbaseAdvanced(COINBASE_API_KEY, COINBASE_API_SECRET)
-    logging.info("Live trading mode: Coinbase")
-    is_spot_exchange = True  # Coinbase spot doesn't support shorting
-elif EXCHANGE_PROVIDER == "bitunix":
-    exchange = BitunixFutures(BITUNIX_API_KEY, BITUNIX_API_SECRET)
-    logging.info("Live trading mode: Bitunix")
-    is_spot_exchange = False  # Bitunix futures supports shorting
-else:
-    raise ValueError(f"Unknown exchange provider: {EXCHANGE_PROVIDER}")
-
-# Call AI to get interpretation
-try:
-    ai.init_provider(AI_PROVIDER, AI_API_KEY)
-    outlook = ai.send_request(PROMPT, CRYPTO)
-    interpretation = outlook.interpretation
-    logging.info(f"AI Interpretation: {interpretation}")
-except (ai.AIResponseError, ai.AIProviderError, Exception) as e:
-    logging.warning(f"AI request failed, defaulting to Neutral: {e}")
-    interpretation = "Neutral"
-    outlook = None
-
-if outlook:
-    ai.save_response(outlook, RUN_NAME)
-
-# Call exchange to get current position status
-try:
-    position = exchange.get_pending_positions(symbol=SYMBOL)
-    current_position = position.side.lower() if position else None
-    logging.info(f"Current Position: {current_position}")
-    logging.info(f"Available Capital: {exchange.get_account_balance('USDT')} USD")
-
-    # Execute trading actions
-    exchange.set_margin_mode(SYMBOL, MARGIN_MODE)
-    exchange.set_leverage(SYMBOL, LEVERAGE)
-
-    # Bullish cases
-    if interpretation == "Bullish" and current_position is None:
-        logging.info("Bullish signal: Opening long position")
-        custom_helpers.open_position(exchange, SYMBOL, direction="buy",
-                                    position_size=POSITION_SIZE, stop_loss_percent=STOP_LOSS_PERCENT)
-
-    elif interpretation == "Bullish" and current_position == "sell":
-        logging.info("Bullish signal: Closing short, opening long")
-        exchange.flash_close_position(position.positionId)
-        custom_helpers.open_position(exchange, SYMBOL, direction="buy",
-                                    position_size=POSITION_SIZE, stop_loss_percent=STOP_LOSS_PERCENT)
-
-    elif interpretation == "Bullish" and current_position == "buy":
-        logging.info("Bullish signal: Already in long position, holding")
-
-    # Bearish cases
-    elif interpretation == "Bearish" and current_position is None:
-        if is_spot_exchange:
-            # Spot exchanges don't support shorting
-            logging.info("Bearish signal: Spot exchange - no position to close, staying flat")
-        else:
-            logging.info("Bearish signal: Opening short position")
-            custom_helpers.open_position(exchange, SYMBOL, direction="sell",
+
+def main():
+    """Run one trading cycle for SYMBOL."""
+    # ===================== PREP =====================
+    load_dotenv()
+
+    # AI Provider Configuration
+    AI_PROVIDER = os.environ.get("AI_PROVIDER", "anthropic").lower()
+    AI_API_KEY = ai.get_api_key(AI_PROVIDER)
+
+    # Exchange Provider Configuration
+    EXCHANGE_PROVIDER = os.environ.get("EXCHANGE_PROVIDER", "coinbase").lower()
+
+    # Coinbase credentials
+    COINBASE_API_KEY = os.environ.get("COINBASE_API_KEY")
+    COINBASE_API_SECRET = os.environ.get("COINBASE_API_SECRET")
+
+    # Bitunix credentials (legacy)
+    BITUNIX_API_KEY = os.environ.get("BITUNIX_API_KEY") or os.environ.get("EXCHANGE_API_KEY")
+    BITUNIX_API_SECRET = os.environ.get("BITUNIX_API_SECRET") or os.environ.get("EXCHANGE_API_SECRET")
+
+    # ===================== MAIN EXECUTION =====================
+    custom_helpers.configure_logger(RUN_NAME)
+    logging.info("=== Run Started ===")
+
+    # Initialize exchange client
+    if FORWARD_TESTING_CONFIG is not None:
+        from lib import ForwardTester
+        exchange = ForwardTester(FORWARD_TESTING_CONFIG)
+        logging.info("Forward testing mode enabled")
+        is_spot_exchange = False  # Forward tester supports shorting
+    elif EXCHANGE_PROVIDER == "coinbase":
+        from lib import CoinbaseAdvanced
+        exchange = CoinbaseAdvanced(COINBASE_API_KEY, COINBASE_API_SECRET)
+        logging.info("Live trading mode: Coinbase")
+        is_spot_exchange = True  # Coinbase spot doesn't support shorting
+    elif EXCHANGE_PROVIDER == "bitunix":
+        from lib import BitunixFutures
+        exchange = BitunixFutures(BITUNIX_API_KEY, BITUNIX_API_SECRET)
+        logging.info("Live trading mode: Bitunix")
+        is_spot_exchange = False  # Bitunix futures supports shorting
+    else:
+        raise ValueError(f"Unknown exchange provider: {EXCHANGE_PROVIDER}")
+
+    # Call AI to get interpretation
+    try:
+        ai.init_provider(AI_PROVIDER, AI_API_KEY)
+        outlook = ai.send_request(PROMPT, CRYPTO)
+        interpretation = outlook.interpretation
+        logging.info(f"AI Interpretation: {interpretation}")
+    except (ai.AIResponseError, ai.AIProviderError, Exception) as e:
+        logging.warning(f"AI request failed, defaulting to Neutral: {e}")
+        interpretation = "Neutral"
+        outlook = None
+
+    if outlook:
+        ai.save_response(outlook, RUN_NAME)
+
+    # Call exchange to get current position status
+    try:
+        position = exchange.get_pending_positions(symbol=SYMBOL)
+        current_position = position.side.lower() if position else None
+        logging.info(f"Current Position: {current_position}")
+        logging.info(f"Available Capital: {exchange.get_account_balance('USDT')} USD")
+
+        # Execute trading actions
+        exchange.set_margin_mode(SYMBOL, MARGIN_MODE)
+        exchange.set_leverage(SYMBOL, LEVERAGE)
+
+        # Bullish cases
+        if interpretation == "Bullish" and current_position is None:
+            logging.info("Bullish signal: Opening long position")
+            custom_helpers.open_position(exchange, SYMBOL, direction="buy",
                                         position_size=POSITION_SIZE, stop_loss_percent=STOP_LOSS_PERCENT)
 
-    elif interpretation == "Bearish" and current_position == "buy":
-        if is_spot_exchange:
-            # Spot exchange: just close the long, can't short
-            logging.info("Bearish signal: Spot exchange - closing long position (no shorting)")
-            exchange.flash_close_position(position.positionId)
-        else:
-            logging.info("Bearish signal: Closing long, opening short")
+        elif interpretation == "Bullish" and current_position == "sell":
+            logging.info("Bullish signal: Closing short, opening long")
             exchange.flash_close_position(position.positionId)
-            custom_helpers.open_position(exchange, SYMBOL, direction="sell",
+            custom_helpers.open_position(exchange, SYMBOL, direction="buy",
                                         position_size=POSITION_SIZE, stop_loss_percent=STOP_LOSS_PERCENT)
 
-    elif interpretation == "Bearish" and current_position == "sell":
-        logging.info("Bearish signal: Already in short position, holding")
+        elif interpretation == "Bullish" and current_position == "buy":
+            logging.info("Bullish signal: Already in long position, holding")
+
+        # Bearish cases
+        elif interpretation == "Bearish" and current_position is None:
+            if is_spot_exchange:
+                # Spot exchanges don't support shorting
+                logging.info("Bearish signal: Spot exchange - no position to close, staying flat")
+            else:
+                logging.info("Bearish signal: Opening short position")
+                custom_helpers.open_position(exchange, SYMBOL, direction="sell",
+                                            position_size=POSITION_SIZE, stop_loss_percent=STOP_LOSS_PERCENT)
+
+        elif interpretation == "Bearish" and current_position == "buy":
+            if is_spot_exchange:
+                # Spot exchange: just close the long, can't short
+                logging.info("Bearish signal: Spot exchange - closing long position (no shorting)")
+                exchange.flash_close_position(position.positionId)
+            else:
+                logging.info("Bearish signal: Closing long, opening short")
+                exchange.flash_close_position(position.positionId)
+                custom_helpers.open_position(exchange, SYMBOL, direction="sell",
+                                            position_size=POSITION_SIZE, stop_loss_percent=STOP_LOSS_PERCENT)
+
+        elif interpretation == "Bearish" and current_position == "sell":
+            logging.info("Bearish signal: Already in short position, holding")
+
+        # Neutral cases
+        elif interpretation == "Neutral" and current_position in ("buy", "sell"):
+            logging.info(f"Neutral signal: Closing {current_position} position")
+            exchange.flash_close_position(position.positionId)
 
-    # Neutral cases
-    elif interpretation == "Neutral" and current_position in ("buy", "sell"):
-        logging.info(f"Neutral signal: Closing {current_position} position")
-        exchange.flash_close_position(position.positionId)
+        elif interpretation == "Neutral" and current_position is None:
+            logging.info("Neutral signal: No position open, doing nothing")
 
-    elif interpretation == "Neutral" and current_position is None:
-        logging.info("Neutral signal: No position open, doing nothing")
+        logging.info("=== Run Completed ===")
 
-    logging.info("=== Run Completed ===")
+    except Exception as e:  # BitunixError, CoinbaseError or anything unexpected
+        logging.warning(f"Exchange operation failed, stopping execution: {e}")
 
-except (BitunixError, CoinbaseError, Exception) as e:
-    logging.warning(f"Exchange operation failed, stopping execution: {e}")
+        # SAFETY: Flash close any open position on error
+        try:
+            position = exchange.get_pending_positions(symbol=SYMBOL)
+            if position:
+                logging.warning("Emergency flash close triggered due to error")
+                exchange.flash_close_position(position.positionId)
+                logging.info("Emergency flash close completed")
+        except Exception as close_error:
+            logging.error(f"Failed to flash close position: {close_error}")
+
+        logging.info("=== Run Failed ===")
 
-    # SAFETY: Flash close any open position on error
-    try:
-        position = exchange.get_pending_positions(symbol=SYMBOL)
-        if position:
-            logging.warning("Emergency flash close triggered due to error")
-            exchange.flash_close_position(position.positionId)
-            logging.info("Emergency flash close completed")
-    except Exception as close_error:
-        logging.error(f"Failed to flash close position: {close_error}")
 
-    logging.info("=== Run Failed ===")
+if __name__ == "__main__":
+    main()
@@ -9,43 +9,40 @@ Usage:
     python runner_multi.py                    # Use default config
     python runner_multi.py --config my.json   # Use custom config
     python runner_multi.py --dry-run          # Analyze without trading
+    python runner_multi.py --every 60         # Repeat hourly in one process
 """
 
+from __future__ import annotations
+
 import os
 import sys
+import time
 import logging
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from dotenv import load_dotenv
-from typing import Dict, Any, Optional
+from typing import TYPE_CHECKING, Dict, Any, Optional, Tuple
 
-from lib import (
-    ai, custom_helpers, ForwardTester,
-    BitunixFutures, BitunixError,
-    CoinbaseAdvanced, CoinbaseError,
-    DiscordNotifier,
-    TelegramNotifier,
-    get_tracker,
-    load_config, get_enabled_symbols, validate_config, TradingConfig, SymbolConfig,
-    get_enhanced_market_context
-)
+# The trading stack is imported where it's used so --help and --create-config stay fast
+if TYPE_CHECKING:
+    from lib import ai, TelegramNotifier, TradingConfig, SymbolConfig
 
-load_dotenv()
 
+# (exchange class, symbol) -> (margin_mode, leverage) already applied this process.
+# Keyed by exchange like lib.exchange_state_cache, so switching exchanges between
+# --every runs applies the settings on the new one.
+_configured_symbols: Dict[Tuple[str, str], Tuple[str, int]] = {}
+
+
+def _load_env():
+    """Load API keys from .env (only needed when actually trading)."""
+    from dotenv import load_dotenv
+    load_dotenv()
 
-def create_prompt(symbol_config: SymbolConfig, include_market_data: bool = True) -> str:
-    """Create AI prompt for a symbol, optionally including market data."""
-    market_context = ""
-    if include_market_data:
-        try:
-            market_context = f"\n\n{get_enhanced_market_context(symbol_config.symbol)}\n"
-        except Exception as e:
-            logging.warning(f"Could not fetch market data for {symbol_config.symbol}: {e}")
-            market_context = "\n(Real-time market data unavailable)\n"
 
-    return f"""You are a cryptocurrency market analyst AI.
+PROMPT_TEMPLATE = """You are a cryptocurrency market analyst AI.
 {market_context}
-Based on the market data above (if available) and your general knowledge of cryptocurrency markets and typical {symbol_config.crypto_name} behavior patterns, provide a trading outlook for the next 24 hours: Bullish, Bearish, or Neutral.
+Based on the market data above (if available) and your general knowledge of cryptocurrency markets and typical {crypto_name} behavior patterns, provide a trading outlook for the next 24 hours: Bullish, Bearish, or Neutral.
 
 Consider:
 - Current price action and 24h performance
@@ -60,9 +57,24 @@ Return the result by calling the provided function/tool with your outlook and re
 """.strip()
 
 
-def initialize_exchange(config: TradingConfig):
-    """Initialize the appropriate exchange client."""
+def create_prompt(symbol_config: SymbolConfig, include_market_data: bool = True) -> str:
+    """Create AI prompt for a symbol, optionally including market data."""
+    market_context = ""
+    if include_market_data:
+        from lib import get_enhanced_market_context
+        try:
+            market_context = f"\n\n{get_enhanced_market_context(symbol_config.symbol)}\n"
+        except Exception as e:
+            logging.warning(f"Could not fetch market data for {symbol_config.symbol}: {e}")
+            market_context = "\n(Real-time market data unavailable)\n"
+
+    return PROMPT_TEMPLATE.format(market_context=market_context, crypto_name=symbol_config.crypto_name)
+
+
+def initialize_exchange(config: TradingConfig, session=None):
+    """Initialize the appropriate exchange client, sending REST calls through session if given."""
     if config.forward_testing:
+        from lib import ForwardTester
         forward_config = {
             "run_name": config.run_name,
             "initial_capital": config.forward_testing_capital,
@@ -73,49 +85,178 @@ def initialize_exchange(config: TradingConfig):
         return exchange, False  # is_spot = False for forward tester
 
     if config.exchange_provider == "coinbase":
+        from lib import CoinbaseAdvanced
         api_key = os.environ.get("COINBASE_API_KEY")
         api_secret = os.environ.get("COINBASE_API_SECRET")
-        exchange = CoinbaseAdvanced(api_key, api_secret)
+        # Reused across --every runs so the connection and account lookups persist
+        exchange = CoinbaseAdvanced.shared(api_key, api_secret)
         logging.info("Live trading mode: Coinbase")
         return exchange, True  # Coinbase is spot
 
     if config.exchange_provider == "bitunix":
+        from lib import BitunixFutures
         api_key = os.environ.get("BITUNIX_API_KEY") or os.environ.get("EXCHANGE_API_KEY")
         api_secret = os.environ.get("BITUNIX_API_SECRET") or os.environ.get("EXCHANGE_API_SECRET")
-        exchange = BitunixFutures(api_key, api_secret)
+        exchange = BitunixFutures(api_key, api_secret, session=session)
         logging.info("Live trading mode: Bitunix")
         return exchange, False  # Bitunix supports shorting
 
     raise ValueError(f"Unknown exchange provider: {config.exchange_provider}")
 
 
-def initialize_ai(config: TradingConfig):
+def initialize_ai(config: TradingConfig, session=None):
     """Initialize the AI provider."""
-    ai_keys = {
-        "anthropic": os.environ.get("ANTHROPIC_API_KEY"),
-        "xai": os.environ.get("XAI_API_KEY"),
-        "grok": os.environ.get("XAI_API_KEY"),
-        "deepseek": os.environ.get("DEEPSEEK_API_KEY") or os.environ.get("LLM_API_KEY"),
-    }
-    api_key = ai_keys.get(config.ai_provider)
+    from lib import ai
+
+    api_key = ai.get_api_key(config.ai_provider)
 
     if not api_key:
         raise ValueError(f"No API key found for AI provider: {config.ai_provider}")
 
-    ai.init_provider(config.ai_provider, api_key)
+    ai.init_provider(config.ai_provider, api_key, session=session)
     logging.info(f"AI provider initialized: {config.ai_provider}")
 
 
+def analyze_symbol(
+    config: TradingConfig,
+    symbol_config: SymbolConfig,
+    cache_ttl: int = 0
+) -> Tuple[SymbolConfig, Optional[ai.AIOutlook]]:
+    """
+    Fetch market data and the AI outlook for a single symbol.
+
+    With cache_ttl > 0, a response to an identical prompt from the last
+    cache_ttl seconds is reused instead of calling the AI provider.
+
+    Returns the symbol config with its outlook, or None if the AI request failed.
+    """
+    from lib import ai, ai_cache
+
+    prompt = create_prompt(symbol_config, config.include_market_data)
+    cache_key = ai_cache.make_key(
+        config.ai_provider, ai.PROVIDERS[config.ai_provider].MODEL, symbol_config.crypto_name, prompt
+    )
+
+    try:
+        outlook = ai_cache.get(cache_key) if cache_ttl else None
+        if outlook:
+            logging.info(f"{symbol_config.symbol}: AI says {outlook.interpretation} (cached)")
+            return symbol_config, outlook
+
+        outlook = ai.send_request(prompt, symbol_config.crypto_name)
+        logging.info(f"{symbol_config.symbol}: AI says {outlook.interpretation}")
+
+        # Save AI response
+        ai.save_response(outlook, f"{config.run_name}_{symbol_config.symbol}")
+        if cache_ttl:
+            ai_cache.set(cache_key, outlook, ttl=cache_ttl)
+    except Exception as e:
+        logging.warning(f"{symbol_config.symbol}: AI request failed, defaulting to Neutral: {e}")
+        outlook = None
+
+    return symbol_config, outlook
+
+
+# Signal handlers: each acts on one (interpretation, current position) case
+# and returns (action, message) for the result dict
+
+def _open(exchange, symbol_config: SymbolConfig, direction: str):
+    from lib import custom_helpers
+
+    custom_helpers.open_position(
+        exchange, symbol_config.symbol, direction=direction,
+        position_size=symbol_config.position_size,
+        stop_loss_percent=symbol_config.stop_loss_percent
+    )
+
+
+def _open_long(exchange, symbol_config, position, is_spot):
+    logging.info("%s: Bullish - Opening long position", symbol_config.symbol)
+    _open(exchange, symbol_config, "buy")
+    return "open_long", "Opened long position"
+
+
+def _flip_to_long(exchange, symbol_config, position, is_spot):
+    logging.info("%s: Bullish - Closing short, opening long", symbol_config.symbol)
+    exchange.flash_close_position(position.positionId)
+    _open(exchange, symbol_config, "buy")
+    return "flip_to_long", "Closed short and opened long"
+
+
+def _hold_long(exchange, symbol_config, position, is_spot):
+    logging.info("%s: Bullish - Already long, holding", symbol_config.symbol)
+    return "hold_long", "Already in long position"
+
+
+def _open_short(exchange, symbol_config, position, is_spot):
+    if is_spot:
+        logging.info("%s: Bearish - Spot exchange, no position to close", symbol_config.symbol)
+        return "no_action_spot", "Spot exchange - cannot short"
+
+    logging.info("%s: Bearish - Opening short position", symbol_config.symbol)
+    _open(exchange, symbol_config, "sell")
+    return "open_short", "Opened short position"
+
+
+def _flip_to_short(exchange, symbol_config, position, is_spot):
+    if is_spot:
+        logging.info("%s: Bearish - Closing long (no shorting on spot)", symbol_config.symbol)
+        exchange.flash_close_position(position.positionId)
+        return "close_long_spot", "Closed long position (spot - no shorting)"
+
+    logging.info("%s: Bearish - Closing long, opening short", symbol_config.symbol)
+    exchange.flash_close_position(position.positionId)
+    _open(exchange, symbol_config, "sell")
+    return "flip_to_short", "Closed long and opened short"
+
+
+def _hold_short(exchange, symbol_config, position, is_spot):
+    logging.info("%s: Bearish - Already short, holding", symbol_config.symbol)
+    return "hold_short", "Already in short position"
+
+
+def _close(exchange, symbol_config, position, is_spot):
+    current_position = position.side.lower()
+    logging.info("%s: Neutral - Closing %s position", symbol_config.symbol, current_position)
+    exchange.flash_close_position(position.positionId)
+    return f"close_{current_position}", f"Closed {current_position} position"
+
+
+def _stay_flat(exchange, symbol_config, position, is_spot):
+    logging.info("%s: Neutral - No position, staying flat", symbol_config.symbol)
+    return "no_position", "No position to close"
+
+
+_SIGNAL_HANDLERS = {
+    ("Bullish", None): _open_long,
+    ("Bullish", "sell"): _flip_to_long,
+    ("Bearish", None): _open_short,
+    ("Bearish", "buy"): _flip_to_short,
+    ("Neutral", None): _stay_flat,
+}
+
+# Any other open position: hold it, or close it on a Neutral signal
+_DEFAULT_HANDLERS = {
+    "Bullish": _hold_long,
+    "Bearish": _hold_short,
+    "Neutral": _close,
+}
+
+
 def execute_trading_logic(
     exchange,
     is_spot: bool,
     symbol_config: SymbolConfig,
     interpretation: str,
-    dry_run: bool = False
+    dry_run: bool = False,
+    preloaded_positions: Optional[Dict[str, Any]] = None
 ) -> Dict[str, Any]:
     """
     Execute trading logic for a single symbol.
 
+    If preloaded_positions (symbol -> position) is given, the current position
+    is taken from it instead of being fetched from the exchange.
+
     Returns a dict with action taken and result.
     """
     symbol = symbol_config.symbol
@@ -129,99 +270,34 @@ def execute_trading_logic(
 
     try:
         # Get current position
-        position = exchange.get_pending_positions(symbol=symbol)
+        if preloaded_positions is not None:
+            position = preloaded_positions.get(symbol)
+        else:
+            position = exchange.get_pending_positions(symbol=symbol)
         current_position = position.side.lower() if position else None
         result["current_position"] = current_position
 
         if dry_run:
             result["action"] = f"dry_run_{interpretation.lower()}"
             result["message"] = f"Would execute {interpretation} logic (dry run)"
-            logging.info(f"[DRY RUN] {symbol}: {interpretation} - Position: {current_position}")
+            logging.info("[DRY RUN] %s: %s - Position: %s", symbol, interpretation, current_position)
             return result
 
-        # Set margin mode and leverage (no-op for spot)
-        exchange.set_margin_mode(symbol, symbol_config.margin_mode)
-        exchange.set_leverage(symbol, symbol_config.leverage)
+        # Set margin mode and leverage once per symbol (no-op for spot)
+        margin_settings = (symbol_config.margin_mode, symbol_config.leverage)
+        configured_key = (type(exchange).__name__, symbol)
+        if not is_spot and _configured_symbols.get(configured_key) != margin_settings:
+            exchange.set_margin_mode(symbol, symbol_config.margin_mode)
+            exchange.set_leverage(symbol, symbol_config.leverage)
+            _configured_symbols[configured_key] = margin_settings
 
         # Execute based on interpretation
-        if interpretation == "Bullish":
-            if current_position is None:
-                logging.info(f"{symbol}: Bullish - Opening long position")
-                custom_helpers.open_position(
-                    exchange, symbol, direction="buy",
-                    position_size=symbol_config.position_size,
-                    stop_loss_percent=symbol_config.stop_loss_percent
-                )
-                result["action"] = "open_long"
-                result["message"] = "Opened long position"
-
-            elif current_position == "sell":
-                logging.info(f"{symbol}: Bullish - Closing short, opening long")
-                exchange.flash_close_position(position.positionId)
-                custom_helpers.open_position(
-                    exchange, symbol, direction="buy",
-                    position_size=symbol_config.position_size,
-                    stop_loss_percent=symbol_config.stop_loss_percent
-                )
-                result["action"] = "flip_to_long"
-                result["message"] = "Closed short and opened long"
-
-            else:  # current_position == "buy"
-                logging.info(f"{symbol}: Bullish - Already long, holding")
-                result["action"] = "hold_long"
-                result["message"] = "Already in long position"
-
-        elif interpretation == "Bearish":
-            if current_position is None:
-                if is_spot:
-                    logging.info(f"{symbol}: Bearish - Spot exchange, no position to close")
-                    result["action"] = "no_action_spot"
-                    result["message"] = "Spot exchange - cannot short"
-                else:
-                    logging.info(f"{symbol}: Bearish - Opening short position")
-                    custom_helpers.open_position(
-                        exchange, symbol, direction="sell",
-                        position_size=symbol_config.position_size,
-                        stop_loss_percent=symbol_config.stop_loss_percent
-                    )
-                    result["action"] = "open_short"
-                    result["message"] = "Opened short position"
-
-            elif current_position == "buy":
-                if is_spot:
-                    logging.info(f"{symbol}: Bearish - Closing long (no shorting on spot)")
-                    exchange.flash_close_position(position.positionId)
-                    result["action"] = "close_long_spot"
-                    result["message"] = "Closed long position (spot - no shorting)"
-                else:
-                    logging.info(f"{symbol}: Bearish - Closing long, opening short")
-                    exchange.flash_close_position(position.positionId)
-                    custom_helpers.open_position(
-                        exchange, symbol, direction="sell",
-                        position_size=symbol_config.position_size,
-                        stop_loss_percent=symbol_config.stop_loss_percent
-                    )
-                    result["action"] = "flip_to_short"
-                    result["message"] = "Closed long and opened short"
-
-            else:  # current_position == "sell"
-                logging.info(f"{symbol}: Bearish - Already short, holding")
-                result["action"] = "hold_short"
-                result["message"] = "Already in short position"
-
-        elif interpretation == "Neutral":
-            if current_position:
-                logging.info(f"{symbol}: Neutral - Closing {current_position} position")
-                exchange.flash_close_position(position.positionId)
-                result["action"] = f"close_{current_position}"
-                result["message"] = f"Closed {current_position} position"
-            else:
-                logging.info(f"{symbol}: Neutral - No position, staying flat")
-                result["action"] = "no_position"
-                result["message"] = "No position to close"
+        handler = _SIGNAL_HANDLERS.get((interpretation, current_position)) or _DEFAULT_HANDLERS.get(interpretation)
+        if handler:
+            result["action"], result["message"] = handler(exchange, symbol_config, position, is_spot)
 
     except Exception as e:
-        logging.error(f"{symbol}: Trading error - {e}")
+        logging.error("%s: Trading error - %s", symbol, e)
         result["success"] = False
         result["message"] = str(e)
 
@@ -229,19 +305,57 @@ def execute_trading_logic(
         try:
             position = exchange.get_pending_positions(symbol=symbol)
             if position:
-                logging.warning(f"{symbol}: Emergency closing position due to error")
+                logging.warning("%s: Emergency closing position due to error", symbol)
                 exchange.flash_close_position(position.positionId)
                 result["action"] = "emergency_close"
         except Exception as close_error:
-            logging.error(f"{symbol}: Failed to emergency close: {close_error}")
+            logging.error("%s: Failed to emergency close: %s", symbol, close_error)
 
     return result
 
 
+def load_open_positions(exchange) -> Optional[Dict[str, Any]]:
+    """
+    Fetch all open positions in a single exchange call, keyed by symbol.
+
+    Returns None if the exchange has no batch endpoint or the call fails,
+    in which case positions are looked up per symbol.
+    """
+    get_all = getattr(exchange, "get_all_pending_positions", None)
+    if get_all is None:
+        return None
+
+    try:
+        return get_all()
+    except Exception as e:
+        logging.warning(f"Could not batch-load positions, fetching per symbol: {e}")
+        return None
+
+
+def send_signal_notifications(
+    config: TradingConfig,
+    telegram: Optional[TelegramNotifier],
+    symbol: str,
+    outlook: ai.AIOutlook
+):
+    """Send a symbol's AI signal to Telegram, logging failures."""
+    if telegram:
+        try:
+            reasoning = outlook.reasons if config.telegram_include_reasoning else None
+            telegram.send_notification(
+                symbol=symbol,
+                interpretation=outlook.interpretation,
+                reasoning=reasoning
+            )
+        except Exception as e:
+            logging.warning(f"Telegram notification failed: {e}")
+
+
 def run_multi_symbol_bot(
     config_file: str = "config.json",
     dry_run: bool = False,
-    symbols_override: Optional[list] = None
+    symbols_override: Optional[list] = None,
+    use_ai_cache: bool = True
 ):
     """
     Run the multi-symbol trading bot.
@@ -250,7 +364,12 @@ def run_multi_symbol_bot(
         config_file: Path to configuration file (relative to configs/)
         dry_run: If True, analyze but don't execute trades
         symbols_override: List of symbols to trade (overrides config)
+        use_ai_cache: If False, always query the AI even for a recently seen prompt
     """
+    from lib import ai, custom_helpers, get_tracker, load_config, get_enabled_symbols, validate_config
+
+    _load_env()
+
     # Load configuration
     config = load_config(config_file)
 
@@ -281,95 +400,106 @@ def run_multi_symbol_bot(
 
     logging.info(f"Trading {len(symbols)} symbols: {[s.symbol for s in symbols]}")
 
-    # Initialize exchange
+    # Symbols are analysed concurrently, so keep one provider connection alive per worker
+    analysis_workers = min(16, len(symbols))
+    ai_http = ai.create_session(pool_size=analysis_workers)
+
+    # Initialize AI first - it only checks the API key, so a missing key fails before any exchange setup
     try:
-        exchange, is_spot = initialize_exchange(config)
+        initialize_ai(config, session=ai_http)
     except Exception as e:
-        logging.error(f"Failed to initialize exchange: {e}")
+        logging.error(f"Failed to initialize AI: {e}")
+        ai_http.close()
         return
 
-    # Initialize AI
+    # Pooled session for the exchange so connections are reused across symbols; it is
+    # only used from this thread (notifiers on the notify thread get their own)
+    import requests
+    http = requests.Session()
+
+    # Initialize exchange
     try:
-        initialize_ai(config)
+        exchange, is_spot = initialize_exchange(config, session=http)
     except Exception as e:
-        logging.error(f"Failed to initialize AI: {e}")
+        logging.error(f"Failed to initialize exchange: {e}")
+        http.close()
+        ai_http.close()
         return
 
     # Initialize Discord notifier if enabled
     discord = None
+    discord_http = None
     if config.discord_enabled:
+        from lib import DiscordNotifier
         webhook_url = os.environ.get("DISCORD_WEBHOOK_URL")
         if webhook_url:
             try:
-                discord = DiscordNotifier(webhook_url)
+                discord_http = requests.Session()
+                discord = DiscordNotifier(webhook_url, session=discord_http)
             except ValueError as e:
                 logging.warning(f"Discord notifications disabled: {e}")
 
     # Initialize Telegram notifier if enabled
     telegram = None
     if config.telegram_enabled:
+        from lib.telegram_notifications import TelegramNotifier, create_session
         bot_token = os.environ.get("TELEGRAM_BOT_TOKEN")
         chat_id = os.environ.get("TELEGRAM_CHAT_ID")
         if bot_token and chat_id:
             try:
-                telegram = TelegramNotifier(bot_token, chat_id)
+                telegram = TelegramNotifier(bot_token, chat_id, session=create_session())
             except ValueError as e:
                 logging.warning(f"Telegram notifications disabled: {e}")
 
     # Initialize performance tracker
     tracker = get_tracker(config.run_name)
 
-    # Process each symbol
+    # Notifications go out in order on a background thread while the next symbol is analysed
+    notify_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="notify")
+
+    # Analyse all symbols concurrently - market data and AI calls are network-bound
+    cache_ttl = config.ai_cache_ttl if use_ai_cache else 0
+    with ThreadPoolExecutor(max_workers=analysis_workers, thread_name_prefix="analyze") as pool:
+        analyses = list(pool.map(lambda sc: analyze_symbol(config, sc, cache_ttl), symbols))
+    ai_http.close()
+
+    # Discord takes every symbol's signal in one post (up to 10 per message)
+    if discord:
+        signals = [
+            (symbol_config.symbol, outlook.interpretation, outlook.reasons)
+            for symbol_config, outlook in analyses if outlook
+        ]
+        if signals:
+            notify_pool.submit(
+                discord.send_signals, config.run_name, signals, config.discord_include_reasoning
+            )
+
+    # Execute trades sequentially
+    positions = load_open_positions(exchange)
     results = []
-    for symbol_config in symbols:
+    for symbol_config, outlook in analyses:
         logging.info(f"\n--- Processing {symbol_config.symbol} ({symbol_config.crypto_name}) ---")
-
-        # Generate prompt
-        prompt = create_prompt(symbol_config, config.include_market_data)
-
-        # Get AI interpretation
-        try:
-            outlook = ai.send_request(prompt, symbol_config.crypto_name)
-            interpretation = outlook.interpretation
-            logging.info(f"{symbol_config.symbol}: AI says {interpretation}")
-
-            # Save AI response
-            ai.save_response(outlook, f"{config.run_name}_{symbol_config.symbol}")
-
-        except Exception as e:
-            logging.warning(f"{symbol_config.symbol}: AI request failed, defaulting to Neutral: {e}")
-            interpretation = "Neutral"
-            outlook = None
+        interpretation = outlook.interpretation if outlook else "Neutral"
 
         # Execute trading logic
         result = execute_trading_logic(
-            exchange, is_spot, symbol_config, interpretation, dry_run
+            exchange, is_spot, symbol_config, interpretation, dry_run,
+            preloaded_positions=positions
         )
         results.append(result)
 
-        # Send Discord notification
-        if discord and outlook:
-            try:
-                reasoning = outlook.reasons if config.discord_include_reasoning else None
-                discord.send_notification(
-                    symbol=symbol_config.symbol,
-                    interpretation=interpretation,
-                    reasoning=reasoning
-                )
-            except Exception as e:
-                logging.warning(f"Discord notification failed: {e}")
+        # Send Telegram notifications without holding up the next symbol
+        if outlook and telegram:
+            notify_pool.submit(
+                send_signal_notifications,
+                config, telegram, symbol_config.symbol, outlook
+            )
 
-        # Send Telegram notification
-        if telegram and outlook:
-            try:
-                reasoning = outlook.reasons if config.telegram_include_reasoning else None
-                telegram.send_notification(
-                    symbol=symbol_config.symbol,
-                    interpretation=interpretation,
-                    reasoning=reasoning
-                )
-            except Exception as e:
-                logging.warning(f"Telegram notification failed: {e}")
+    # Let queued notifications finish before reporting
+    notify_pool.shutdown(wait=True)
+    http.close()
+    if discord_http:
+        discord_http.close()
 
     # Summary
     logging.info("\n=== Multi-Symbol Run Summary ===")
@@ -393,6 +523,7 @@ Examples:
   python runner_multi.py --config my_config.json  # Use custom config
   python runner_multi.py --dry-run              # Analyze without trading
   python runner_multi.py --symbols BTC ETH      # Trade specific symbols only
+  python runner_multi.py --every 60             # Keep running, once an hour
         """
     )
 
@@ -415,6 +546,19 @@ Examples:
         help='Specific symbols to trade (overrides config)'
     )
 
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Always query the AI, ignoring cached responses to identical prompts'
+    )
+
+    parser.add_argument(
+        '--every',
+        type=float,
+        metavar='MINUTES',
+        help='Keep running and repeat every MINUTES instead of exiting after one run'
+    )
+
     parser.add_argument(
         '--create-config',
         action='store_true',
@@ -423,6 +567,10 @@ Examples:
 
     args = parser.parse_args()
 
+    # A zero, negative or NaN interval would re-run back to back with no pause
+    if args.every is not None and not args.every > 0:
+        parser.error("--every must be a positive number of minutes")
+
     if args.create_config:
         from lib.config import create_sample_config
         path = create_sample_config()
@@ -433,21 +581,31 @@ Examples:
     # Normalize symbol names
     symbols = None
     if args.symbols:
-        symbols = [s.upper() + "USDT" if not s.upper().endswith("USDT") else s.upper()
-                   for s in args.symbols]
+        symbols = [s if s.endswith("USDT") else s + "USDT"
+                   for s in map(str.upper, args.symbols)]
 
+    # With --every, later runs reuse the already-imported modules and warm caches
     try:
-        run_multi_symbol_bot(
-            config_file=args.config,
-            dry_run=args.dry_run,
-            symbols_override=symbols
-        )
+        while True:
+            started = time.monotonic()
+            try:
+                run_multi_symbol_bot(
+                    config_file=args.config,
+                    dry_run=args.dry_run,
+                    symbols_override=symbols,
+                    use_ai_cache=not args.no_cache
+                )
+            except Exception as e:
+                logging.error(f"Unexpected error: {e}")
+                if not args.every:
+                    raise
+
+            if not args.every:
+                break
+            time.sleep(max(0.0, args.every * 60 - (time.monotonic() - started)))
     except KeyboardInterrupt:
         logging.info("Run interrupted by user")
         sys.exit(1)
-    except Exception as e:
-        logging.error(f"Unexpected error: {e}")
-        raise
 
 
 if __name__ == "__main__":
@@ -1,9 +1,11 @@
 import os
 import logging
+from concurrent.futures import ThreadPoolExecutor
+import requests
 from dotenv import load_dotenv
 
 from lib import (
-    ai, custom_helpers, ForwardTester,
+    ai, ai_cache, custom_helpers, exchange_state_cache, ForwardTester,
     BitunixFutures, BitunixError,
     CoinbaseAdvanced, CoinbaseError,
     DiscordNotifier
@@ -34,6 +36,9 @@ FORWARD_TESTING_CONFIG = None
 #     "fees": 0.0006,  # 0.06% taker fee
 # }
 
+# Reuse the AI outlook for this long if the prompt hasn't changed (0 disables)
+AI_CACHE_TTL = 3600  # seconds
+
 # Discord Notification Configuration
 DISCORD_WEBHOOK_URL = os.environ.get("DISCORD_WEBHOOK_URL", "")
 DISCORD_INCLUDE_REASON = True  # Set to False to exclude AI reasoning from notifications
@@ -81,6 +86,10 @@ BITUNIX_API_SECRET = os.environ.get("BITUNIX_API_SECRET") or os.environ.get("EXC
 custom_helpers.configure_logger(RUN_NAME)
 logging.info("=== Run Started ===")
 
+# Keep-alive connections for the AI and exchange calls. The exchange lookups run on a
+# small thread pool, so each thread gets its own Session over the shared pool.
+http = ai.create_session()
+
 # Initialize exchange client
 if FORWARD_TESTING_CONFIG is not None:
     exchange = ForwardTester(FORWARD_TESTING_CONFIG)
@@ -91,104 +100,166 @@ elif EXCHANGE_PROVIDER == "coinbase":
     logging.info("Live trading mode: Coinbase")
     is_spot_exchange = True  # Coinbase spot doesn't support shorting
 elif EXCHANGE_PROVIDER == "bitunix":
-    exchange = BitunixFutures(BITUNIX_API_KEY, BITUNIX_API_SECRET)
+    exchange = BitunixFutures(BITUNIX_API_KEY, BITUNIX_API_SECRET, session=http)
     logging.info("Live trading mode: Bitunix")
     is_spot_exchange = False  # Bitunix futures supports shorting
 else:
     raise ValueError(f"Unknown exchange provider: {EXCHANGE_PROVIDER}")
 
 # Initialize Discord notifier if webhook URL is provided
+# Webhooks are posted from a background thread so they don't delay the trade
 discord_notifier = None
+discord_http = requests.Session()
+notify_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="discord")
+
+
+def log_notify_failure(future):
+    """Log a background Discord post that raised."""
+    error = future.exception()
+    if error is not None:
+        logging.warning(f"Discord notification failed: {error}")
+
+
 if DISCORD_WEBHOOK_URL:
     try:
-        discord_notifier = DiscordNotifier(DISCORD_WEBHOOK_URL)
+        # Posted from the notify thread, so it gets a Session of its own
+        discord_notifier = DiscordNotifier(DISCORD_WEBHOOK_URL, session=discord_http)
         logging.info("Discord notifications enabled")
     except ValueError as e:
         logging.warning(f"Discord notifier initialization failed: {e}")
 
 # Call AI to get interpretation
+outlook_cached = False
 try:
-    ai.init_provider(AI_PROVIDER, AI_API_KEY)
-    outlook = ai.send_request(PROMPT, CRYPTO)
+    ai.init_provider(AI_PROVIDER, AI_API_KEY, session=http)
+    cache_key = ai_cache.make_key(AI_PROVIDER, ai.PROVIDERS[AI_PROVIDER].MODEL, CRYPTO, PROMPT)
+    outlook = ai_cache.get(cache_key) if AI_CACHE_TTL else None
+    outlook_cached = outlook is not None
+    if not outlook_cached:
+        outlook = ai.send_request(PROMPT, CRYPTO)
+        if AI_CACHE_TTL:
+            ai_cache.set(cache_key, outlook, ttl=AI_CACHE_TTL)
     interpretation = outlook.interpretation
-    logging.info(f"AI Interpretation: {interpretation}")
+    logging.info(f"AI Interpretation: {interpretation}{' (cached)' if outlook_cached else ''}")
 except (ai.AIResponseError, ai.AIProviderError, Exception) as e:
     logging.warning(f"AI request failed, defaulting to Neutral: {e}")
     interpretation = "Neutral"
     outlook = None
 
-if outlook:
+if outlook and not outlook_cached:
     ai.save_response(outlook, RUN_NAME)
 
 # Send Discord notification if enabled
 if discord_notifier and outlook:
-    try:
-        discord_notifier.send_notification(
-            run_name=RUN_NAME,
-            interpretation=outlook.interpretation,
-            reason=outlook.reasons,
-            include_reason=DISCORD_INCLUDE_REASON
-        )
-    except Exception as e:
-        logging.warning(f"Discord notification failed: {e}")
-
-# Call exchange to get current position status
-try:
-    position = exchange.get_pending_positions(symbol=SYMBOL)
-    current_position = position.side.lower() if position else None
-    logging.info(f"Current Position: {current_position}")
-    logging.info(f"Available Capital: {exchange.get_account_balance('USDT')} USD")
-
-    # Execute trading actions
+    notify_pool.submit(
+        discord_notifier.send_notification,
+        run_name=RUN_NAME,
+        interpretation=outlook.interpretation,
+        reason=outlook.reasons,
+        include_reason=DISCORD_INCLUDE_REASON
+    ).add_done_callback(log_notify_failure)
+
+
+def apply_margin_settings():
+    """Set margin mode, then leverage, for SYMBOL unless a recent run already did."""
+    state_key = f"{type(exchange).__name__}:{SYMBOL}"
+    if exchange_state_cache.is_applied(state_key, MARGIN_MODE, LEVERAGE):
+        logging.debug(f"Margin mode and leverage unchanged for {SYMBOL}, skipping")
+        return
     exchange.set_margin_mode(SYMBOL, MARGIN_MODE)
     exchange.set_leverage(SYMBOL, LEVERAGE)
+    exchange_state_cache.record(state_key, MARGIN_MODE, LEVERAGE)
+
+
+def open_long(position):
+    logging.info("Bullish signal: Opening long position")
+    custom_helpers.open_position(exchange, SYMBOL, direction="buy",
+                                position_size=POSITION_SIZE, stop_loss_percent=STOP_LOSS_PERCENT)
+
+
+def flip_to_long(position):
+    logging.info("Bullish signal: Closing short, opening long")
+    exchange.flash_close_position(position.positionId)
+    custom_helpers.open_position(exchange, SYMBOL, direction="buy",
+                                position_size=POSITION_SIZE, stop_loss_percent=STOP_LOSS_PERCENT)
+
+
+def hold_long(position):
+    logging.info("Bullish signal: Already in long position, holding")
+
 
-    # Bullish cases
-    if interpretation == "Bullish" and current_position is None:
-        logging.info("Bullish signal: Opening long position")
-        custom_helpers.open_position(exchange, SYMBOL, direction="buy",
+def open_short(position):
+    if is_spot_exchange:
+        # Spot exchanges don't support shorting
+        logging.info("Bearish signal: Spot exchange - no position to close, staying flat")
+    else:
+        logging.info("Bearish signal: Opening short position")
+        custom_helpers.open_position(exchange, SYMBOL, direction="sell",
                                     position_size=POSITION_SIZE, stop_loss_percent=STOP_LOSS_PERCENT)
 
-    elif interpretation == "Bullish" and current_position == "sell":
-        logging.info("Bullish signal: Closing short, opening long")
+
+def flip_to_short(position):
+    if is_spot_exchange:
+        # Spot exchange: just close the long, can't short
+        logging.info("Bearish signal: Spot exchange - closing long position (no shorting)")
+        exchange.flash_close_position(position.positionId)
+    else:
+        logging.info("Bearish signal: Closing long, opening short")
         exchange.flash_close_position(position.positionId)
-        custom_helpers.open_position(exchange, SYMBOL, direction="buy",
+        custom_helpers.open_position(exchange, SYMBOL, direction="sell",
                                     position_size=POSITION_SIZE, stop_loss_percent=STOP_LOSS_PERCENT)
 
-    elif interpretation == "Bullish" and current_position == "buy":
-        logging.info("Bullish signal: Already in long position, holding")
-
-    # Bearish cases
-    elif interpretation == "Bearish" and current_position is None:
-        if is_spot_exchange:
-            # Spot exchanges don't support shorting
-            logging.info("Bearish signal: Spot exchange - no position to close, staying flat")
-        else:
-            logging.info("Bearish signal: Opening short position")
-            custom_helpers.open_position(exchange, SYMBOL, direction="sell",
-                                        position_size=POSITION_SIZE, stop_loss_percent=STOP_LOSS_PERCENT)
-
-    elif interpretation == "Bearish" and current_position == "buy":
-        if is_spot_exchange:
-            # Spot exchange: just close the long, can't short
-            logging.info("Bearish signal: Spot exchange - closing long position (no shorting)")
-            exchange.flash_close_position(position.positionId)
-        else:
-            logging.info("Bearish signal: Closing long, opening short")
-            exchange.flash_close_position(position.positionId)
-            custom_helpers.open_position(exchange, SYMBOL, direction="sell",
-                                        position_size=POSITION_SIZE, stop_loss_percent=STOP_LOSS_PERCENT)
 
-    elif interpretation == "Bearish" and current_position == "sell":
-        logging.info("Bearish signal: Already in short position, holding")
+def hold_short(position):
+    logging.info("Bearish signal: Already in short position, holding")
 
-    # Neutral cases
-    elif interpretation == "Neutral" and current_position in ("buy", "sell"):
-        logging.info(f"Neutral signal: Closing {current_position} position")
-        exchange.flash_close_position(position.positionId)
 
-    elif interpretation == "Neutral" and current_position is None:
-        logging.info("Neutral signal: No position open, doing nothing")
+def close_position(position):
+    logging.info(f"Neutral signal: Closing {position.side.lower()} position")
+    exchange.flash_close_position(position.positionId)
+
+
+def stay_flat(position):
+    logging.info("Neutral signal: No position open, doing nothing")
+
+
+# (interpretation, current position side) -> action
+SIGNAL_ACTIONS = {
+    ("Bullish", None): open_long,
+    ("Bullish", "sell"): flip_to_long,
+    ("Bullish", "buy"): hold_long,
+    ("Bearish", None): open_short,
+    ("Bearish", "buy"): flip_to_short,
+    ("Bearish", "sell"): hold_short,
+    ("Neutral", "buy"): close_position,
+    ("Neutral", "sell"): close_position,
+    ("Neutral", None): stay_flat,
+}
+
+
+# Call exchange to get current position status
+# While True, `position` is still what the exchange reported and the error handler can reuse it
+position_is_current = False
+try:
+    # The lookups and the margin/leverage setup are independent, so overlap the round-trips
+    with ThreadPoolExecutor(max_workers=3, thread_name_prefix="exchange") as pool:
+        position_future = pool.submit(exchange.get_pending_positions, symbol=SYMBOL)
+        balance_future = pool.submit(exchange.get_account_balance, "USDT")
+        settings_future = pool.submit(apply_margin_settings)
+
+    position = position_future.result()
+    position_is_current = True
+    current_position = position.side.lower() if position else None
+    logging.info(f"Current Position: {current_position}")
+    logging.info(f"Available Capital: {balance_future.result()} USD")
+    settings_future.result()
+
+    # Orders below change the position, so the error handler must look it up again
+    position_is_current = False
+
+    action = SIGNAL_ACTIONS.get((interpretation, current_position))
+    if action:
+        action(position)
 
     logging.info("=== Run Completed ===")
 
@@ -197,14 +268,12 @@ except (BitunixError, CoinbaseError, Exception) as e:
 
     # Send error notification if Discord is configured
     if discord_notifier:
-        try:
-            discord_notifier.send_error(RUN_NAME, str(e))
-        except Exception:
-            pass
+        notify_pool.submit(discord_notifier.send_error, RUN_NAME, str(e))
 
     # SAFETY: Flash close any open position on error
     try:
-        position = exchange.get_pending_positions(symbol=SYMBOL)
+        if not position_is_current:
+            position = exchange.get_pending_positions(symbol=SYMBOL)
         if position:
             logging.warning("Emergency flash close triggered due to error")
             exchange.flash_close_position(position.positionId)
@@ -213,3 +282,8 @@ except (BitunixError, CoinbaseError, Exception) as e:
         logging.error(f"Failed to flash close position: {close_error}")
 
     logging.info("=== Run Failed ===")
+
+# Let queued Discord posts finish before exiting
+notify_pool.shutdown(wait=True)
+http.close()
+discord_http.close()
@@ -9,20 +9,23 @@ This module provides reusable fixtures for:
 - Flask test client
 """
 
+from __future__ import annotations
+
 import os
 import pytest
 import tempfile
 import sqlite3
 import json
+import uuid
 from pathlib import Path
-from unittest.mock import Mock, MagicMock
+from unittest.mock import Mock, MagicMock, patch
 from datetime import datetime, timezone
-from typing import Generator, Dict, Any
+from typing import TYPE_CHECKING, Generator, Dict, Any
 
-# Import application modules
-from lib.config import TradingConfig, SymbolConfig, SimulationConfig
-from lib.database import init_database, get_connection
-from dashboard.app import create_app
+# Application modules are imported inside the fixtures that use them, so
+# collecting a narrow selection of tests doesn't load the database or dashboard
+if TYPE_CHECKING:
+    from lib.config import TradingConfig, SymbolConfig, SimulationConfig
 
 
 # ============================================================================
@@ -39,31 +42,61 @@ def temp_db_path(tmp_path) -> Generator[Path, None, None]:
         db_file.unlink()
 
 
+def _memory_db_uri() -> str:
+    """Return the URI of a new, private shared-cache in-memory SQLite database."""
+    worker_id = os.environ.get("PYTEST_XDIST_WORKER", "main")
+    return f"file:test_db_{worker_id}_{uuid.uuid4().hex}?mode=memory&cache=shared"
+
+
+@pytest.fixture(scope="session")
+def test_db_template() -> str:
+    """
+    Run init_database() once per session and return the result as an SQL script.
+    """
+    import lib.database as db_module
+    from lib.database import init_database
+
+    db_uri = _memory_db_uri()
+    conn = sqlite3.connect(db_uri, uri=True)
+    try:
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(db_module, "DATABASE_FILE", db_uri)
+            init_database()
+            db_module.close_pool()
+        return "\n".join(conn.iterdump())
+    finally:
+        conn.close()
+
+
 @pytest.fixture
-def test_db(temp_db_path, monkeypatch) -> Generator[None, None, None]:
+def test_db(test_db_template, monkeypatch) -> Generator[None, None, None]:
     """
     Provide an initialized test database.
 
     Uses in-memory SQLite for fast testing.
     Automatically patches database module to use test database.
     """
-    # Patch the database module to use test database
     import lib.database as db_module
 
-    original_db_path = db_module.DATABASE_FILE
-    monkeypatch.setattr(db_module, "DATABASE_FILE", temp_db_path)
+    # Each test gets its own database, restored from the session's schema dump
+    db_uri = _memory_db_uri()
+    # The database lives as long as at least one connection is open
+    keep_alive = sqlite3.connect(db_uri, uri=True)
+    keep_alive.executescript(test_db_template)
 
-    # Initialize test database
-    init_database()
+    monkeypatch.setattr(db_module, "DATABASE_FILE", db_uri)
 
     yield
 
-    # Cleanup is automatic with tmp_path
+    db_module.close_pool()
+    keep_alive.close()
 
 
 @pytest.fixture
 def db_connection(test_db):
     """Provide a database connection for tests."""
+    from lib.database import get_connection
+
     with get_connection() as conn:
         yield conn
 
@@ -75,6 +108,8 @@ def db_connection(test_db):
 @pytest.fixture
 def sample_symbol_config() -> SymbolConfig:
     """Provide a sample SymbolConfig for testing."""
+    from lib.config import SymbolConfig
+
     return SymbolConfig(
         symbol="BTCUSDT",
         crypto_name="Bitcoin",
@@ -89,6 +124,8 @@ def sample_symbol_config() -> SymbolConfig:
 @pytest.fixture
 def sample_trading_config(sample_symbol_config) -> TradingConfig:
     """Provide a sample TradingConfig for testing."""
+    from lib.config import TradingConfig
+
     return TradingConfig(
         run_name="test_strategy",
         forward_testing=True,
@@ -107,6 +144,8 @@ def sample_trading_config(sample_symbol_config) -> TradingConfig:
 @pytest.fixture
 def sample_simulation_config() -> SimulationConfig:
     """Provide a sample SimulationConfig for testing."""
+    from lib.config import SimulationConfig
+
     return SimulationConfig(
         name="Test Simulation",
         symbol="BTCUSDT",
@@ -125,7 +164,9 @@ def sample_simulation_config() -> SimulationConfig:
 # Mock API Response Fixtures
 # ============================================================================
 
-@pytest.fixture
+# Canned payloads are only read by the code under test, so they're built once per session
+
+@pytest.fixture(scope="session")
 def mock_anthropic_response() -> Dict[str, Any]:
     """Mock Anthropic API response."""
     return {
@@ -148,7 +189,7 @@ def mock_anthropic_response() -> Dict[str, Any]:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_xai_response() -> Dict[str, Any]:
     """Mock xAI (Grok) API response."""
     return {
@@ -172,7 +213,7 @@ def mock_xai_response() -> Dict[str, Any]:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_coingecko_response() -> Dict[str, Any]:
     """Mock CoinGecko API response."""
     return {
@@ -191,7 +232,7 @@ def mock_coingecko_response() -> Dict[str, Any]:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_coinbase_price_response() -> Dict[str, Any]:
     """Mock Coinbase price API response."""
     return {
@@ -203,7 +244,7 @@ def mock_coinbase_price_response() -> Dict[str, Any]:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_binance_response() -> Dict[str, Any]:
     """Mock Binance API response."""
     return {
@@ -217,7 +258,7 @@ def mock_binance_response() -> Dict[str, Any]:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_telegram_response() -> Dict[str, Any]:
     """Mock Telegram API response."""
     return {
@@ -288,12 +329,11 @@ def mock_ai_provider(mocker):
 # ============================================================================
 
 @pytest.fixture
-def flask_app():
-    """Provide a Flask test application."""
-    app = create_app()
-    app.config["TESTING"] = True
-    app.config["WTF_CSRF_ENABLED"] = False
-    return app
+def flask_app(test_db):
+    """Provide a Flask test application backed by the test database."""
+    from dashboard.app import create_app
+
+    return create_app({"TESTING": True, "WTF_CSRF_ENABLED": False})
 
 
 @pytest.fixture
@@ -388,7 +428,7 @@ def sample_market_data() -> Dict[str, Any]:
 # ============================================================================
 
 @pytest.fixture
-def mock_env_vars(monkeypatch):
+def mock_env_vars():
     """Mock environment variables for testing."""
     env_vars = {
         "AI_PROVIDER": "anthropic",
@@ -404,34 +444,9 @@ def mock_env_vars(monkeypatch):
         "FORWARD_TESTING": "true"
     }
 
-    for key, value in env_vars.items():
-        monkeypatch.setenv(key, value)
-
-    return env_vars
-
-
-# ============================================================================
-# Cleanup Fixtures
-# ============================================================================
-
-@pytest.fixture(autouse=True)
-def cleanup_test_files():
-    """Automatically cleanup test files after each test."""
-    yield
-
-    # Cleanup patterns
-    patterns = [
-        "test_*.json",
-        "test_*.csv",
-        "test_*.db"
-    ]
-
-    for pattern in patterns:
-        for file in Path(".").glob(pattern):
-            try:
-                file.unlink()
-            except Exception:
-                pass
+    # Apply and restore the whole set at once instead of per-variable setenv
+    with patch.dict(os.environ, env_vars):
+        yield env_vars
 
 
 # ============================================================================
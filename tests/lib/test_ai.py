@@ -17,7 +17,10 @@ from lib.ai import (
     init_provider,
     send_request,
     save_response,
+    load_responses,
     list_providers,
+    get_api_key,
+    create_session,
     AIResponseError,
     AIProviderError,
 )
@@ -91,6 +94,18 @@ class TestAnthropicProvider:
         assert result.interpretation == "Bullish"
         assert "momentum" in result.reasons.lower()
 
+    def test_send_request_uses_session(self, mock_anthropic_response):
+        """Test requests go through the session the provider was given."""
+        session = Mock(spec=requests.Session)
+        session.post.return_value.status_code = 200
+        session.post.return_value.json.return_value = mock_anthropic_response
+
+        provider = get_provider("anthropic", "test_key", session=session)
+        result = provider.send_request("Test prompt", "BTCUSDT")
+
+        assert result.interpretation == "Bullish"
+        session.post.assert_called_once()
+
     @patch("requests.post")
     def test_send_request_http_error(self, mock_post):
         """Test Anthropic API HTTP error handling."""
@@ -234,6 +249,41 @@ class TestProviderFactory:
         assert "deepseek" in providers
         assert len(providers) >= 4  # Including grok alias
 
+    def test_get_api_key(self, monkeypatch):
+        """Test API keys are read from each provider's environment variables."""
+        monkeypatch.setenv("XAI_API_KEY", "xai-key")
+        monkeypatch.delenv("DEEPSEEK_API_KEY", raising=False)
+        monkeypatch.setenv("LLM_API_KEY", "legacy-key")
+        monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+
+        assert get_api_key("grok") == "xai-key"
+        assert get_api_key("deepseek") == "legacy-key"
+        assert get_api_key("anthropic") is None
+        assert get_api_key("unknown") is None
+
+    def test_create_session_pool_size(self):
+        """Test the provider session keeps one connection per concurrent request."""
+        session = create_session(pool_size=16)
+
+        assert session.get_adapter("https://api.anthropic.com")._pool_maxsize == 16
+
+    def test_create_session_per_thread(self):
+        """Test each thread gets its own session over one shared connection pool."""
+        import threading
+
+        session = create_session(pool_size=4)
+        sessions = []
+        threads = [threading.Thread(target=lambda: sessions.append(session._session())) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        first, second = sessions
+
+        assert first is not second
+        assert first.get_adapter("https://api.x.ai") is second.get_adapter("https://api.x.ai")
+        session.close()
+
 
 class TestGlobalAPI:
     """Test global API functions."""
@@ -299,16 +349,13 @@ class TestResponseSaving:
         save_response(outlook, "test_run")
 
         # Verify file was created
-        response_file = tmp_path / "ai_responses" / "test_run.json"
+        response_file = tmp_path / "ai_responses" / "test_run.jsonl"
         assert response_file.exists()
 
         # Verify content
         with open(response_file) as f:
-            data = json.load(f)
-            timestamps = list(data.keys())
-            assert len(timestamps) > 0
-
-            entry = data[timestamps[0]]
+            entry = json.loads(f.readline())
+            assert "timestamp" in entry
             assert entry["interpretation"] == "Bullish"
             assert entry["provider"] == "TestProvider"
 
@@ -323,10 +370,48 @@ class TestResponseSaving:
         save_response(outlook2, "test_run")
 
         # Verify both responses are in file
-        response_file = tmp_path / "ai_responses" / "test_run.json"
+        response_file = tmp_path / "ai_responses" / "test_run.jsonl"
         with open(response_file) as f:
-            data = json.load(f)
-            assert len(data) == 2
+            assert sum(1 for _ in f) == 2
+
+    def test_load_responses_includes_legacy_history(self, tmp_path, monkeypatch):
+        """Test responses from the old JSON dict format are read before new ones."""
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "ai_responses").mkdir()
+        (tmp_path / "ai_responses" / "test_run.json").write_text(json.dumps({
+            "2024-01-01 00:00:00": {"interpretation": "Neutral", "reasons": "Old"}
+        }))
+
+        save_response(AIOutlook(interpretation="Bullish", reasons="New"), "test_run")
+
+        entries = list(load_responses("test_run"))
+        assert [e["reasons"] for e in entries] == ["Old", "New"]
+        assert entries[0]["timestamp"] == "2024-01-01 00:00:00"
+
+    def test_load_large_history_with_and_without_orjson(self, tmp_path, monkeypatch):
+        """Test a long .jsonl history reads the same with orjson and the json fallback."""
+        pytest.importorskip("orjson")
+        import lib.ai
+
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "ai_responses").mkdir()
+        lines = [
+            json.dumps({
+                "timestamp": f"2024-01-01 00:{i // 60 % 60:02d}:{i % 60:02d}",
+                "interpretation": ("Bullish", "Bearish", "Neutral")[i % 3],
+                "reasons": f"Reason {i} \u2014 price {50000 + i * 0.5}",
+                "provider": "anthropic",
+            })
+            for i in range(5000)
+        ]
+        (tmp_path / "ai_responses" / "test_run.jsonl").write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+        with_orjson = list(load_responses("test_run"))
+        monkeypatch.setattr(lib.ai, "orjson", None)
+        without_orjson = list(load_responses("test_run"))
+
+        assert len(with_orjson) == 5000
+        assert with_orjson == without_orjson
 
 
 class TestRequestPayloads:
@@ -367,6 +452,15 @@ class TestRequestPayloads:
         assert "tools" in payload
         assert payload["tools"][0]["function"]["name"] == "ethereum_outlook"
 
+    def test_tool_schema_cached_per_crypto(self):
+        """Test tool schemas are built once per crypto and reused."""
+        from lib.ai import _anthropic_tool, _function_tool
+
+        assert _anthropic_tool("Bitcoin") is _anthropic_tool("Bitcoin")
+        assert _function_tool("Ethereum") is _function_tool("Ethereum")
+        assert "strict" not in _function_tool("Ethereum")
+        assert _function_tool("Ethereum", strict=True)["strict"] is True
+
 
 @pytest.mark.unit
 class TestErrorHandling:
@@ -0,0 +1,44 @@
+"""
+Tests for lib/ai_cache.py - On-disk AI response cache
+"""
+
+import pytest
+
+from lib import ai_cache
+from lib.ai import AIOutlook
+
+
+@pytest.fixture(autouse=True)
+def temp_cache_dir(tmp_path, monkeypatch):
+    """Point the cache at a temporary directory."""
+    monkeypatch.setattr(ai_cache, "CACHE_DIR", tmp_path / "ai")
+
+
+class TestAICache:
+    """Test AI response caching."""
+
+    def test_roundtrip(self):
+        """Test a cached outlook is returned for the same key only."""
+        outlook = AIOutlook(interpretation="Bullish", reasons="Strong momentum")
+        key = ai_cache.make_key("anthropic", "model", "Bitcoin", "prompt")
+
+        assert ai_cache.get(key) is None
+
+        ai_cache.set(key, outlook, ttl=60)
+
+        assert ai_cache.get(key) == outlook
+        assert ai_cache.get(ai_cache.make_key("anthropic", "model", "Bitcoin", "other")) is None
+
+    def test_key_ignores_whitespace_changes(self):
+        """Test reformatting the prompt keeps the same key."""
+        key = ai_cache.make_key("anthropic", "model", "Bitcoin", "Give an outlook.\nBe brief.")
+
+        assert key == ai_cache.make_key("anthropic", "model", "Bitcoin", "  Give an outlook.  Be brief.\n")
+        assert key != ai_cache.make_key("anthropic", "model", "Bitcoin", "Give an outlook. Be detailed.")
+
+    def test_expired_entry_ignored(self):
+        """Test entries past their TTL are treated as missing."""
+        key = ai_cache.make_key("xai", "model", "Ethereum", "prompt")
+        ai_cache.set(key, AIOutlook(interpretation="Neutral", reasons="Range-bound"), ttl=0)
+
+        assert ai_cache.get(key) is None
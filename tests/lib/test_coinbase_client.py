@@ -41,6 +41,16 @@ class TestCoinbaseAdvanced:
         with pytest.raises(CoinbaseError):
             CoinbaseAdvanced("", "")
 
+    def test_shared_reuses_client(self, monkeypatch):
+        """Test shared() returns one client per credential pair."""
+        monkeypatch.setattr("lib.coinbase_client.RESTClient", MagicMock())
+        monkeypatch.setattr(CoinbaseAdvanced, "_shared_clients", {})
+
+        client = CoinbaseAdvanced.shared("test_key", "test_secret")
+
+        assert CoinbaseAdvanced.shared("test_key", "test_secret") is client
+        assert CoinbaseAdvanced.shared("other_key", "test_secret") is not client
+
     def test_get_account_balance(self, mock_coinbase_client):
         """Test getting account balance."""
         client = CoinbaseAdvanced("test_key", "test_secret")
@@ -55,6 +65,20 @@ class TestCoinbaseAdvanced:
 
         assert price > 0
 
+    def test_price_cache(self, monkeypatch):
+        """Test max_age reuses a recent quote and 0 always fetches."""
+        rest_client = MagicMock()
+        rest_client.return_value.get_product.return_value = Mock(price="50000.00")
+        monkeypatch.setattr("lib.coinbase_client.RESTClient", rest_client)
+        client = CoinbaseAdvanced("test_key", "test_secret")
+
+        assert client.get_current_price("BTCUSDT", max_age=5) == 50000.0
+        assert client.get_current_price("BTCUSDT", max_age=5) == 50000.0
+        assert client.client.get_product.call_count == 1
+
+        client.get_current_price("BTCUSDT")
+        assert client.client.get_product.call_count == 2
+
     def test_place_buy_order(self, mock_coinbase_client):
         """Test placing a buy order."""
         client = CoinbaseAdvanced("test_key", "test_secret")
@@ -57,6 +57,7 @@ class TestSimulationConfig:
         assert config.stop_loss_percent == 10.0
         assert config.max_daily_trades == 10
         assert config.check_interval_seconds == 300
+        assert config.signal_ttl_seconds == 0
 
     def test_simulation_config_percentage_position_size(self):
         """Test SimulationConfig with percentage position size."""
@@ -238,6 +239,21 @@ class TestConfigFileOperations:
         assert len(loaded_config.symbols) == len(sample_trading_config.symbols)
         assert loaded_config.ai_provider == sample_trading_config.ai_provider
 
+    def test_save_skipped_when_unchanged(self, temp_config_dir, sample_trading_config, monkeypatch):
+        """Test saving an identical config twice only writes the file once."""
+        replaced = []
+        real_replace = os.replace
+        monkeypatch.setattr(os, "replace", lambda src, dst: (replaced.append(dst), real_replace(src, dst)))
+
+        save_config(sample_trading_config, "test_config.json")
+        save_config(sample_trading_config, "test_config.json")
+        assert len(replaced) == 1
+
+        sample_trading_config.run_name = "changed"
+        save_config(sample_trading_config, "test_config.json")
+        assert len(replaced) == 2
+        assert list(temp_config_dir.glob("*.tmp")) == []
+
     def test_load_config_nonexistent_file(self, temp_config_dir):
         """Test loading config from nonexistent file returns defaults."""
         config = load_config("nonexistent.json")
@@ -344,6 +360,20 @@ class TestConfigValidation:
         assert len(issues) > 0
         assert any("Invalid position_size format" in issue for issue in issues)
 
+    def test_validate_config_out_of_range_percentages(self):
+        """Test validation of percentage position sizes and stop losses."""
+        config = TradingConfig(
+            symbols=[
+                SymbolConfig(symbol="BTC", crypto_name="Bitcoin", position_size="150%"),
+                SymbolConfig(symbol="ETH", crypto_name="Ethereum", stop_loss_percent=0)
+            ]
+        )
+
+        issues = validate_config(config)
+
+        assert any(issue.startswith("BTC: position_size percentage") for issue in issues)
+        assert any(issue.startswith("ETH: stop_loss_percent") for issue in issues)
+
     def test_validate_config_coinbase_leverage(self):
         """Test validation of leverage on Coinbase (spot)."""
         config = TradingConfig(
@@ -2,21 +2,26 @@
 Tests for lib/database.py - Database operations module
 """
 
+import os
 import pytest
 import json
 from datetime import datetime, timezone
 
 from lib.database import (
     init_database,
+    get_connection,
     create_simulation,
     get_simulation,
     list_simulations,
+    count_simulations,
     update_simulation,
+    update_simulations_bulk,
     delete_simulation,
     create_trade,
     get_trade,
     get_simulation_trades,
     update_trade,
+    batched_writes,
     create_notification,
     get_notification,
     list_notifications,
@@ -54,6 +59,67 @@ class TestDatabaseInitialization:
             )
             assert cursor.fetchone() is not None
 
+    def test_query_plans_use_indexes(self, test_db):
+        """Test filtered listings search an index and need no separate sort."""
+        queries = [
+            ("SELECT * FROM simulations WHERE status = ?", ("running",)),
+            ("SELECT * FROM simulation_trades WHERE simulation_id = ? "
+             "ORDER BY created_at DESC LIMIT 5", ("sim",)),
+            ("SELECT * FROM notifications WHERE type = ?", ("signal",)),
+            ("SELECT * FROM notifications ORDER BY created_at DESC LIMIT 5", ()),
+        ]
+
+        with get_connection() as conn:
+            for sql, params in queries:
+                plan = " ".join(row["detail"] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params))
+                assert "USING INDEX" in plan, sql
+                assert "TEMP B-TREE" not in plan, sql
+
+
+class TestConnectionPool:
+    """Test connection reuse."""
+
+    def test_connection_reused(self, test_db):
+        """Test a released connection is handed out again."""
+        with get_connection() as first:
+            pass
+        with get_connection() as second:
+            pass
+
+        assert second is first
+
+    def test_connection_discarded_after_error(self, test_db):
+        """Test a connection that saw an error is not returned to the pool."""
+        with pytest.raises(ValueError):
+            with get_connection() as failed:
+                raise ValueError("boom")
+        with get_connection() as conn:
+            pass
+
+        assert conn is not failed
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    def test_forked_child_opens_fresh_connection(self, test_db):
+        """Test a forked child never reuses a connection pooled by its parent."""
+        with get_connection() as parent_conn:
+            pass
+
+        pid = os.fork()
+        if pid == 0:
+            try:
+                with get_connection() as child_conn:
+                    reused = child_conn is parent_conn
+                os._exit(1 if reused else 0)
+            except BaseException:
+                os._exit(2)
+
+        _, status = os.waitpid(pid, 0)
+        assert os.WEXITSTATUS(status) == 0
+
+        with get_connection() as conn:
+            pass
+        assert conn is parent_conn
+
 
 class TestSimulationCRUD:
     """Test simulation CRUD operations."""
@@ -107,6 +173,32 @@ class TestSimulationCRUD:
         assert len(running_sims) == 1
         assert running_sims[0]["status"] == "running"
 
+    def test_list_simulations_with_multiple_statuses(self, test_db):
+        """Test listing simulations matching any of several statuses."""
+        sim1 = create_simulation("Running Sim", {})
+        sim2 = create_simulation("Paused Sim", {})
+        create_simulation("Pending Sim", {})
+
+        update_simulation(sim1["id"], status="running")
+        update_simulation(sim2["id"], status="paused")
+
+        sims = list_simulations(status=("running", "paused"))
+
+        assert {s["id"] for s in sims} == {sim1["id"], sim2["id"]}
+
+    def test_count_simulations(self, test_db):
+        """Test counting simulations by status."""
+        sim1 = create_simulation("Sim 1", {})
+        create_simulation("Sim 2", {})
+        sim3 = create_simulation("Sim 3", {})
+
+        update_simulation(sim1["id"], status="running")
+        update_simulation(sim3["id"], status="stopped")
+
+        assert count_simulations(("pending", "running", "paused")) == 2
+        assert count_simulations(("stopped",)) == 1
+        assert count_simulations(()) == 0
+
     def test_update_simulation_status(self, test_db):
         """Test updating simulation status."""
         sim = create_simulation("Test", {})
@@ -131,6 +223,21 @@ class TestSimulationCRUD:
         assert updated_sim["error_message"] == "Test error"
         assert updated_sim["pid"] == 12345
 
+    def test_update_simulations_bulk(self, test_db):
+        """Test updating several simulations in one call."""
+        sim1 = create_simulation("Sim 1", {})
+        sim2 = create_simulation("Sim 2", {})
+
+        update_simulations_bulk({
+            sim1["id"]: {"status": "error", "error_message": "Worker crashed"},
+            sim2["id"]: {"status": "stopped"},
+        })
+
+        assert get_simulation(sim1["id"])["status"] == "error"
+        assert get_simulation(sim1["id"])["error_message"] == "Worker crashed"
+        assert get_simulation(sim2["id"])["status"] == "stopped"
+        assert get_simulation(sim2["id"])["stopped_at"] is not None
+
     def test_delete_simulation(self, test_db):
         """Test deleting a simulation."""
         sim = create_simulation("Test", {})
@@ -187,14 +294,16 @@ class TestTradeCRUD:
         sim = create_simulation("Test", {})
 
         # Create multiple trades
-        for i in range(5):
-            create_trade(
-                simulation_id=sim["id"],
-                symbol="BTCUSDT",
-                side="buy",
-                action="OPEN_LONG",
-                quantity=0.1
-            )
+        with batched_writes() as conn:
+            for i in range(5):
+                create_trade(
+                    simulation_id=sim["id"],
+                    symbol="BTCUSDT",
+                    side="buy",
+                    action="OPEN_LONG",
+                    quantity=0.1,
+                    conn=conn
+                )
 
         trades = get_simulation_trades(sim["id"])
 
@@ -205,14 +314,16 @@ class TestTradeCRUD:
         sim = create_simulation("Test", {})
 
         # Create 10 trades
-        for i in range(10):
-            create_trade(
-                simulation_id=sim["id"],
-                symbol="BTCUSDT",
-                side="buy",
-                action="OPEN_LONG",
-                quantity=0.1
-            )
+        with batched_writes() as conn:
+            for i in range(10):
+                create_trade(
+                    simulation_id=sim["id"],
+                    symbol="BTCUSDT",
+                    side="buy",
+                    action="OPEN_LONG",
+                    quantity=0.1,
+                    conn=conn
+                )
 
         # Get first 5 trades
         trades_page1 = get_simulation_trades(sim["id"], limit=5, offset=0)
@@ -245,6 +356,44 @@ class TestTradeCRUD:
         assert updated_trade["pnl"] == 200.0
         assert updated_trade["closed_at"] is not None
 
+    def test_batched_writes_commit_together(self, test_db):
+        """Test writes sharing a batched_writes connection are committed together."""
+        sim = create_simulation("Test", {})
+
+        with batched_writes() as conn:
+            trade = create_trade(
+                simulation_id=sim["id"],
+                symbol="BTCUSDT",
+                side="buy",
+                action="OPEN_LONG",
+                quantity=0.1,
+                entry_price=50000.0,
+                conn=conn
+            )
+            update_trade(trade["id"], exit_price=51000.0, pnl=100.0, conn=conn)
+            update_simulation(sim["id"], status="stopped", conn=conn)
+
+        assert get_trade(trade["id"])["pnl"] == 100.0
+        assert get_simulation(sim["id"])["status"] == "stopped"
+
+    def test_batched_writes_rollback_on_error(self, test_db):
+        """Test a failing batch leaves no partial writes behind."""
+        sim = create_simulation("Test", {})
+
+        with pytest.raises(RuntimeError):
+            with batched_writes() as conn:
+                create_trade(
+                    simulation_id=sim["id"],
+                    symbol="BTCUSDT",
+                    side="buy",
+                    action="OPEN_LONG",
+                    quantity=0.1,
+                    conn=conn
+                )
+                raise RuntimeError("boom")
+
+        assert get_simulation_trades(sim["id"]) == []
+
 
 class TestNotificationCRUD:
     """Test notification CRUD operations."""
@@ -378,14 +527,15 @@ class TestStatistics:
 
     def test_get_notification_stats(self, test_db):
         """Test getting notification statistics."""
-        create_notification("signal", "Test 1")
-        create_notification("trade_opened", "Test 2")
+        with batched_writes() as conn:
+            create_notification("signal", "Test 1", conn=conn)
+            create_notification("trade_opened", "Test 2", conn=conn)
 
-        notif1 = create_notification("signal", "Test 3")
-        update_notification(notif1["id"], delivery_status="sent")
+            notif1 = create_notification("signal", "Test 3", conn=conn)
+            update_notification(notif1["id"], delivery_status="sent", conn=conn)
 
-        notif2 = create_notification("error", "Test 4")
-        update_notification(notif2["id"], delivery_status="failed")
+            notif2 = create_notification("error", "Test 4", conn=conn)
+            update_notification(notif2["id"], delivery_status="failed", conn=conn)
 
         stats = get_notification_stats()
 
@@ -394,6 +544,7 @@ class TestStatistics:
         assert stats["by_status"]["sent"] == 1
         assert stats["by_status"]["failed"] == 1
         assert stats["by_type"]["signal"] == 2
+        assert stats["recent_failures_24h"] == 1
 
 
 class TestHelperFunctions:
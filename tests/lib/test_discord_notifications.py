@@ -0,0 +1,51 @@
+"""
+Tests for lib/discord_notifications.py - Discord webhook notifications
+"""
+
+import pytest
+from unittest.mock import Mock
+
+from lib.discord_notifications import DiscordNotifier
+
+WEBHOOK_URL = "https://discord.com/api/webhooks/test"
+
+
+class TestDiscordNotifier:
+    """Test DiscordNotifier class."""
+
+    def test_initialization_invalid_url(self):
+        """Test initialization with a non-webhook URL."""
+        with pytest.raises(ValueError):
+            DiscordNotifier("https://example.com/hook")
+
+    def test_send_signals_batches_embeds(self):
+        """Test signals are posted MAX_EMBEDS at a time."""
+        session = Mock()
+        notifier = DiscordNotifier(WEBHOOK_URL, session=session)
+        signals = [(f"SYM{i}USDT", "Bullish", "Strong momentum") for i in range(12)]
+
+        result = notifier.send_signals("test_run", signals)
+
+        assert result is True
+        batches = [c.kwargs["json"]["embeds"] for c in session.post.call_args_list]
+        assert [len(b) for b in batches] == [10, 2]
+        assert batches[0][0]["title"].endswith("SYM0USDT: Bullish")
+
+    def test_send_signals_splits_on_text_limit(self):
+        """Test long reasons are split across posts under Discord's embed text limit."""
+        session = Mock()
+        notifier = DiscordNotifier(WEBHOOK_URL, session=session)
+        signals = [(f"SYM{i}USDT", "Bearish", "x" * 1200) for i in range(8)]
+
+        notifier.send_signals("test_run", signals)
+
+        batches = [c.kwargs["json"]["embeds"] for c in session.post.call_args_list]
+        assert len(batches) > 1
+        assert sum(len(b) for b in batches) == 8
+        for batch in batches:
+            text = sum(
+                len(e["title"]) + len(e["footer"]["text"])
+                + sum(len(f["name"]) + len(f["value"]) for f in e["fields"])
+                for e in batch
+            )
+            assert text <= DiscordNotifier.MAX_EMBED_CHARS
@@ -0,0 +1,35 @@
+"""
+Tests for lib/exchange_state_cache.py - Margin/leverage state cache
+"""
+
+import pytest
+
+from lib import exchange_state_cache
+
+
+@pytest.fixture(autouse=True)
+def temp_cache_file(tmp_path, monkeypatch):
+    """Point the cache at a temporary file."""
+    monkeypatch.setattr(exchange_state_cache, "CACHE_FILE", tmp_path / "exchange_state.json")
+
+
+class TestExchangeStateCache:
+    """Test margin/leverage state caching."""
+
+    def test_record_and_match(self):
+        """Test a recorded state only matches the same settings."""
+        assert not exchange_state_cache.is_applied("BitunixFutures:BTCUSDT", "ISOLATION", 1)
+
+        exchange_state_cache.record("BitunixFutures:BTCUSDT", "ISOLATION", 1)
+
+        assert exchange_state_cache.is_applied("BitunixFutures:BTCUSDT", "ISOLATION", 1)
+        assert not exchange_state_cache.is_applied("BitunixFutures:BTCUSDT", "CROSS", 1)
+        assert not exchange_state_cache.is_applied("BitunixFutures:BTCUSDT", "ISOLATION", 2)
+        assert not exchange_state_cache.is_applied("BitunixFutures:ETHUSDT", "ISOLATION", 1)
+
+    def test_expired_entry_ignored(self, monkeypatch):
+        """Test entries older than the TTL no longer match."""
+        exchange_state_cache.record("BitunixFutures:BTCUSDT", "ISOLATION", 1)
+        monkeypatch.setattr(exchange_state_cache, "TTL_SECONDS", 0)
+
+        assert not exchange_state_cache.is_applied("BitunixFutures:BTCUSDT", "ISOLATION", 1)
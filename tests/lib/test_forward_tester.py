@@ -18,25 +18,22 @@ from lib.forward_tester import (
 class TestForwardTester:
     """Test ForwardTester class."""
 
-    def test_initialization(self, tmp_path, monkeypatch):
+    def test_initialization(self, tmp_path):
         """Test ForwardTester initialization."""
-        monkeypatch.chdir(tmp_path)
-
         config = {
             "initial_capital": 10000,
             "fees": 0.001,
             "run_name": "test_run"
         }
 
-        tester = ForwardTester(config)
+        tester = ForwardTester(config, output_dir=tmp_path)
 
         assert tester.current_capital == 10000
         assert tester.fees == 0.001
 
     @patch("lib.forward_tester._fetch_market_price")
-    def test_place_buy_order(self, mock_price, tmp_path, monkeypatch):
+    def test_place_buy_order(self, mock_price, tmp_path):
         """Test placing a buy order."""
-        monkeypatch.chdir(tmp_path)
         mock_price.return_value = 50000.0
 
         config = {
@@ -45,7 +42,7 @@ class TestForwardTester:
             "run_name": "test_run"
         }
 
-        tester = ForwardTester(config)
+        tester = ForwardTester(config, output_dir=tmp_path)
         result = tester.place_order(
             symbol="BTCUSDT",
             qty=0.1,
@@ -57,6 +54,32 @@ class TestForwardTester:
         assert "orderId" in result
         assert tester._current_position is not None
 
+    @patch("lib.forward_tester._fetch_market_price")
+    def test_mark_price_skips_quote(self, mock_price, tmp_path):
+        """Test orders filled at a supplied mark price don't fetch a quote."""
+        config = {
+            "initial_capital": 10000,
+            "fees": 0.001,
+            "run_name": "test_run"
+        }
+
+        tester = ForwardTester(config, output_dir=tmp_path)
+        tester.place_order(
+            symbol="BTCUSDT",
+            qty=0.1,
+            side="BUY",
+            trade_side="OPEN",
+            order_type="MARKET",
+            mark_price=50000.0
+        )
+        assert tester._current_position["entry_price"] == 50000.0
+
+        tester.flash_close_position("SIMULATED", mark_price=52000.0)
+
+        mock_price.assert_not_called()
+        assert tester._current_position is None
+        assert tester.current_capital == pytest.approx(10000 - 5.0 + 200.0 - 5.2)
+
 
 class TestCalculations:
     """Test calculation functions."""
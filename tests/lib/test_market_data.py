@@ -3,6 +3,7 @@ Tests for lib/market_data.py - Market data fetching module
 """
 
 import pytest
+import responses
 from unittest.mock import patch, Mock
 import requests
 
@@ -18,9 +19,28 @@ from lib.market_data import (
     get_fear_greed_index,
     get_enhanced_market_context,
     MarketDataError,
+    clear_market_data_cache,
 )
 
 
+@pytest.fixture(autouse=True)
+def fresh_market_data_cache():
+    """Keep cached fetches from leaking between tests."""
+    clear_market_data_cache()
+    yield
+    clear_market_data_cache()
+
+
+@pytest.fixture(scope="module", autouse=True)
+def market_api(mock_coingecko_response, mock_coinbase_price_response):
+    """Serve canned public API responses for the whole module."""
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as rsps:
+        rsps.add(responses.GET, "https://api.coingecko.com/api/v3/coins/bitcoin", json=mock_coingecko_response)
+        rsps.add(responses.GET, "https://api.exchange.coinbase.com/products/BTC-USD/stats",
+                 json=mock_coinbase_price_response)
+        yield rsps
+
+
 class TestMarketData:
     """Test MarketData dataclass."""
 
@@ -59,12 +79,8 @@ class TestSymbolNormalization:
 class TestCoinGeckoData:
     """Test CoinGecko data fetching."""
 
-    @patch("requests.get")
-    def test_get_coingecko_data_success(self, mock_get, mock_coingecko_response):
+    def test_get_coingecko_data_success(self):
         """Test successful CoinGecko data fetch."""
-        mock_get.return_value.status_code = 200
-        mock_get.return_value.json.return_value = mock_coingecko_response
-
         data = get_coingecko_data("BTC")
 
         assert data is not None
@@ -84,12 +100,8 @@ class TestCoinGeckoData:
 class TestCoinbasePrice:
     """Test Coinbase price fetching."""
 
-    @patch("requests.get")
-    def test_get_coinbase_price_success(self, mock_get, mock_coinbase_price_response):
+    def test_get_coinbase_price_success(self):
         """Test successful Coinbase price fetch."""
-        mock_get.return_value.status_code = 200
-        mock_get.return_value.json.return_value = mock_coinbase_price_response
-
         data = get_coinbase_price("BTC")
 
         assert data is not None
@@ -127,3 +139,46 @@ class TestGetMarketData:
 
         with pytest.raises(MarketDataError):
             get_market_data("BTC", source="auto")
+
+    @patch("lib.market_data.get_coinbase_price")
+    def test_get_market_data_cached(self, mock_coinbase):
+        """Test repeated fetches for a symbol reuse the cached result."""
+        mock_coinbase.return_value = MarketData(
+            symbol="BTC",
+            price=50000.0,
+            price_change_24h=1000.0,
+            price_change_24h_percent=2.0,
+            high_24h=51000.0,
+            low_24h=49000.0,
+            volume_24h=1000000000.0
+        )
+
+        first = get_market_data("BTCUSDT")
+        second = get_market_data("BTC")
+
+        assert second is first
+        assert mock_coinbase.call_count == 1
+
+        clear_market_data_cache()
+        get_market_data("BTCUSDT")
+
+        assert mock_coinbase.call_count == 2
+
+
+class TestFearGreedIndex:
+    """Test Fear & Greed Index fetching."""
+
+    @patch("lib.market_data.requests.get")
+    def test_fear_greed_index_cached(self, mock_get):
+        """Test the index is fetched once and shared across calls."""
+        mock_get.return_value = Mock(
+            status_code=200,
+            json=Mock(return_value={"data": [{"value": "72", "value_classification": "Greed"}]})
+        )
+
+        first = get_fear_greed_index()
+        second = get_fear_greed_index()
+
+        assert first == second
+        assert first["value"] == 72
+        assert mock_get.call_count == 1
@@ -4,7 +4,6 @@ Tests for lib/performance_tracker.py - Performance metrics tracking
 
 import pytest
 from pathlib import Path
-from datetime import datetime, timezone
 
 from lib.performance_tracker import (
     PerformanceTracker,
@@ -13,6 +12,10 @@ from lib.performance_tracker import (
     get_tracker,
 )
 
+# Fixed timestamps keep recorded trades deterministic
+ENTRY_TIME = "2024-01-01T00:00:00+00:00"
+EXIT_TIME = "2024-01-01T04:00:00+00:00"
+
 
 class TestPerformanceTracker:
     """Test PerformanceTracker class."""
@@ -35,8 +38,8 @@ class TestPerformanceTracker:
             entry_price=50000,
             exit_price=52000,
             quantity=0.1,
-            entry_time=datetime.now(timezone.utc).isoformat(),
-            exit_time=datetime.now(timezone.utc).isoformat(),
+            entry_time=ENTRY_TIME,
+            exit_time=EXIT_TIME,
             pnl=200,
             pnl_percent=4.0
         )
@@ -75,3 +78,86 @@ class TestPerformanceTracker:
         assert metrics.winning_trades == 1
         assert metrics.losing_trades == 1
         assert metrics.win_rate == 50.0
+
+    def test_get_metrics_drawdown_and_streaks(self, temp_performance_dir):
+        """Test drawdown, streak and duration metrics over a trade sequence."""
+        tracker = PerformanceTracker("test_strategy")
+
+        for pnl in (100.0, 50.0, -80.0, -40.0, 0.0, -10.0, 30.0):
+            tracker.record_trade(Trade(
+                trade_id=f"t_{len(tracker.trades)}",
+                symbol="BTCUSDT",
+                side="buy",
+                entry_price=100.0,
+                exit_price=100.0,
+                quantity=1.0,
+                entry_time="2024-01-01T00:00:00+00:00",
+                exit_time="2024-01-01T02:00:00Z",
+                pnl=pnl,
+                pnl_percent=pnl / 100
+            ))
+
+        metrics = tracker.get_metrics()
+
+        assert metrics.total_trades == 7
+        assert metrics.winning_trades == 3
+        assert metrics.losing_trades == 3
+        assert metrics.total_pnl == pytest.approx(50.0)
+        assert metrics.largest_win == 100.0
+        assert metrics.largest_loss == -80.0
+        assert metrics.average_loss == pytest.approx(-130.0 / 3)
+        assert metrics.profit_factor == pytest.approx(180.0 / 130.0)
+        assert metrics.max_drawdown == pytest.approx(130.0)
+        assert metrics.current_streak == 1
+        assert metrics.best_streak == 2
+        assert metrics.worst_streak == -3
+        assert metrics.avg_trade_duration_hours == pytest.approx(2.0)
+
+    def test_export_to_csv(self, temp_performance_dir):
+        """Test exporting trades to CSV."""
+        import csv
+
+        tracker = PerformanceTracker("test_strategy")
+        tracker.create_trade("BTCUSDT", "buy", 50000, 52000, 0.1, notes="first")
+        tracker.create_trade("ETHUSDT", "sell", 3000, 2900, 1.0)
+
+        filepath = tracker.export_to_csv(str(temp_performance_dir / "export.csv"))
+
+        with open(filepath, newline='') as f:
+            rows = list(csv.DictReader(f))
+
+        assert len(rows) == 2
+        assert rows[0]["symbol"] == "BTCUSDT"
+        assert rows[0]["notes"] == "first"
+        assert rows[1]["side"] == "sell"
+        assert float(rows[1]["pnl"]) == pytest.approx(100.0)
+
+    def test_print_summary_cached_until_trades_change(self, temp_performance_dir, capsys):
+        """Test the summary is reused until a new trade is recorded."""
+        tracker = PerformanceTracker("test_strategy")
+        tracker.create_trade("BTCUSDT", "buy", 50000, 52000, 0.1)
+
+        first = tracker.print_summary()
+        assert tracker.print_summary() is first
+        assert "Total Trades:      1" in first
+
+        tracker.create_trade("BTCUSDT", "buy", 51000, 50000, 0.1)
+        second = tracker.print_summary()
+
+        assert second is not first
+        assert "Total Trades:      2" in second
+        assert "(1W / 1L)" in second
+
+    def test_get_trades_by_symbol(self, temp_performance_dir):
+        """Test filtering trades by symbol, including reloaded history."""
+        tracker = PerformanceTracker("test_strategy")
+        tracker.create_trade("BTCUSDT", "buy", 50000, 52000, 0.1)
+        tracker.create_trade("ETHUSDT", "buy", 3000, 3100, 1.0)
+        tracker.create_trade("BTCUSDT", "sell", 52000, 51000, 0.1)
+
+        assert [t.side for t in tracker.get_trades_by_symbol("BTCUSDT")] == ["buy", "sell"]
+        assert tracker.get_trades_by_symbol("SOLUSDT") == []
+
+        reloaded = PerformanceTracker("test_strategy")
+        assert len(reloaded.get_trades_by_symbol("BTCUSDT")) == 2
+        assert len(reloaded.get_trades_by_symbol("ETHUSDT")) == 1
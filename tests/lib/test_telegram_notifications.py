@@ -3,9 +3,27 @@ Tests for lib/telegram_notifications.py - Telegram notification service
 """
 
 import pytest
+import responses
 from unittest.mock import patch, Mock
 
-from lib.telegram_notifications import TelegramNotifier
+from lib.telegram_notifications import TelegramNotifier, TokenBucket, create_session
+
+API_URL = "https://api.telegram.org/bottest_token"
+
+
+@pytest.fixture(scope="module", autouse=True)
+def telegram_api(mock_telegram_response):
+    """Serve canned Bot API responses for the whole module."""
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as rsps:
+        rsps.add(responses.POST, f"{API_URL}/sendMessage", json=mock_telegram_response)
+        rsps.add(responses.GET, f"{API_URL}/getMe", json={"ok": True, "result": {"username": "TestBot"}})
+        yield rsps
+
+
+@pytest.fixture(autouse=True)
+def fresh_rate_limits(monkeypatch):
+    """Give each test its own per-chat rate limiters."""
+    monkeypatch.setattr("lib.telegram_notifications._chat_buckets", {})
 
 
 class TestTelegramNotifier:
@@ -23,12 +41,8 @@ class TestTelegramNotifier:
         with pytest.raises(ValueError):
             TelegramNotifier("your_telegram_bot_token_here", "123")
 
-    @patch("requests.post")
-    def test_send_notification(self, mock_post, mock_telegram_response):
+    def test_send_notification(self):
         """Test sending a notification."""
-        mock_post.return_value.status_code = 200
-        mock_post.return_value.json.return_value = mock_telegram_response
-
         notifier = TelegramNotifier("test_token", "123456789")
         result = notifier.send_notification(
             symbol="BTCUSDT",
@@ -38,12 +52,8 @@ class TestTelegramNotifier:
 
         assert result is True
 
-    @patch("requests.post")
-    def test_send_trade_opened(self, mock_post, mock_telegram_response):
+    def test_send_trade_opened(self):
         """Test sending trade opened notification."""
-        mock_post.return_value.status_code = 200
-        mock_post.return_value.json.return_value = mock_telegram_response
-
         notifier = TelegramNotifier("test_token", "123456789")
         result = notifier.send_trade_opened(
             symbol="BTCUSDT",
@@ -55,16 +65,64 @@ class TestTelegramNotifier:
 
         assert result is True
 
-    @patch("requests.get")
-    def test_test_connection(self, mock_get):
+    def test_test_connection(self):
         """Test connection testing."""
-        mock_get.return_value.status_code = 200
-        mock_get.return_value.json.return_value = {
-            "ok": True,
-            "result": {"username": "TestBot"}
-        }
-
         notifier = TelegramNotifier("test_token", "123456789")
         result = notifier.test_connection()
 
         assert result is True
+
+    def test_send_through_session(self, mock_telegram_response):
+        """Test messages are posted through the notifier's session."""
+        session = create_session()
+        session.post = Mock()
+        session.post.return_value.status_code = 200
+        session.post.return_value.json.return_value = mock_telegram_response
+
+        notifier = TelegramNotifier("test_token", "123456789", session=session)
+        result = notifier.send_error("test_run", "Something broke")
+
+        assert result is True
+        session.post.assert_called_once()
+
+    def test_duplicate_message_suppressed(self, telegram_api):
+        """Test a repeated dedup key within the window is not resent."""
+        telegram_api.calls.reset()
+
+        notifier = TelegramNotifier("test_token", "123456789")
+        first = notifier.send_message_raw("Same alert", dedup_key="alert-1")
+        second = notifier.send_message_raw("Same alert", dedup_key="alert-1")
+        notifier.send_message_raw("Same alert", dedup_key="alert-2")
+
+        assert first["message_id"] == "12345"
+        assert second == {"success": True, "message_id": None, "duplicate": True}
+        assert len(telegram_api.calls) == 2
+
+    def test_identical_messages_sent_without_dedup_key(self, telegram_api):
+        """Test identical text is always sent when no dedup key is given."""
+        telegram_api.calls.reset()
+
+        notifier = TelegramNotifier("test_token", "123456789")
+        first = notifier.send_message_raw("Same alert")
+        second = notifier.send_message_raw("Same alert")
+
+        assert first["message_id"] == "12345"
+        assert second["message_id"] == "12345"
+        assert len(telegram_api.calls) == 2
+
+
+class TestTokenBucket:
+    """Test the Telegram rate limiter."""
+
+    @patch("lib.telegram_notifications.time.sleep")
+    def test_waits_once_burst_is_spent(self, mock_sleep):
+        """Test acquiring beyond capacity sleeps for the refill time."""
+        bucket = TokenBucket(rate=1, capacity=2)
+
+        bucket.acquire()
+        bucket.acquire()
+        mock_sleep.assert_not_called()
+
+        bucket.acquire()
+        mock_sleep.assert_called_once()
+        assert mock_sleep.call_args[0][0] == pytest.approx(1.0, abs=0.05)
@@ -0,0 +1,42 @@
+"""
+Tests for runner_multi.py - Multi-symbol trading runner
+"""
+
+import pytest
+from unittest.mock import Mock
+
+import runner_multi
+
+
+class FakeBitunix:
+    """Stand-in exchange recording margin calls."""
+
+    def __init__(self):
+        self.set_margin_mode = Mock()
+        self.set_leverage = Mock()
+        self.get_pending_positions = Mock(return_value=None)
+
+
+class FakeForwardTester(FakeBitunix):
+    """A second exchange type."""
+
+
+@pytest.fixture(autouse=True)
+def fresh_configured_symbols(monkeypatch):
+    """Keep applied margin settings from leaking between tests."""
+    monkeypatch.setattr(runner_multi, "_configured_symbols", {})
+
+
+class TestMarginSettings:
+    """Test margin mode/leverage are applied once per exchange and symbol."""
+
+    def test_applied_again_after_exchange_changes(self, sample_symbol_config):
+        """Test switching exchanges between ticks re-applies the settings."""
+        first, second = FakeForwardTester(), FakeBitunix()
+
+        for exchange in (first, first, second):
+            runner_multi.execute_trading_logic(exchange, False, sample_symbol_config, "Neutral")
+
+        first.set_leverage.assert_called_once_with("BTCUSDT", 1)
+        second.set_leverage.assert_called_once_with("BTCUSDT", 1)
+        second.set_margin_mode.assert_called_once_with("BTCUSDT", "ISOLATION")